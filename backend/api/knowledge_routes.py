@@ -321,6 +321,12 @@ def graph_stats():
     return knowledge_graph.stats()
 
 
+@router.get("/graph/most-connected")
+def most_connected(entity_type: Optional[str] = None, limit: int = 10):
+    """Entities ranked by total relation weight, optionally of one type."""
+    return knowledge_graph.get_most_connected(entity_type, limit)
+
+
 @router.get("/graph/meeting/{meeting_id}")
 def meeting_graph(meeting_id: str):
     """Subgraph of entities referenced in a specific meeting."""
@@ -3,13 +3,15 @@ FastAPI REST routes for LIME Phase 2.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
 from typing import Optional
 from pathlib import Path
+import orjson
 from datetime import datetime, timezone
-import json
+import asyncio
 import logging
 import threading
 import uuid
@@ -165,6 +167,13 @@ def list_meetings(
         .limit(limit)
         .all()
     )
+    # One grouped count instead of loading every meeting's segments
+    segment_counts = dict(
+        db.query(TranscriptSegment.meeting_id, func.count(TranscriptSegment.id))
+        .filter(TranscriptSegment.meeting_id.in_([m.id for m in meetings]))
+        .group_by(TranscriptSegment.meeting_id)
+        .all()
+    )
     results = []
     for m in meetings:
         results.append(MeetingSummary(
@@ -175,7 +184,7 @@ def list_meetings(
             started_at=m.started_at.isoformat(),
             ended_at=m.ended_at.isoformat() if m.ended_at else None,
             duration_seconds=m.duration_seconds,
-            segment_count=len(m.segments),
+            segment_count=segment_counts.get(m.id, 0),
         ))
     return results
 
@@ -194,7 +203,11 @@ def get_meeting(meeting_id: str, db: Session = Depends(get_db_session)):
         started_at=m.started_at.isoformat(),
         ended_at=m.ended_at.isoformat() if m.ended_at else None,
         duration_seconds=m.duration_seconds,
-        segment_count=len(m.segments),
+        segment_count=(
+            db.query(func.count(TranscriptSegment.id))
+            .filter(TranscriptSegment.meeting_id == m.id)
+            .scalar()
+        ),
     )
 
 
@@ -324,8 +337,14 @@ def get_meeting_notes(meeting_id: str, db: Session = Depends(get_db_session)):
     if not meeting:
         raise HTTPException(404, "Meeting not found")
 
+    # All three collections are rendered: one IN query each instead of lazy loads
     analysis = (
         db.query(MeetingAnalysis)
+        .options(
+            selectinload(MeetingAnalysis.action_items),
+            selectinload(MeetingAnalysis.decisions),
+            selectinload(MeetingAnalysis.topics),
+        )
         .filter(MeetingAnalysis.meeting_id == meeting_id)
         .first()
     )
@@ -355,8 +374,8 @@ def get_meeting_notes(meeting_id: str, db: Session = Depends(get_db_session)):
         participants = None
         if d.participants:
             try:
-                participants = json.loads(d.participants)
-            except (json.JSONDecodeError, TypeError):
+                participants = orjson.loads(d.participants)
+            except (orjson.JSONDecodeError, TypeError):
                 participants = [d.participants]
         decisions.append(DecisionOut(
             id=d.id,
@@ -375,8 +394,8 @@ def get_meeting_notes(meeting_id: str, db: Session = Depends(get_db_session)):
         related = None
         if t.related_segment_ids:
             try:
-                related = json.loads(t.related_segment_ids)
-            except (json.JSONDecodeError, TypeError):
+                related = orjson.loads(t.related_segment_ids)
+            except (orjson.JSONDecodeError, TypeError):
                 related = None
         topics.append(TopicSegmentOut(
             id=t.id,
@@ -394,16 +413,16 @@ def get_meeting_notes(meeting_id: str, db: Session = Depends(get_db_session)):
     connections = None
     if analysis.connections_data:
         try:
-            conn_data = json.loads(analysis.connections_data)
+            conn_data = orjson.loads(analysis.connections_data)
             connections = ConnectionsOut(**conn_data)
-        except (json.JSONDecodeError, TypeError, ValueError):
+        except (orjson.JSONDecodeError, TypeError, ValueError):
             connections = None
 
     # Parse insights
     insights = []
     if analysis.insights_data:
         try:
-            insights_raw = json.loads(analysis.insights_data)
+            insights_raw = orjson.loads(analysis.insights_data)
             for ins in insights_raw:
                 insights.append(InsightOut(
                     type=ins.get("type", "general"),
@@ -415,7 +434,7 @@ def get_meeting_notes(meeting_id: str, db: Session = Depends(get_db_session)):
                     confidence=ins.get("confidence", 0.5),
                     below_threshold=ins.get("confidence", 0.5) < threshold,
                 ))
-        except (json.JSONDecodeError, TypeError):
+        except (orjson.JSONDecodeError, TypeError):
             insights = []
 
     return MeetingNotesOut(
@@ -453,6 +472,9 @@ def edit_meeting_notes(
 
     from backend.learning.memory import memory as mem_store
 
+    # Deletion signals are recorded together once all edits are applied
+    deleted: list[str] = []
+
     # Track specific field changes
     if req.executive_summary is not None:
         old_value = analysis.executive_summary
@@ -502,10 +524,7 @@ def edit_meeting_notes(
                     original_value=action.description,
                 ))
                 db.delete(action)
-                mem_store.record_content_deletion(
-                    f"Action item: {action.description[:60]}",
-                    meeting_id=meeting_id,
-                )
+                deleted.append(f"Action item: {action.description[:60]}")
 
     if req.decisions is not None:
         for dec_edit in req.decisions:
@@ -538,11 +557,9 @@ def edit_meeting_notes(
                     original_value=decision.description,
                 ))
                 db.delete(decision)
-                mem_store.record_content_deletion(
-                    f"Decision: {decision.description[:60]}",
-                    meeting_id=meeting_id,
-                )
+                deleted.append(f"Decision: {decision.description[:60]}")
 
+    mem_store.record_content_deletions(deleted, meeting_id=meeting_id)
     mem_store.record_content_edit(
         f"User edited meeting notes for meeting {meeting_id[:8]}",
         meeting_id=meeting_id,
@@ -617,6 +634,29 @@ def generate_meeting_briefing(
     return {"meeting_id": meeting_id, "briefing": briefing}
 
 
+@router.post("/meetings/{meeting_id}/briefing/stream")
+def stream_meeting_briefing(
+    meeting_id: str,
+    req: BriefingRequest,
+):
+    """
+    Stream a pre-meeting briefing as newline-delimited JSON.
+    Each briefing item is sent as soon as it is generated; the last line
+    carries the complete briefing.
+    """
+    from backend.intelligence.briefing import stream_briefing
+
+    def _lines():
+        for event in stream_briefing(
+            participants=req.participants,
+            purpose=req.purpose,
+            meeting_id=meeting_id,
+        ):
+            yield orjson.dumps({"meeting_id": meeting_id, **event}) + b"\n"
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+
 # ── Semantic Search Endpoint ──────────────────────────────────────────────────
 
 class SearchRequest(BaseModel):
@@ -702,10 +742,11 @@ def update_memory(tier: str, req: MemoryUpdateRequest):
 
 
 @router.post("/memory/consolidate")
-def trigger_consolidation():
+async def trigger_consolidation():
     """Manually trigger memory consolidation (bypasses idle/schedule checks)."""
     from backend.learning.scheduler import scheduler
-    stats = scheduler.force_run()
+    # The pass runs on the consolidation worker; only the response waits for it
+    stats = await asyncio.wrap_future(scheduler.force_run())
     return {"status": "complete", **stats}
 
 
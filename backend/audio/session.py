@@ -44,7 +44,8 @@ class MeetingSession:
         self._full_audio: list[np.ndarray] = []
 
         # Pipeline queues
-        self._raw_queue: queue.Queue = queue.Queue()
+        self._raw_queue: queue.Queue = queue.Queue(maxsize=VADFilter.INPUT_QUEUE_MAXSIZE)
+        self._dropped_blocks = 0
         self._vad_queue: queue.Queue = queue.Queue()
         self._chunk_queue: queue.Queue = queue.Queue()
 
@@ -135,7 +136,17 @@ class MeetingSession:
     def _on_raw_audio(self, audio: np.ndarray, timestamp: float):
         """Direct callback from AudioCapture — feeds VAD."""
         self._full_audio.append(audio)
-        self._raw_queue.put((audio, timestamp))
+        # Runs on the audio callback thread: never block. If VAD falls behind,
+        # drop live blocks rather than grow the queue without bound (the raw
+        # recording is unaffected).
+        try:
+            self._raw_queue.put_nowait((audio, timestamp))
+        except queue.Full:
+            self._dropped_blocks += 1
+            if self._dropped_blocks % 100 == 1:
+                logger.warning(
+                    f"VAD queue full — dropped {self._dropped_blocks} audio blocks so far"
+                )
 
     def _on_transcript_result(self, result: TranscriptResult):
         """Called by TranscriptionEngine for each completed segment."""
@@ -52,6 +52,7 @@ class VADFilter:
     MIN_SPEECH_DURATION_MS = 250   # Ignore speech bursts shorter than this
     MIN_SILENCE_DURATION_MS = 300  # Silence needed to end a speech segment
     WINDOW_SIZE_SAMPLES = 512      # Silero VAD window (must be 256, 512, or 1024 @ 16kHz)
+    INPUT_QUEUE_MAXSIZE = 1000     # ~30s of 32ms capture blocks before producers drop audio
 
     def __init__(self, input_queue: queue.Queue, output_queue: queue.Queue):
         self.input_queue = input_queue
@@ -78,6 +79,12 @@ class VADFilter:
 
     def stop(self):
         self._running = False
+        # Wake the blocking get() in _process_loop. If the queue is full the
+        # loop is already awake and will see _running on its next item.
+        try:
+            self.input_queue.put_nowait(None)
+        except queue.Full:
+            pass
         if self._thread:
             self._thread.join(timeout=2.0)
         # Flush remaining buffer
@@ -88,30 +95,35 @@ class VADFilter:
         logger.info("VAD filter stopped.")
 
     def _process_loop(self):
+        import torch
+
+        # Bind everything the per-window loop touches to locals once
         sample_rate = settings.sample_rate
+        window_size = self.WINDOW_SIZE_SAMPLES
+        speech_threshold = self.SPEECH_THRESHOLD
+        model = self._model
         silence_threshold_frames = int(
-            self.MIN_SILENCE_DURATION_MS / 1000 * sample_rate / self.WINDOW_SIZE_SAMPLES
+            self.MIN_SILENCE_DURATION_MS / 1000 * sample_rate / window_size
         )
 
         while self._running:
-            try:
-                audio_chunk, timestamp = self.input_queue.get(timeout=0.5)
-            except queue.Empty:
-                continue
+            item = self.input_queue.get()
+            if item is None:  # Stop sentinel
+                break
+            audio_chunk, timestamp = item
 
             # Process in windows of WINDOW_SIZE_SAMPLES
-            for i in range(0, len(audio_chunk), self.WINDOW_SIZE_SAMPLES):
-                window = audio_chunk[i: i + self.WINDOW_SIZE_SAMPLES]
-                if len(window) < self.WINDOW_SIZE_SAMPLES:
+            for i in range(0, len(audio_chunk), window_size):
+                window = audio_chunk[i: i + window_size]
+                if len(window) < window_size:
                     # Pad last window
-                    window = np.pad(window, (0, self.WINDOW_SIZE_SAMPLES - len(window)))
+                    window = np.pad(window, (0, window_size - len(window)))
 
-                import torch
                 tensor = torch.from_numpy(window).float()
                 with torch.no_grad():
-                    prob = self._model(tensor, sample_rate).item()
+                    prob = model(tensor, sample_rate).item()
 
-                is_speech = prob >= self.SPEECH_THRESHOLD
+                is_speech = prob >= speech_threshold
 
                 if is_speech:
                     self._speech_buffer.append(window)
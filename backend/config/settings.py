@@ -22,6 +22,7 @@ class Settings(BaseSettings):
 
     # Diarization
     huggingface_token: Optional[str] = None
+    diarization_device: Literal["auto", "cpu", "cuda", "mps"] = "auto"
 
     # Database
     database_url: str = f"sqlite:///{BASE_DIR}/data/db/lime.db"
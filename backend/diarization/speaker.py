@@ -6,7 +6,6 @@ Speaker diarization using pyannote-audio 3.1.
 - Progressively learns speaker identities over time
 """
 
-import json
 import logging
 import tempfile
 import threading
@@ -15,6 +14,7 @@ from pathlib import Path
 from typing import Optional
 
 import numpy as np
+import orjson
 import scipy.io.wavfile as wav
 
 from backend.config.settings import settings
@@ -41,6 +41,20 @@ class SpeakerProfile:
     meeting_ids: list[str] = field(default_factory=list)
 
 
+def _resolve_device():
+    """Pick the torch device for diarization from settings ("auto" prefers CUDA, then MPS)."""
+    import torch
+    choice = settings.diarization_device
+    if choice == "auto":
+        if torch.cuda.is_available():
+            choice = "cuda"
+        elif torch.backends.mps.is_available():
+            choice = "mps"
+        else:
+            choice = "cpu"
+    return torch.device(choice)
+
+
 def _load_pipeline():
     global _pipeline
     with _pipeline_lock:
@@ -60,7 +74,10 @@ def _load_pipeline():
                     "pyannote/speaker-diarization-3.1",
                     use_auth_token=settings.huggingface_token,
                 )
-                logger.info("Diarization pipeline loaded.")
+                device = _resolve_device()
+                if device.type != "cpu":
+                    _pipeline.to(device)
+                logger.info(f"Diarization pipeline loaded on {device.type}.")
             except Exception as e:
                 logger.error(f"Failed to load diarization pipeline: {e}", exc_info=True)
                 return None
@@ -71,6 +88,7 @@ class SpeakerDiarizer:
     def __init__(self):
         self._pipeline = None
         self._profiles: dict[str, SpeakerProfile] = {}
+        self._dirty = False
         self._load_profiles()
 
     def ensure_loaded(self):
@@ -112,9 +130,11 @@ class SpeakerDiarizer:
                     end=turn.end,
                 ))
 
-            # Register any new speakers encountered
+            # Register any new speakers encountered, then persist once
             for seg in segments:
                 self._register_speaker(seg.speaker_label, meeting_id)
+            if self._dirty:
+                self._save_profiles()
 
             return segments
 
@@ -144,15 +164,15 @@ class SpeakerDiarizer:
                 label=label,
                 display_name=f"Speaker {index}",
             )
+            self._dirty = True
         if meeting_id not in self._profiles[label].meeting_ids:
             self._profiles[label].meeting_ids.append(meeting_id)
-        self._save_profiles()
+            self._dirty = True
 
     def _load_profiles(self):
         if VOICE_PROFILES_FILE.exists():
             try:
-                with open(VOICE_PROFILES_FILE, "r") as f:
-                    data = json.load(f)
+                data = orjson.loads(VOICE_PROFILES_FILE.read_bytes())
                 self._profiles = {
                     k: SpeakerProfile(**v) for k, v in data.items()
                 }
@@ -162,10 +182,6 @@ class SpeakerDiarizer:
 
     def _save_profiles(self):
         VOICE_PROFILES_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(VOICE_PROFILES_FILE, "w") as f:
-            json.dump(
-                {k: {"label": v.label, "display_name": v.display_name, "meeting_ids": v.meeting_ids}
-                 for k, v in self._profiles.items()},
-                f,
-                indent=2,
-            )
+        # orjson serializes the SpeakerProfile dataclasses natively
+        VOICE_PROFILES_FILE.write_bytes(orjson.dumps(self._profiles))
+        self._dirty = False
@@ -2,7 +2,8 @@ from backend.intelligence.llm import llm_client, LLMClient, LLMError
 from backend.intelligence.pipeline import pipeline, PostMeetingPipeline, PipelineError
 from backend.intelligence.connections import detect_connections
 from backend.intelligence.insights import generate_insights
-from backend.intelligence.briefing import generate_briefing
+from backend.intelligence.combined import analyze_meeting
+from backend.intelligence.briefing import generate_briefing, stream_briefing
 
 __all__ = [
     "llm_client",
@@ -13,5 +14,7 @@ __all__ = [
     "PipelineError",
     "detect_connections",
     "generate_insights",
+    "analyze_meeting",
     "generate_briefing",
+    "stream_briefing",
 ]
@@ -12,12 +12,17 @@ searches the knowledge base for relevant history:
 Generates a structured briefing document.
 """
 
-import json
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
 
 from backend.config.settings import settings
 from backend.intelligence.llm import llm_client
+from backend.intelligence.parsing import parse_json
+from backend.intelligence.streaming import StreamingJSONParser, iter_array_items
 from backend.storage.vector_store import vector_store
 from backend.storage.database import get_db
 from backend.models.meeting import (
@@ -25,74 +30,79 @@ from backend.models.meeting import (
 )
 from backend.models.knowledge import Person, Project, Topic, PersonMeeting, ProjectMeeting
 from backend.knowledge.graph import knowledge_graph as kg
-from backend.knowledge.entities import find_person_by_name, find_project_by_name
+from backend.knowledge.entities import find_project_by_name
 
 logger = logging.getLogger(__name__)
 
-BRIEFING_PROMPT = """You are LIME's pre-meeting briefing engine. Prepare a concise, actionable briefing for the user.
-
-<meeting_context>
-Participants: {participants}
-Topic/Purpose: {purpose}
-</meeting_context>
-
-<past_meetings_with_these_people>
-{past_meetings}
-</past_meetings_with_these_people>
-
-<open_action_items>
-{open_actions}
-</open_action_items>
-
-<related_project_info>
-{project_info}
-</related_project_info>
-
-<relevant_decisions>
-{decisions}
-</relevant_decisions>
-
-<semantically_related_content>
-{related_content}
-</semantically_related_content>
+# Static instructions go first so providers can cache the prefix across calls;
+# only BRIEFING_PROMPT below varies per briefing.
+BRIEFING_INSTRUCTIONS = """You are LIME's pre-meeting briefing engine. Prepare a concise, actionable briefing for the user.
 
+You will be given the meeting context and everything the knowledge base knows about it.
 Generate a pre-meeting briefing. Return a JSON object with this exact structure:
-{{
+{
   "briefing_summary": "2-3 sentence overview of what the user should know going in",
   "key_context": [
-    {{
+    {
       "title": "Brief title",
       "detail": "Important context the user might have forgotten",
       "source": "Where this information came from (past meeting date, etc.)",
       "priority": "high|medium|low"
-    }}
+    }
   ],
   "open_threads": [
-    {{
+    {
       "description": "An unresolved thread or follow-up relevant to this meeting",
       "from_meeting": "When/where this thread originated",
       "suggested_action": "What the user might want to bring up or follow up on"
-    }}
+    }
   ],
   "action_items_to_follow_up": [
-    {{
+    {
       "description": "Action item that should be checked on",
       "owner": "Who owns it",
       "from_meeting": "When it was assigned"
-    }}
+    }
   ],
   "suggested_questions": [
     "Questions the user might want to ask during this meeting"
   ],
   "confidence": 0.0
-}}
+}
 
 Rules:
 - Focus on actionable intelligence, not generic advice
 - Priority should reflect how important it is for the user to know before the meeting
 - Only include items with clear relevance to this meeting's participants and purpose
 - If there's very little context available, say so honestly and keep the briefing short
-- Set confidence based on how much relevant context was available (low if sparse, high if rich)"""
+- Set confidence based on how much relevant context was available (low if sparse, high if rich)
+
+"""
+
+BRIEFING_PROMPT = """<meeting_context>
+Participants: {participants}
+Topic/Purpose: {purpose}
+</meeting_context>
+
+<past_meetings_with_these_people>
+{past_meetings}
+</past_meetings_with_these_people>
+
+<open_action_items>
+{open_actions}
+</open_action_items>
+
+<related_project_info>
+{project_info}
+</related_project_info>
+
+<relevant_decisions>
+{decisions}
+</relevant_decisions>
+
+<semantically_related_content>
+{related_content}
+</semantically_related_content>"""
 
 SYSTEM_PROMPT = """You are LIME's pre-meeting briefing engine. You help the user walk into meetings prepared by surfacing relevant history, open threads, and things they might have forgotten.
 Be concise and actionable. Return valid JSON only."""
@@ -113,14 +123,76 @@ def generate_briefing(
         f"purpose: {purpose[:60]}"
     )
 
-    # Gather context
-    past_meetings = _get_past_meetings_with_people(participants)
-    open_actions = _get_open_action_items(participants)
-    project_info = _get_related_projects(participants, purpose)
-    decisions = _get_relevant_decisions(participants, purpose)
-    related_content = _get_semantically_related(participants, purpose)
+    prompt = _build_prompt(participants, purpose)
+
+    try:
+        raw = llm_client.generate(prompt, SYSTEM_PROMPT, cache_prefix=BRIEFING_INSTRUCTIONS)
+        result = parse_json(raw)
+    except Exception as e:
+        logger.error(f"Briefing generation failed: {e}")
+        result = _empty_briefing()
+
+    logger.info(
+        f"Briefing generated: {len(result.get('key_context', []))} context items, "
+        f"{len(result.get('open_threads', []))} open threads"
+    )
+    return result
+
+
+def stream_briefing(
+    participants: list[str],
+    purpose: str = "",
+    meeting_id: Optional[str] = None,
+) -> Iterator[dict]:
+    """
+    Streaming variant of generate_briefing.
+
+    Yields {"type": "item", "section": ..., "item": ...} for each entry of the
+    briefing's lists (key_context, open_threads, ...) as soon as the LLM has
+    finished writing it, then a final {"type": "briefing", "briefing": ...}
+    with the complete result.
+    """
+    logger.info(
+        f"Streaming briefing for meeting with: {', '.join(participants)}, "
+        f"purpose: {purpose[:60]}"
+    )
+
+    prompt = _build_prompt(participants, purpose)
+    parser = StreamingJSONParser()
+
+    try:
+        deltas = llm_client.generate_stream(prompt, SYSTEM_PROMPT, cache_prefix=BRIEFING_INSTRUCTIONS)
+        for section, item in iter_array_items(deltas, parser):
+            yield {"type": "item", "section": section, "item": item}
+        result = parse_json(parser.text)
+    except Exception as e:
+        logger.error(f"Briefing generation failed: {e}")
+        result = _empty_briefing()
+
+    yield {"type": "briefing", "briefing": result}
+
 
-    prompt = BRIEFING_PROMPT.format(
+def _build_prompt(participants: list[str], purpose: str) -> str:
+    """Gather all briefing context and render the per-briefing prompt."""
+    # Resolve participants once; helpers share the plain id mapping
+    with get_db() as db:
+        person_ids = _resolve_participants(db, participants)
+
+    # Gather context concurrently — each DB helper opens its own session
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        past_meetings_f = executor.submit(_get_past_meetings_with_people, person_ids)
+        open_actions_f = executor.submit(_get_open_action_items, participants)
+        project_info_f = executor.submit(_get_related_projects, person_ids, purpose)
+        decisions_f = executor.submit(_get_relevant_decisions, person_ids)
+        related_content_f = executor.submit(_get_semantically_related, participants, purpose)
+
+    past_meetings = past_meetings_f.result()
+    open_actions = open_actions_f.result()
+    project_info = project_info_f.result()
+    decisions = decisions_f.result()
+    related_content = related_content_f.result()
+
+    return BRIEFING_PROMPT.format(
         participants=", ".join(participants),
         purpose=purpose or "Not specified",
         past_meetings=past_meetings or "No past meetings with these participants found",
@@ -130,173 +202,201 @@ def generate_briefing(
         related_content=related_content or "No related content found",
     )
 
-    try:
-        raw = llm_client.generate(prompt, SYSTEM_PROMPT)
-        result = _parse_json(raw)
-    except Exception as e:
-        logger.error(f"Briefing generation failed: {e}")
-        result = {
-            "briefing_summary": "Could not generate briefing due to a processing error.",
-            "key_context": [],
-            "open_threads": [],
-            "action_items_to_follow_up": [],
-            "suggested_questions": [],
-            "confidence": 0.0,
-        }
 
-    logger.info(
-        f"Briefing generated: {len(result.get('key_context', []))} context items, "
-        f"{len(result.get('open_threads', []))} open threads"
+def _empty_briefing() -> dict:
+    return {
+        "briefing_summary": "Could not generate briefing due to a processing error.",
+        "key_context": [],
+        "open_threads": [],
+        "action_items_to_follow_up": [],
+        "suggested_questions": [],
+        "confidence": 0.0,
+    }
+
+
+def _resolve_participants(db: Session, participants: list[str]) -> dict[str, str]:
+    """
+    Resolve participant names to Person ids in a single query.
+
+    Returns {name as given: person_id}, preserving participant order and
+    skipping names with no matching Person (case-insensitive, like
+    find_person_by_name).
+    """
+    if not participants:
+        return {}
+    lowered = list({name.lower() for name in participants})
+    rows = (
+        db.query(Person.id, Person.name)
+        .filter(func.lower(Person.name).in_(lowered))
+        .all()
     )
-    return result
+    by_lower = {name.lower(): pid for pid, name in rows}
+    return {
+        name: by_lower[name.lower()]
+        for name in participants
+        if name.lower() in by_lower
+    }
 
 
-def _get_past_meetings_with_people(participants: list[str]) -> str:
+def _get_past_meetings_with_people(person_ids: dict[str, str]) -> str:
     """Find past meetings involving any of the named participants."""
-    parts = []
+    if not person_ids:
+        return ""
 
     with get_db() as db:
-        for name in participants:
-            person = find_person_by_name(db, name)
-            if not person:
-                continue
-
-            # Get meetings where this person was mentioned
-            mentions = (
-                db.query(PersonMeeting)
-                .filter(PersonMeeting.person_id == person.id)
-                .order_by(PersonMeeting.created_at.desc())
-                .limit(5)
+        # Latest 5 mentions per person, fetched for all participants at once
+        ranked = (
+            db.query(
+                PersonMeeting.person_id,
+                PersonMeeting.meeting_id,
+                func.row_number().over(
+                    partition_by=PersonMeeting.person_id,
+                    order_by=PersonMeeting.created_at.desc(),
+                ).label("rank"),
+            )
+            .filter(PersonMeeting.person_id.in_(list(person_ids.values())))
+            .subquery()
+        )
+        mentions: dict[str, list[str]] = {}
+        # Newest first per person; parts[:10] below relies on this order
+        latest = (
+            db.query(ranked.c.person_id, ranked.c.meeting_id)
+            .filter(ranked.c.rank <= 5)
+            .order_by(ranked.c.person_id, ranked.c.rank)
+        )
+        for person_id, mid in latest:
+            mentions.setdefault(person_id, []).append(mid)
+
+        # Meetings and their analyses for every mention in one JOIN
+        meeting_ids = {mid for mids in mentions.values() for mid in mids}
+        analyzed = {
+            meeting.id: (meeting, analysis)
+            for meeting, analysis in (
+                db.query(Meeting, MeetingAnalysis)
+                .join(MeetingAnalysis, MeetingAnalysis.meeting_id == Meeting.id)
+                .filter(Meeting.id.in_(list(meeting_ids)))
                 .all()
             )
+        } if meeting_ids else {}
 
-            for mention in mentions:
-                meeting = db.get(Meeting, mention.meeting_id)
-                if not meeting:
+        parts = []
+        for name, person_id in person_ids.items():
+            for mid in mentions.get(person_id, []):
+                if mid not in analyzed:
                     continue
-                analysis = (
-                    db.query(MeetingAnalysis)
-                    .filter(MeetingAnalysis.meeting_id == meeting.id)
-                    .first()
+                meeting, analysis = analyzed[mid]
+                title = meeting.title or "Untitled"
+                date = meeting.started_at.strftime("%Y-%m-%d") if meeting.started_at else "unknown"
+                parts.append(
+                    f"[{title} - {date}] (with {name})\n"
+                    f"{analysis.executive_summary[:400]}"
                 )
-                if analysis:
-                    title = meeting.title or "Untitled"
-                    date = meeting.started_at.strftime("%Y-%m-%d") if meeting.started_at else "unknown"
-                    parts.append(
-                        f"[{title} - {date}] (with {name})\n"
-                        f"{analysis.executive_summary[:400]}"
-                    )
 
     return "\n\n".join(parts[:10])
 
 
 def _get_open_action_items(participants: list[str]) -> str:
     """Find action items owned by or related to the participants."""
-    items = []
+    if not participants:
+        return ""
 
     with get_db() as db:
-        for name in participants:
-            actions = (
-                db.query(ActionItem)
-                .filter(ActionItem.owner.ilike(f"%{name}%"))
-                .order_by(ActionItem.id.desc())
-                .limit(10)
-                .all()
-            )
-            for a in actions:
-                items.append(
-                    f"- [{a.priority}] {a.description} (owner: {a.owner}, "
-                    f"deadline: {a.deadline or 'none'})"
-                )
+        actions = (
+            db.query(ActionItem)
+            .filter(or_(*(ActionItem.owner.ilike(f"%{name}%") for name in participants)))
+            .order_by(ActionItem.id.desc())
+            .limit(15)
+            .all()
+        )
+        items = [
+            f"- [{a.priority}] {a.description} (owner: {a.owner}, "
+            f"deadline: {a.deadline or 'none'})"
+            for a in actions
+        ]
 
-    return "\n".join(items[:15])
+    return "\n".join(items)
 
 
-def _get_related_projects(participants: list[str], purpose: str) -> str:
+def _get_related_projects(person_ids: dict[str, str], purpose: str) -> str:
     """Find projects associated with the participants or purpose."""
-    parts = []
+    # Collect project ids from the knowledge graph, in first-seen order
+    project_ids: dict[str, None] = {}
+    for person_id in person_ids.values():
+        for neighbor in kg.get_neighbors(person_id):
+            if neighbor.get("entity_type") == "project":
+                project_ids.setdefault(neighbor["id"])
 
     with get_db() as db:
-        for name in participants:
-            person = find_person_by_name(db, name)
-            if not person:
-                continue
-
-            # Check knowledge graph for project connections
-            neighbors = kg.get_neighbors(person.id)
-            for neighbor in neighbors:
-                if neighbor.get("entity_type") == "project":
-                    project = db.get(Project, neighbor["id"])
-                    if project:
-                        parts.append(
-                            f"- {project.name} ({project.status.value if project.status else 'active'}): "
-                            f"{project.description or 'No description'}"
-                        )
+        projects = []
+        if project_ids:
+            by_id = {
+                p.id: p
+                for p in db.query(Project).filter(Project.id.in_(list(project_ids))).all()
+            }
+            projects = [by_id[pid] for pid in project_ids if pid in by_id]
 
         # Also search by purpose text
         if purpose:
             project = find_project_by_name(db, purpose)
             if project:
-                parts.append(
-                    f"- {project.name} ({project.status.value if project.status else 'active'}): "
-                    f"{project.description or 'No description'}"
-                )
+                projects.append(project)
+
+        seen_ids: set[str] = set()
+        parts = []
+        for project in projects:
+            if project.id in seen_ids:
+                continue
+            seen_ids.add(project.id)
+            parts.append(
+                f"- {project.name} ({project.status.value if project.status else 'active'}): "
+                f"{project.description or 'No description'}"
+            )
 
-    return "\n".join(set(parts[:10]))
+    return "\n".join(parts[:10])
 
 
-def _get_relevant_decisions(participants: list[str], purpose: str) -> str:
-    """Find decisions involving participants or related to the purpose."""
-    parts = []
+def _get_relevant_decisions(person_ids: dict[str, str]) -> str:
+    """Find decisions owned by any of the participants."""
+    if not person_ids:
+        return ""
 
     with get_db() as db:
         from backend.models.knowledge import Decision as KGDecision
-        for name in participants:
-            person = find_person_by_name(db, name)
-            if not person:
-                continue
-
-            decisions = (
-                db.query(KGDecision)
-                .filter(KGDecision.owner_id == person.id)
-                .order_by(KGDecision.made_at.desc())
-                .limit(5)
-                .all()
+        decisions = (
+            db.query(KGDecision)
+            .filter(KGDecision.owner_id.in_(list(person_ids.values())))
+            .order_by(KGDecision.made_at.desc())
+            .limit(10)
+            .all()
+        )
+        parts = []
+        for d in decisions:
+            status = d.status.value if d.status else "proposed"
+            parts.append(
+                f"- [{status}] {d.summary} (context: {d.context or 'none'})"
             )
-            for d in decisions:
-                status = d.status.value if d.status else "proposed"
-                parts.append(
-                    f"- [{status}] {d.summary} (context: {d.context or 'none'})"
-                )
 
-    return "\n".join(parts[:10])
+    return "\n".join(parts)
 
 
 def _get_semantically_related(participants: list[str], purpose: str) -> str:
     """Use ChromaDB to find semantically related past content."""
-    query = f"Meeting with {', '.join(participants)}. {purpose}"
-
-    results = vector_store.search_summaries(query=query, n_results=5)
-
-    if not results:
+    purpose = purpose.strip()
+    if not purpose and not participants:
         return ""
 
-    parts = []
-    for r in results:
-        if r.get("relevance", 0) < 0.3:
-            continue
-        parts.append(
-            f"[Relevance: {r['relevance']}] {r.get('text', '')[:300]}"
-        )
+    # One query per participant plus the purpose, embedded in a single batch
+    queries = [f"Meeting with {name}." for name in participants]
+    if purpose:
+        queries.append(purpose)
 
-    return "\n\n".join(parts[:5])
+    results = vector_store.search_summaries_multi(
+        queries=queries, n_results=5, min_relevance=0.3,
+    )
 
+    parts = [
+        f"[Relevance: {r['relevance']}] {r.get('text', '')[:300]}"
+        for r in results
+    ]
 
-def _parse_json(raw: str) -> dict:
-    raw = raw.strip()
-    if raw.startswith("```"):
-        first_newline = raw.index("\n")
-        last_fence = raw.rfind("```")
-        if last_fence > first_newline:
-            raw = raw[first_newline + 1:last_fence].strip()
-    return json.loads(raw)
+    return "\n\n".join(parts)
@@ -0,0 +1,361 @@
+"""
+Combined meeting analysis — connection detection and insight generation in one LLM call.
+
+Both tasks read the same transcript and largely the same knowledge context, so
+they share a single prompt whose JSON response carries the connection arrays
+and the insights side by side. That halves prompt tokens (one copy of the
+transcript) and time-to-first-token compared to two separate calls.
+
+detect_connections() and generate_insights() remain as thin wrappers that
+return their slice of analyze_meeting().
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from backend.intelligence.connections import (
+    _empty_result,
+    _get_known_people,
+    _get_known_projects,
+    _get_known_topics,
+    _get_past_meeting_context,
+    IncrementalLinker,
+)
+from backend.intelligence.insights import _get_knowledge_graph_context, _get_recent_meeting_context
+from backend.intelligence.llm_cache import fingerprint, semantic_cache
+from backend.intelligence.parsing import is_valid_json, parse_json
+from backend.intelligence.streaming import StreamingJSONParser, iter_array_items
+from backend.intelligence.templating import compile_template, render
+from backend.intelligence.tokens import truncate_to_tokens
+from backend.knowledge.graph import knowledge_graph as kg
+from backend.storage.vector_store import vector_store
+
+logger = logging.getLogger(__name__)
+
+# Leaves room for instructions, context and the response in an 8k context
+MAX_TRANSCRIPT_TOKENS = 7500
+
+# Static instructions + schema go first so providers can cache the prefix;
+# only ANALYSIS_PROMPT below varies per meeting.
+ANALYSIS_INSTRUCTIONS = """Analyze a meeting transcript in two ways:
+1. Identify connections to known context: known people, projects and topics, and past meetings.
+2. Surface insights the user might not have thought of during or after this meeting.
+You will be given the transcript, its summary, the known people, projects and topics, knowledge graph context, recent meeting context and context from related past meetings.
+
+For insights, go beyond what was explicitly discussed. Think about:
+- Implications of decisions made or discussed
+- Dependencies that might not be obvious
+- Risks or opportunities not mentioned
+- Patterns you see across this and recent meetings
+- Questions the user should consider asking next
+- Things that were conspicuously NOT discussed but probably should have been
+
+Return a JSON object with this exact structure:
+{
+  "people_referenced": [
+    {
+      "name": "Name as it appears in known_people or new name",
+      "is_known": true,
+      "context": "How they were referenced in this meeting",
+      "confidence": 0.0
+    }
+  ],
+  "projects_referenced": [
+    {
+      "name": "Project name",
+      "is_known": true,
+      "context": "How the project was referenced",
+      "confidence": 0.0
+    }
+  ],
+  "topics_referenced": [
+    {
+      "name": "Topic name",
+      "is_known": true,
+      "context": "How the topic was discussed",
+      "confidence": 0.0
+    }
+  ],
+  "past_meeting_links": [
+    {
+      "description": "What connects this meeting to a past discussion",
+      "related_context": "Relevant excerpt from past meeting context",
+      "confidence": 0.0
+    }
+  ],
+  "contradictions": [
+    {
+      "current_statement": "What was said in this meeting",
+      "past_statement": "What was previously recorded",
+      "description": "Nature of the contradiction",
+      "confidence": 0.0
+    }
+  ],
+  "open_threads": [
+    {
+      "description": "An unresolved thread from past meetings relevant to this one",
+      "source": "Where this thread was identified",
+      "confidence": 0.0
+    }
+  ],
+  "insights": [
+    {
+      "type": "implication|dependency|risk|opportunity|pattern|question|gap",
+      "title": "Brief title for the insight",
+      "description": "Detailed explanation of the insight",
+      "reasoning": "Why this insight matters or how you arrived at it",
+      "related_to": "What part of the meeting or knowledge base this relates to",
+      "priority": "high|medium|low",
+      "confidence": 0.0
+    }
+  ]
+}
+
+Rules:
+- Only flag contradictions if there is a clear conflict, not just different emphasis
+- is_known should be true if the person/project/topic matches something in the provided known lists
+- For open_threads, only include threads that are clearly relevant to this meeting's content
+- If past_meeting_context is empty, skip past_meeting_links and contradictions
+- Generate 3-8 insights, prioritizing quality over quantity; each should be genuinely useful, not obvious
+- Don't repeat in insights what's already in the summary or the connections above
+- Priority should reflect how actionable or important the insight is
+- Set confidence 0.0-1.0 based on how certain you are; lower it for speculative but potentially valuable insights
+
+"""
+
+# Ordered from most to least stable across meetings so local servers can
+# reuse the longest possible KV-cache prefix. The transcript, the largest
+# slot, is written last.
+ANALYSIS_PROMPT = """<known_people>
+{known_people}
+</known_people>
+
+<known_projects>
+{known_projects}
+</known_projects>
+
+<known_topics>
+{known_topics}
+</known_topics>
+
+<knowledge_graph_context>
+{kg_context}
+</knowledge_graph_context>
+
+<recent_meeting_context>
+{recent_context}
+</recent_meeting_context>
+
+<past_meeting_context>
+{past_context}
+</past_meeting_context>
+
+<meeting_summary>
+{summary}
+</meeting_summary>
+
+<transcript>
+{transcript}
+</transcript>"""
+_ANALYSIS_TEMPLATE = compile_template(ANALYSIS_PROMPT)
+
+# Used while the knowledge graph is empty: with nothing known to match
+# against, the known-entity and graph sections would only be placeholders.
+# The graph only grows through manual edits, so this can be every meeting;
+# past meetings found in ChromaDB are still included (second variant).
+ANALYSIS_PROMPT_COLDSTART = """<known_context>
+No people, projects or topics are known yet, and no related past meetings were found.
+Report referenced people, projects and topics with is_known false, and skip past_meeting_links and contradictions.
+</known_context>
+
+<recent_meeting_context>
+{recent_context}
+</recent_meeting_context>
+
+<meeting_summary>
+{summary}
+</meeting_summary>
+
+<transcript>
+{transcript}
+</transcript>"""
+_ANALYSIS_TEMPLATE_COLDSTART = compile_template(ANALYSIS_PROMPT_COLDSTART)
+
+ANALYSIS_PROMPT_COLDSTART_PAST = """<known_context>
+No people, projects or topics are known yet.
+Report referenced people, projects and topics with is_known false.
+</known_context>
+
+<recent_meeting_context>
+{recent_context}
+</recent_meeting_context>
+
+<past_meeting_context>
+{past_context}
+</past_meeting_context>
+
+<meeting_summary>
+{summary}
+</meeting_summary>
+
+<transcript>
+{transcript}
+</transcript>"""
+_ANALYSIS_TEMPLATE_COLDSTART_PAST = compile_template(ANALYSIS_PROMPT_COLDSTART_PAST)
+
+SYSTEM_PROMPT = """You are LIME's analysis engine. You identify links between the current meeting and the user's existing knowledge base, and surface non-obvious implications, risks and patterns.
+Be precise about connections and genuinely insightful, not generic. Return valid JSON only."""
+
+
+@dataclass(frozen=True)
+class PipelineFlags:
+    """Which knowledge context is worth gathering for a meeting; decided once per meeting."""
+    kg_empty: bool
+    has_past_meetings: bool
+
+    @classmethod
+    def detect(cls) -> "PipelineFlags":
+        """
+        Snapshot the knowledge stores. Call before the meeting's own summaries
+        are embedded, or they will count as past meetings.
+        """
+        return cls(
+            kg_empty=kg.is_empty(),
+            has_past_meetings=vector_store.count() > 0,
+        )
+
+
+def analyze_meeting(
+    meeting_id: str,
+    transcript: str,
+    summary: str = "",
+    query_embedding: Optional[Sequence[float]] = None,
+    flags: Optional[PipelineFlags] = None,
+    bypass: bool = False,
+) -> dict:
+    """
+    Detect connections and generate insights for a meeting in a single LLM call.
+
+    Returns {"connections": {...}, "insights": [...]}; "connections" has the keys
+    people_referenced, projects_referenced, topics_referenced, past_meeting_links,
+    contradictions, open_threads. Detected entities are auto-linked to the meeting.
+
+    `query_embedding` is the embedding of transcript[:2000]; it is computed
+    here once if not given and shared by the past-meeting search and the
+    semantic cache. `flags` defaults to PipelineFlags.detect(); `bypass`
+    skips the semantic cache.
+    """
+    logger.info(f"Analyzing connections and insights for meeting {meeting_id[:8]}...")
+
+    cache_key_text = transcript[:2000]
+    if query_embedding is None:
+        embeddings = vector_store.embed([cache_key_text])
+        query_embedding = embeddings[0] if embeddings else None
+
+    flags = flags or PipelineFlags.detect()
+    recent_context = _get_recent_meeting_context(meeting_id)
+    # Nothing to match against yet: skip the ChromaDB query
+    past_context = (
+        _get_past_meeting_context(transcript, meeting_id, query_embedding)
+        if flags.has_past_meetings else ""
+    )
+    values = {
+        "recent_context": recent_context,
+        "summary": summary or "No summary available",
+        # Cap by tokens, not characters, to fit the model's context window
+        "transcript": truncate_to_tokens(transcript, MAX_TRANSCRIPT_TOKENS),
+    }
+    limits = {
+        "kg_context": 2000,
+        "recent_context": 3000,
+        "summary": 2000,
+    }
+
+    if flags.kg_empty:
+        logger.info("Knowledge graph is empty, using cold-start analysis prompt")
+        known_people = known_projects = known_topics = kg_context = ""
+        if past_context:
+            template = _ANALYSIS_TEMPLATE_COLDSTART_PAST
+            values["past_context"] = past_context
+        else:
+            template = _ANALYSIS_TEMPLATE_COLDSTART
+    else:
+        known_people = _get_known_people()
+        known_projects = _get_known_projects()
+        known_topics = _get_known_topics()
+        kg_context = _get_knowledge_graph_context()
+        template = _ANALYSIS_TEMPLATE
+        values.update({
+            "known_people": known_people or "None known yet",
+            "known_projects": known_projects or "None known yet",
+            "known_topics": known_topics or "None known yet",
+            "kg_context": kg_context,
+            "past_context": past_context or "No past meetings found",
+        })
+
+    prompt = render(template, values, limits)
+
+    # Auto-link detected entities to the meeting while the rest of the
+    # response is still being generated
+    linker = IncrementalLinker(meeting_id)
+    try:
+        try:
+            deltas = semantic_cache.generate_stream(
+                "analysis",
+                prompt,
+                SYSTEM_PROMPT,
+                cache_key_text=cache_key_text,
+                cache_key_embedding=query_embedding,
+                # transcript[:2000] only picks candidates. The rendered prompt
+                # (known entities, graph, past and recent meetings) and the
+                # full transcript must match exactly, so a hit never carries
+                # stale contradictions or another meeting's entities into the
+                # auto-linker below.
+                context_key=fingerprint(prompt) + fingerprint(transcript),
+                cache_prefix=ANALYSIS_INSTRUCTIONS,
+                bypass=bypass,
+                validate=is_valid_json,
+            )
+            # Parse while the model is still generating; array entries are
+            # complete (and usable) as soon as their closing brace arrives
+            parser = StreamingJSONParser()
+            for section, item in iter_array_items(deltas, parser):
+                linker.add(section, item)
+            result = parse_json(parser.text)
+        except Exception as e:
+            logger.error(f"Meeting analysis LLM call failed: {e}")
+            result = {}
+        if not isinstance(result, dict):
+            logger.error(f"Meeting analysis response is not an object: {type(result).__name__}")
+            result = {}
+
+        # Null or malformed sections count as empty
+        connections = {key: _as_list(result.get(key)) for key in _empty_result()}
+        insights = _as_list(result.get("insights"))
+
+        # Anything the incremental parser missed is linked from the full result
+        for section in IncrementalLinker.LINKED_SECTIONS:
+            for ref in connections[section]:
+                linker.add(section, ref)
+    finally:
+        # Flushes the links queued so far and stops the worker thread
+        linker.close()
+    logger.debug(f"Processed {linker.processed} entity references for meeting {meeting_id[:8]}")
+
+    connection_count = (
+        len(connections["people_referenced"])
+        + len(connections["projects_referenced"])
+        + len(connections["past_meeting_links"])
+        + len(connections["contradictions"])
+    )
+    logger.info(
+        f"Detected {connection_count} connections and {len(insights)} insights "
+        f"for meeting {meeting_id[:8]}"
+    )
+
+    return {"connections": connections, "insights": insights}
+
+
+def _as_list(value) -> list:
+    return value if isinstance(value, list) else []
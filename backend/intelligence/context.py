@@ -0,0 +1,44 @@
+"""
+Request-scoped snapshot of knowledge graph entity lists.
+
+Several helpers of one meeting analysis list the same entity types (known
+people/projects/topics for the prompt, the knowledge graph summary). Inside
+`with kg_snapshot():` each type is listed once and shared through a
+ContextVar; outside of it, or once the graph has changed since the snapshot,
+get_entities_by_type() falls through to the graph.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from backend.knowledge.graph import knowledge_graph as kg
+
+SNAPSHOT_TYPES = ("person", "project", "topic")
+
+# (kg.version at snapshot time, entities by type)
+_snapshot: ContextVar[Optional[tuple[int, dict[str, list[dict]]]]] = ContextVar(
+    "kg_snapshot", default=None,
+)
+
+
+@contextmanager
+def kg_snapshot() -> Iterator[None]:
+    token = _snapshot.set((
+        kg.version,
+        {entity_type: kg.get_entities_by_type(entity_type) for entity_type in SNAPSHOT_TYPES},
+    ))
+    try:
+        yield
+    finally:
+        _snapshot.reset(token)
+
+
+def get_entities_by_type(entity_type: str) -> list[dict]:
+    """kg.get_entities_by_type, served from the active snapshot while it is current."""
+    snapshot = _snapshot.get()
+    if snapshot is not None:
+        version, entities = snapshot
+        if version == kg.version and entity_type in entities:
+            return entities[entity_type]
+    return kg.get_entities_by_type(entity_type)
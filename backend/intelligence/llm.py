@@ -2,21 +2,49 @@
 LLM Client Abstraction — unified interface for Ollama, Anthropic, and OpenAI.
 
 Default: Ollama (free, local). Falls back through provider chain on failure.
+
+Callers may pass a static `cache_prefix` that is placed ahead of the prompt:
+Anthropic marks it (and the system prompt) with cache_control, OpenAI caches
+stable prefixes automatically, and Ollama reuses the KV cache of a shared
+prefix as long as the model stays loaded.
+
+`generate_stream` yields text deltas as the provider produces them, so callers
+can start parsing before the full response has arrived. `agenerate` is the
+asyncio counterpart of `generate` for running several calls concurrently, and
+`agenerate_stream` of `generate_stream`. `generate_batch` submits many
+requests through the Anthropic/OpenAI batch APIs for backfill work.
+
+HTTP connections are pooled: one shared client for sync calls and one per
+event loop for async calls, so repeat calls skip TCP/TLS setup.
 """
 
-import json
+import asyncio
+import atexit
 import logging
+import random
 import time
-from typing import Optional
+import weakref
+from typing import AsyncIterator, Iterator, Optional
 
 import httpx
+import orjson
 
 from backend.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 2
-RETRY_DELAY = 1.0  # seconds
+RETRY_DELAY = 1.0  # seconds — base for exponential backoff
+RETRY_MAX_DELAY = 20.0  # seconds — cap on a single backoff / Retry-After wait
+OLLAMA_KEEP_ALIVE = "30m"  # Keep the model (and its prefix KV cache) resident
+HTTP_TIMEOUT = 120.0
+# seconds — no new attempts are started after this per call; a few timeouts'
+# worth, so one slow attempt does not use up every retry
+RETRY_BUDGET = 3 * HTTP_TIMEOUT
+HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8)
+BATCH_PROVIDERS = ("anthropic", "openai")  # Providers with an asynchronous batch API
+BATCH_POLL_INTERVAL = 60.0  # seconds between batch status checks
+BATCH_MAX_WAIT = 24 * 3600.0  # seconds — the providers' completion window
 
 
 class LLMError(Exception):
@@ -29,6 +57,21 @@ class LLMClient:
     def __init__(self):
         self._provider = settings.llm_provider
         self._fallback_chain = self._build_fallback_chain()
+        # httpx.Client is thread-safe; AsyncClient is bound to its event loop
+        self._client = httpx.Client(http2=True, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        atexit.register(self.close)
+
+    def close(self):
+        self._client.close()
+
+    async def aclose(self):
+        """Close the AsyncClient bound to the running event loop, if any."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
 
     def _build_fallback_chain(self) -> list[str]:
         chain = [self._provider]
@@ -46,77 +89,329 @@ class LLMClient:
             return bool(settings.openai_api_key)
         return False
 
-    def generate(self, prompt: str, system_prompt: str = "") -> str:
-        last_error = None
-        for provider in self._fallback_chain:
-            for attempt in range(MAX_RETRIES + 1):
-                try:
-                    result = self._call_provider(provider, prompt, system_prompt)
-                    logger.info(f"LLM response from {provider} ({len(result)} chars)")
-                    return result
-                except Exception as e:
-                    last_error = e
-                    logger.warning(
-                        f"LLM call failed ({provider}, attempt {attempt + 1}): {e}"
-                    )
-                    if attempt < MAX_RETRIES:
-                        time.sleep(RETRY_DELAY)
-            logger.error(f"All retries exhausted for provider: {provider}")
+    def generate(self, prompt: str, system_prompt: str = "", cache_prefix: str = "") -> str:
+        """
+        Generate a completion. `cache_prefix` is static text prepended to the
+        prompt that providers may cache between calls.
+        """
+        policy = _RetryPolicy(self._fallback_chain, "call")
+        for provider in policy.attempts():
+            try:
+                result = self._call_provider(provider, prompt, system_prompt, cache_prefix)
+                logger.info(f"LLM response from {provider} ({len(result)} chars)")
+                return result
+            except Exception as e:
+                delay = policy.failed(e)
+                if delay:
+                    time.sleep(delay)
+
+    async def agenerate(self, prompt: str, system_prompt: str = "", cache_prefix: str = "") -> str:
+        """Async variant of generate(), with the same retry + fallback chain."""
+        policy = _RetryPolicy(self._fallback_chain, "call")
+        for provider in policy.attempts():
+            try:
+                result = await self._acall_provider(provider, prompt, system_prompt, cache_prefix)
+                logger.info(f"LLM response from {provider} ({len(result)} chars)")
+                return result
+            except Exception as e:
+                delay = policy.failed(e)
+                if delay:
+                    await asyncio.sleep(delay)
 
-        raise LLMError(f"All LLM providers failed. Last error: {last_error}")
+    def generate_stream(
+        self, prompt: str, system_prompt: str = "", cache_prefix: str = ""
+    ) -> Iterator[str]:
+        """
+        Stream a completion as text deltas.
+
+        Retries and provider fallback apply only until the first delta has
+        been yielded; a stream that fails midway raises LLMError.
+        """
+        policy = _RetryPolicy(self._fallback_chain, "stream")
+        for provider in policy.attempts():
+            started = False
+            total = 0
+            try:
+                for delta in self._stream_provider(provider, prompt, system_prompt, cache_prefix):
+                    started = True
+                    total += len(delta)
+                    yield delta
+                logger.info(f"LLM stream from {provider} ({total} chars)")
+                return
+            except Exception as e:
+                if started:
+                    raise LLMError(f"LLM stream from {provider} failed midway: {e}") from e
+                delay = policy.failed(e)
+                if delay:
+                    time.sleep(delay)
+
+    async def agenerate_stream(
+        self, prompt: str, system_prompt: str = "", cache_prefix: str = ""
+    ) -> AsyncIterator[str]:
+        """Async variant of generate_stream(), with the same retry + fallback rules."""
+        policy = _RetryPolicy(self._fallback_chain, "stream")
+        for provider in policy.attempts():
+            started = False
+            total = 0
+            try:
+                async for delta in self._astream_provider(provider, prompt, system_prompt, cache_prefix):
+                    started = True
+                    total += len(delta)
+                    yield delta
+                logger.info(f"LLM stream from {provider} ({total} chars)")
+                return
+            except Exception as e:
+                if started:
+                    raise LLMError(f"LLM stream from {provider} failed midway: {e}") from e
+                delay = policy.failed(e)
+                if delay:
+                    await asyncio.sleep(delay)
+
+    def generate_batch(self, requests: dict[str, tuple[str, str]]) -> dict[str, str]:
+        """
+        Submit {custom_id: (prompt, system_prompt)} through a provider's batch
+        API — half the price of synchronous calls and a separate rate-limit
+        pool, but results may take hours. Blocks until the batch has ended and
+        returns {custom_id: text} for the requests that succeeded.
+
+        Raises LLMError if no batch-capable provider is configured or the batch
+        fails as a whole; there is no per-request fallback.
+        """
+        provider = next((p for p in self._fallback_chain if p in BATCH_PROVIDERS), None)
+        if provider is None:
+            raise LLMError("No configured provider supports batch requests")
+        if not requests:
+            return {}
+
+        logger.info(f"Submitting batch of {len(requests)} requests to {provider}")
+        try:
+            if provider == "anthropic":
+                results = self._anthropic_batch(requests)
+            else:
+                results = self._openai_batch(requests)
+        except LLMError:
+            raise
+        except Exception as e:
+            raise LLMError(f"Batch request to {provider} failed: {e}") from e
+
+        missing = len(requests) - len(results)
+        if missing:
+            logger.warning(f"{missing} of {len(requests)} batch requests did not succeed")
+        return results
 
     @property
     def active_provider(self) -> str:
         return self._provider
 
-    def _call_provider(self, provider: str, prompt: str, system_prompt: str) -> str:
+    def _call_provider(
+        self, provider: str, prompt: str, system_prompt: str, cache_prefix: str = ""
+    ) -> str:
+        url, headers, payload = self._build_request(provider, prompt, system_prompt, cache_prefix)
+        resp = self._client.post(url, headers=headers, json=payload)
+        resp.raise_for_status()
+        return self._parse_response(provider, orjson.loads(resp.content))
+
+    async def _acall_provider(
+        self, provider: str, prompt: str, system_prompt: str, cache_prefix: str = ""
+    ) -> str:
+        url, headers, payload = self._build_request(provider, prompt, system_prompt, cache_prefix)
+        resp = await self._get_async_client().post(url, headers=headers, json=payload)
+        resp.raise_for_status()
+        return self._parse_response(provider, orjson.loads(resp.content))
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(http2=True, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+            self._async_clients[loop] = client
+        return client
+
+    def _parse_response(self, provider: str, data: dict) -> str:
         if provider == "ollama":
-            return self._call_ollama(prompt, system_prompt)
+            # prompt_eval_count only covers tokens not served from the KV cache
+            logger.debug(f"Ollama prompt tokens evaluated: {data.get('prompt_eval_count')}")
+            return data["response"]
         elif provider == "anthropic":
-            return self._call_anthropic(prompt, system_prompt)
+            cached = data.get("usage", {}).get("cache_read_input_tokens", 0)
+            if cached:
+                logger.debug(f"Anthropic prompt cache hit: {cached} tokens")
+            return data["content"][0]["text"]
+        else:
+            details = data.get("usage", {}).get("prompt_tokens_details") or {}
+            if details.get("cached_tokens"):
+                logger.debug(f"OpenAI prompt cache hit: {details['cached_tokens']} tokens")
+            return data["choices"][0]["message"]["content"]
+
+    def _stream_provider(
+        self, provider: str, prompt: str, system_prompt: str, cache_prefix: str = ""
+    ) -> Iterator[str]:
+        url, headers, payload = self._build_request(provider, prompt, system_prompt, cache_prefix)
+        payload["stream"] = True
+        with self._client.stream("POST", url, headers=headers, json=payload) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                delta = _parse_stream_line(provider, line)
+                if delta:
+                    yield delta
+
+    async def _astream_provider(
+        self, provider: str, prompt: str, system_prompt: str, cache_prefix: str = ""
+    ) -> AsyncIterator[str]:
+        url, headers, payload = self._build_request(provider, prompt, system_prompt, cache_prefix)
+        payload["stream"] = True
+        async with self._get_async_client().stream("POST", url, headers=headers, json=payload) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                delta = _parse_stream_line(provider, line)
+                if delta:
+                    yield delta
+
+    # ── Batch APIs ──
+
+    def _anthropic_batch(self, requests: dict[str, tuple[str, str]]) -> dict[str, str]:
+        url, headers, _ = self._anthropic_request("", "")
+        batch_url = url + "/batches"
+        body = {"requests": [
+            {"custom_id": cid, "params": self._anthropic_request(prompt, system_prompt)[2]}
+            for cid, (prompt, system_prompt) in requests.items()
+        ]}
+        resp = self._client.post(batch_url, headers=headers, content=orjson.dumps(body))
+        resp.raise_for_status()
+        batch = orjson.loads(resp.content)
+
+        batch = self._poll_batch(
+            f"{batch_url}/{batch['id']}", headers,
+            lambda b: b["processing_status"] == "ended",
+        )
+        resp = self._client.get(batch["results_url"], headers=headers)
+        resp.raise_for_status()
+
+        results = {}
+        for line in resp.text.splitlines():
+            if not line.strip():
+                continue
+            row = orjson.loads(line)
+            if row["result"]["type"] == "succeeded":
+                results[row["custom_id"]] = self._parse_response("anthropic", row["result"]["message"])
+        return results
+
+    def _openai_batch(self, requests: dict[str, tuple[str, str]]) -> dict[str, str]:
+        url, headers, _ = self._openai_request("", "")
+        base_url = url.rsplit("/chat/completions", 1)[0]
+        auth = {"Authorization": headers["Authorization"]}
+        lines = b"\n".join(
+            orjson.dumps({
+                "custom_id": cid,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._openai_request(prompt, system_prompt)[2],
+            })
+            for cid, (prompt, system_prompt) in requests.items()
+        )
+        resp = self._client.post(
+            f"{base_url}/files", headers=auth,
+            data={"purpose": "batch"}, files={"file": ("batch.jsonl", lines, "application/jsonl")},
+        )
+        resp.raise_for_status()
+        input_file_id = orjson.loads(resp.content)["id"]
+
+        resp = self._client.post(f"{base_url}/batches", headers=headers, content=orjson.dumps({
+            "input_file_id": input_file_id,
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h",
+        }))
+        resp.raise_for_status()
+        batch = orjson.loads(resp.content)
+
+        batch = self._poll_batch(
+            f"{base_url}/batches/{batch['id']}", auth,
+            lambda b: b["status"] in ("completed", "failed", "expired", "cancelled"),
+        )
+        if not batch.get("output_file_id"):
+            raise LLMError(f"OpenAI batch {batch['id']} ended with status {batch['status']}")
+        resp = self._client.get(f"{base_url}/files/{batch['output_file_id']}/content", headers=auth)
+        resp.raise_for_status()
+
+        results = {}
+        for line in resp.text.splitlines():
+            if not line.strip():
+                continue
+            row = orjson.loads(line)
+            response = row.get("response") or {}
+            if response.get("status_code") == 200:
+                results[row["custom_id"]] = self._parse_response("openai", response["body"])
+        return results
+
+    def _poll_batch(self, url: str, headers: dict, is_done) -> dict:
+        deadline = time.monotonic() + BATCH_MAX_WAIT
+        while True:
+            resp = self._client.get(url, headers=headers)
+            resp.raise_for_status()
+            batch = orjson.loads(resp.content)
+            if is_done(batch):
+                return batch
+            if time.monotonic() >= deadline:
+                raise LLMError(f"Batch still running after {BATCH_MAX_WAIT:.0f}s: {url}")
+            time.sleep(BATCH_POLL_INTERVAL)
+
+    # ── Request builders ──────────────────────────────────────────────────────
+
+    def _build_request(
+        self, provider: str, prompt: str, system_prompt: str, cache_prefix: str = ""
+    ) -> tuple[str, dict, dict]:
+        """Return (url, headers, payload) for a non-streaming call."""
+        if provider == "ollama":
+            return self._ollama_request(prompt, system_prompt, cache_prefix)
+        elif provider == "anthropic":
+            return self._anthropic_request(prompt, system_prompt, cache_prefix)
         elif provider == "openai":
-            return self._call_openai(prompt, system_prompt)
+            return self._openai_request(prompt, system_prompt, cache_prefix)
         raise LLMError(f"Unknown provider: {provider}")
 
-    def _call_ollama(self, prompt: str, system_prompt: str) -> str:
+    def _ollama_request(self, prompt: str, system_prompt: str, cache_prefix: str = ""):
         url = f"{settings.ollama_base_url}/api/generate"
         payload = {
             "model": settings.ollama_model,
-            "prompt": prompt,
+            "prompt": cache_prefix + prompt,
             "stream": False,
+            "keep_alive": OLLAMA_KEEP_ALIVE,
             "options": {"temperature": 0.3, "num_predict": 4096},
         }
         if system_prompt:
             payload["system"] = system_prompt
+        return url, {}, payload
 
-        with httpx.Client(timeout=120.0) as client:
-            resp = client.post(url, json=payload)
-            resp.raise_for_status()
-            return resp.json()["response"]
-
-    def _call_anthropic(self, prompt: str, system_prompt: str) -> str:
+    def _anthropic_request(self, prompt: str, system_prompt: str, cache_prefix: str = ""):
         url = "https://api.anthropic.com/v1/messages"
         headers = {
             "x-api-key": settings.anthropic_api_key,
             "anthropic-version": "2023-06-01",
+            "anthropic-beta": "prompt-caching-2024-07-31",
             "content-type": "application/json",
         }
+        content = [{"type": "text", "text": prompt}]
+        if cache_prefix:
+            content.insert(0, {
+                "type": "text",
+                "text": cache_prefix,
+                "cache_control": {"type": "ephemeral"},
+            })
         payload = {
             "model": settings.anthropic_model,
             "max_tokens": 4096,
             "temperature": 0.3,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": [{"role": "user", "content": content}],
         }
         if system_prompt:
-            payload["system"] = system_prompt
-
-        with httpx.Client(timeout=120.0) as client:
-            resp = client.post(url, headers=headers, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            return data["content"][0]["text"]
+            payload["system"] = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }]
+        return url, headers, payload
 
-    def _call_openai(self, prompt: str, system_prompt: str) -> str:
+    def _openai_request(self, prompt: str, system_prompt: str, cache_prefix: str = ""):
         url = "https://api.openai.com/v1/chat/completions"
         headers = {
             "Authorization": f"Bearer {settings.openai_api_key}",
@@ -125,7 +420,8 @@ class LLMClient:
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        # OpenAI caches stable prompt prefixes automatically
+        messages.append({"role": "user", "content": cache_prefix + prompt})
 
         payload = {
             "model": settings.openai_model,
@@ -133,12 +429,106 @@ class LLMClient:
             "temperature": 0.3,
             "max_tokens": 4096,
         }
+        return url, headers, payload
 
-        with httpx.Client(timeout=120.0) as client:
-            resp = client.post(url, headers=headers, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            return data["choices"][0]["message"]["content"]
+
+class _RetryPolicy:
+    """
+    The attempt policy shared by the sync/async and plain/streaming calls:
+    MAX_RETRIES retries per provider down the fallback chain, backoff from
+    _retry_delay(), and no new attempt after RETRY_BUDGET.
+
+        policy = _RetryPolicy(chain, "call")
+        for provider in policy.attempts():
+            try:
+                return call(provider)
+            except Exception as e:
+                delay = policy.failed(e)
+                if delay:
+                    sleep(delay)
+
+    attempts() raises LLMError once the chain or the budget is exhausted.
+    """
+
+    def __init__(self, chain: list[str], kind: str):
+        self._chain = chain
+        self._kind = kind
+        self._deadline = time.monotonic() + RETRY_BUDGET
+        self._provider = ""
+        self._attempt = 0
+        self._next_provider = False
+        self.last_error: Optional[Exception] = None
+
+    def attempts(self) -> Iterator[str]:
+        for provider in self._chain:
+            self._next_provider = False
+            for attempt in range(MAX_RETRIES + 1):
+                if time.monotonic() >= self._deadline:
+                    raise LLMError(f"LLM retry budget exhausted. Last error: {self.last_error}")
+                self._provider, self._attempt = provider, attempt
+                yield provider
+                if self._next_provider:
+                    break
+            logger.error(f"All retries exhausted for provider: {provider}")
+
+        raise LLMError(f"All LLM providers failed. Last error: {self.last_error}")
+
+    def failed(self, error: Exception) -> Optional[float]:
+        """Record a failed attempt; returns the delay before retrying, or None to move to the next provider."""
+        self.last_error = error
+        logger.warning(f"LLM {self._kind} failed ({self._provider}, attempt {self._attempt + 1}): {error}")
+        delay = _retry_delay(error, self._attempt, self._deadline)
+        if delay is None:
+            self._next_provider = True
+        return delay
+
+
+def _retry_delay(error: Exception, attempt: int, deadline: float) -> Optional[float]:
+    """
+    Seconds to wait before retrying the same provider, or None to move on to
+    the next provider (retries exhausted, or the error will not go away).
+    """
+    if attempt >= MAX_RETRIES:
+        return None
+
+    retry_after = None
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        # Client errors are deterministic — except timeouts and rate limits
+        if 400 <= status < 500 and status not in (408, 429):
+            return None
+        if status in (429, 503):
+            try:
+                retry_after = float(error.response.headers.get("retry-after", ""))
+            except ValueError:
+                pass
+
+    if retry_after is None:
+        retry_after = RETRY_DELAY * 2 ** attempt + random.random() * 0.25
+    return max(0.0, min(retry_after, RETRY_MAX_DELAY, deadline - time.monotonic()))
+
+
+def _parse_stream_line(provider: str, line: str) -> str:
+    """Extract the text delta from one line of a provider's streaming response."""
+    if not line:
+        return ""
+    if provider == "ollama":
+        # Newline-delimited JSON objects
+        return orjson.loads(line).get("response", "")
+
+    # Anthropic and OpenAI use server-sent events
+    if not line.startswith("data:"):
+        return ""
+    data = line[5:].strip()
+    if data == "[DONE]":
+        return ""
+    event = orjson.loads(data)
+    if provider == "anthropic":
+        if event.get("type") == "content_block_delta":
+            return event["delta"].get("text", "")
+        return ""
+    choices = event.get("choices") or [{}]
+    return choices[0].get("delta", {}).get("content") or ""
 
 
 # Module-level singleton
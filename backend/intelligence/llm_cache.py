@@ -0,0 +1,249 @@
+"""
+Semantic cache for LLM calls.
+
+Repeated inputs (retries after a failed run, prompt A/B runs on the same
+meeting) should not cost a full LLM call. Responses are stored in a ChromaDB
+collection keyed by the embedding of a short cache key text (the start of
+the transcript); a lookup hits when the nearest stored key is at least
+SIMILARITY_THRESHOLD cosine-similar *and* was produced from the same scope:
+namespace, system prompt and context. The context must hold a fingerprint()
+of the full input and everything else the response depends on, so the
+similarity only picks candidates and never decides correctness: a
+transcript that merely opens like another one is a miss. Entries are keyed
+by scope and key text, so a repeated prompt overwrites its entry. Entries
+older than TTL_SECONDS are ignored by lookups and purged from the whole
+collection at most once per PURGE_INTERVAL_SECONDS, on store.
+
+The cache degrades to a pass-through when ChromaDB is unavailable.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from typing import AsyncIterator, Callable, Iterator, Optional, Sequence
+
+from backend.intelligence.llm import llm_client
+from backend.storage.vector_store import vector_store
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    COLLECTION = "llm_semantic_cache"
+    SIMILARITY_THRESHOLD = 0.97
+    TTL_SECONDS = 7 * 24 * 3600  # Cached responses older than a week are ignored
+    LOOKUP_CANDIDATES = 5  # Nearest entries checked, so an expired one does not hide a fresh one
+    PURGE_INTERVAL_SECONDS = 3600  # Minimum gap between collection-wide expiry sweeps
+
+    def __init__(self):
+        self._collection = None
+        self._last_purge = 0.0
+
+    def generate(
+        self,
+        namespace: str,
+        prompt: str,
+        system_prompt: str,
+        cache_key_text: str,
+        context_key: str = "",
+        cache_prefix: str = "",
+        bypass: bool = False,
+        cache_key_embedding: Optional[Sequence[float]] = None,
+        validate: Optional[Callable[[str], bool]] = None,
+    ) -> str:
+        """
+        llm_client.generate with a semantic cache in front.
+
+        `cache_key_text` is embedded for the similarity lookup; `context_key`
+        must match exactly (it is hashed together with the namespace and
+        prompts), so it should hold the prompt template, a fingerprint() of
+        the full input and any other context the response depends on. Pass bypass=True to force a fresh call, and
+        `cache_key_embedding` (vector_store.embed) to skip re-embedding
+        `cache_key_text` for the lookup and the store. Responses `validate`
+        rejects (e.g. unparseable JSON) are returned but not cached.
+        """
+        collection = None if bypass else self._get_collection()
+        scope = _hash(namespace, system_prompt, cache_prefix, context_key)
+
+        if collection is not None:
+            cached = self._lookup(collection, scope, cache_key_text, cache_key_embedding)
+            if cached is not None:
+                logger.info(f"Semantic cache hit ({namespace})")
+                return cached
+
+        raw = llm_client.generate(prompt, system_prompt, cache_prefix=cache_prefix)
+
+        if collection is not None:
+            self._store(collection, scope, namespace, cache_key_text, raw, cache_key_embedding, validate)
+
+        return raw
+
+    def generate_stream(
+        self,
+        namespace: str,
+        prompt: str,
+        system_prompt: str,
+        cache_key_text: str,
+        context_key: str = "",
+        cache_prefix: str = "",
+        bypass: bool = False,
+        cache_key_embedding: Optional[Sequence[float]] = None,
+        validate: Optional[Callable[[str], bool]] = None,
+    ) -> Iterator[str]:
+        """
+        Streaming counterpart of generate(). A hit yields the cached response
+        as a single delta; a miss streams from the LLM and caches the full
+        response once the stream completes.
+        """
+        collection = None if bypass else self._get_collection()
+        scope = _hash(namespace, system_prompt, cache_prefix, context_key)
+
+        if collection is not None:
+            cached = self._lookup(collection, scope, cache_key_text, cache_key_embedding)
+            if cached is not None:
+                logger.info(f"Semantic cache hit ({namespace})")
+                yield cached
+                return
+
+        deltas = []
+        for delta in llm_client.generate_stream(prompt, system_prompt, cache_prefix=cache_prefix):
+            deltas.append(delta)
+            yield delta
+
+        if collection is not None:
+            self._store(
+                collection, scope, namespace, cache_key_text, "".join(deltas), cache_key_embedding, validate,
+            )
+
+    async def agenerate_stream(
+        self,
+        namespace: str,
+        prompt: str,
+        system_prompt: str,
+        cache_key_text: str,
+        context_key: str = "",
+        cache_prefix: str = "",
+        bypass: bool = False,
+        cache_key_embedding: Optional[Sequence[float]] = None,
+        validate: Optional[Callable[[str], bool]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Async counterpart of generate_stream(). ChromaDB is synchronous, so
+        the lookup and store run in worker threads.
+        """
+        collection = None if bypass else await asyncio.to_thread(self._get_collection)
+        scope = _hash(namespace, system_prompt, cache_prefix, context_key)
+
+        if collection is not None:
+            cached = await asyncio.to_thread(
+                self._lookup, collection, scope, cache_key_text, cache_key_embedding,
+            )
+            if cached is not None:
+                logger.info(f"Semantic cache hit ({namespace})")
+                yield cached
+                return
+
+        deltas = []
+        async for delta in llm_client.agenerate_stream(prompt, system_prompt, cache_prefix=cache_prefix):
+            deltas.append(delta)
+            yield delta
+
+        if collection is not None:
+            await asyncio.to_thread(
+                self._store,
+                collection, scope, namespace, cache_key_text, "".join(deltas), cache_key_embedding, validate,
+            )
+
+    def _store(
+        self, collection, scope: str, namespace: str, cache_key_text: str, raw: str,
+        embedding=None, validate: Optional[Callable[[str], bool]] = None,
+    ):
+        if validate is not None and not validate(raw):
+            logger.debug(f"Not caching invalid {namespace} response")
+            return
+        try:
+            # Same scope and key text -> same id, so a repeat replaces the old entry
+            collection.upsert(
+                ids=[_hash(scope, cache_key_text)],
+                documents=[cache_key_text],
+                embeddings=[embedding] if embedding is not None else None,
+                metadatas=[{
+                    "scope": scope,
+                    "namespace": namespace,
+                    "response": raw,
+                    "created_at": time.time(),
+                }],
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store semantic cache entry: {e}")
+        self._purge_expired(collection)
+
+    def _purge_expired(self, collection):
+        """Delete every expired entry; lookups only see a scope's nearest few."""
+        now = time.time()
+        if now - self._last_purge < self.PURGE_INTERVAL_SECONDS:
+            return
+        self._last_purge = now
+        try:
+            collection.delete(where={"created_at": {"$lt": now - self.TTL_SECONDS}})
+        except Exception as e:
+            logger.debug(f"Failed to purge expired semantic cache entries: {e}")
+
+    def _lookup(self, collection, scope: str, cache_key_text: str, embedding=None):
+        if embedding is not None:
+            query_kwargs = {"query_embeddings": [embedding]}
+        else:
+            query_kwargs = {"query_texts": [cache_key_text]}
+        try:
+            results = collection.query(
+                **query_kwargs,
+                n_results=self.LOOKUP_CANDIDATES,
+                where={"scope": scope},
+                include=["metadatas", "distances"],
+            )
+        except Exception as e:
+            logger.debug(f"Semantic cache lookup failed: {e}")
+            return None
+
+        if not results["metadatas"] or not results["metadatas"][0]:
+            return None
+        now = time.time()
+        response = None
+        expired = []
+        # Nearest first: the first fresh entry above the threshold wins
+        for entry_id, meta, distance in zip(
+            results["ids"][0], results["metadatas"][0], results["distances"][0],
+        ):
+            if now - meta.get("created_at", 0) > self.TTL_SECONDS:
+                expired.append(entry_id)
+            elif response is None and 1.0 - distance >= self.SIMILARITY_THRESHOLD:
+                response = meta.get("response")
+        if expired:
+            try:
+                collection.delete(ids=expired)
+            except Exception as e:
+                logger.debug(f"Failed to delete expired semantic cache entries: {e}")
+        return response
+
+    def _get_collection(self):
+        if self._collection is None:
+            self._collection = vector_store.get_collection(self.COLLECTION)
+        return self._collection
+
+
+def fingerprint(text: str) -> str:
+    """Digest of a full input (transcript, chunk, context) for a context_key."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _hash(*parts: str) -> str:
+    h = hashlib.sha1()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+# Module-level singleton
+semantic_cache = SemanticCache()
@@ -0,0 +1,37 @@
+"""
+Shared decoding of LLM JSON responses.
+
+Models asked for "JSON only" still wrap it in a markdown fence now and then
+(```json ... ``` or ~~~ ... ~~~); the fence is stripped in one regex pass
+before decoding.
+"""
+
+import re
+
+import orjson
+
+_FENCE_RE = re.compile(
+    r"^\s*(?:(?:```|~~~)[\w+-]*[ \t]*\n)?(.*?)(?:\n?(?:```|~~~))?\s*$",
+    re.DOTALL,
+)
+
+
+# Unfenced responses (the common case with JSON mode) skip the fence regex
+_BARE_JSON_RE = re.compile(r"\s*[\[{]")
+
+
+def parse_json(raw: str) -> dict:
+    """Decode an LLM response, tolerating a surrounding markdown fence."""
+    if _BARE_JSON_RE.match(raw):
+        return orjson.loads(raw)
+    m = _FENCE_RE.match(raw)
+    return orjson.loads(m.group(1) if m else raw)
+
+
+def is_valid_json(raw: str) -> bool:
+    """Whether parse_json() would decode `raw`."""
+    try:
+        parse_json(raw)
+    except (orjson.JSONDecodeError, ValueError):
+        return False
+    return True
@@ -1,33 +1,47 @@
 """
 PostMeetingPipeline — orchestrates LLM analysis after a recording stops.
 
-Loads transcript segments, runs LLM calls sequentially, detects connections,
+Loads transcript segments, runs LLM calls concurrently, detects connections,
 generates insights, stores embeddings in ChromaDB, persists structured results,
 and records learning signals to the memory store.
+
+process_many() backfills several meetings, sending their core extraction
+prompts through the provider's batch API.
 """
 
-import json
+import asyncio
+import bisect
+import io
+import itertools
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Sequence
+
+import numpy as np
+import orjson
+from sqlalchemy.orm import joinedload
 
 from backend.config.settings import settings
 from backend.storage.database import get_db
 from backend.models.meeting import (
     Meeting, MeetingStatus, TranscriptSegment,
-    MeetingAnalysis, ActionItem, AnalysisDecision, TopicSegment,
+    MeetingAnalysis, ActionItem, AnalysisDecision, TopicSegment, generate_id,
 )
 from backend.intelligence.llm import llm_client, LLMError
+from backend.intelligence.llm_cache import fingerprint, semantic_cache
+from backend.intelligence.parsing import is_valid_json, parse_json
+from backend.intelligence.streaming import StreamingJSONParser
 from backend.intelligence.prompts import (
     SYSTEM_PROMPT,
-    EXECUTIVE_SUMMARY_PROMPT,
-    ACTION_ITEMS_PROMPT,
-    DECISIONS_PROMPT,
-    TOPIC_SEGMENTATION_PROMPT,
+    EXECUTIVE_SUMMARY_PARTS,
+    ACTION_ITEMS_PARTS,
+    DECISIONS_PARTS,
+    TOPIC_SEGMENTATION_PARTS,
 )
-from backend.intelligence.connections import detect_connections
-from backend.intelligence.insights import generate_insights
+from backend.intelligence.combined import analyze_meeting, PipelineFlags
+from backend.intelligence.context import kg_snapshot
 from backend.storage.vector_store import vector_store
 from backend.learning.memory import memory as mem_store, SignalType
 
@@ -36,49 +50,53 @@ logger = logging.getLogger(__name__)
 # Approximate token limit for transcript before chunking (chars, ~4 chars/token)
 MAX_TRANSCRIPT_CHARS = 60_000
 
+# Sliding-window chunking of long transcripts: window K, stride S = 0.75K
+CHUNK_WINDOW_CHARS = MAX_TRANSCRIPT_CHARS
+CHUNK_STRIDE_CHARS = int(0.75 * CHUNK_WINDOW_CHARS)
+
+# Upper bound on in-flight LLM requests per pipeline run (provider rate limits)
+MAX_CONCURRENT_LLM_CALLS = 4
+
+# Seconds to wait for background embedding writes before giving up on them
+EMBED_TIMEOUT = 300.0
+
+# Leading transcript chars embedded as the semantic-cache key (as in combined analysis)
+CACHE_KEY_CHARS = 2000
+
+_embed_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="embed")
+
 
 class PipelineError(Exception):
     pass
 
 
 def _format_transcript(segments: list) -> str:
-    lines = []
+    buf = io.StringIO()
+    write = buf.write
+    line = "[%0.1fs - %0.1fs] %s: %s"
     for seg in segments:
-        speaker = "Unknown"
-        if seg.speaker:
-            speaker = seg.speaker.name or seg.speaker.label
-        timestamp = f"[{seg.start_time:.1f}s - {seg.end_time:.1f}s]"
-        lines.append(f"{timestamp} {speaker}: {seg.text}")
-    return "\n".join(lines)
-
-
-def _parse_json(raw: str) -> dict:
-    raw = raw.strip()
-    # Strip markdown fences if present
-    if raw.startswith("```"):
-        first_newline = raw.index("\n")
-        last_fence = raw.rfind("```")
-        if last_fence > first_newline:
-            raw = raw[first_newline + 1:last_fence].strip()
-    return json.loads(raw)
+        sp = seg.speaker
+        speaker = (sp.name or sp.label) if sp else "Unknown"
+        write(line % (seg.start_time, seg.end_time, speaker, seg.text))
+        # Separator before every line but the first, so no trailing newline
+        line = "\n[%0.1fs - %0.1fs] %s: %s"
+    return buf.getvalue()
 
 
 def _compute_confidence(
-    transcript_segments: list,
+    confidences: np.ndarray,
+    low_conf_mask: np.ndarray,
     llm_response: dict,
     item_key: Optional[str] = None,
 ) -> float:
-    if not transcript_segments:
+    """`confidences` and `low_conf_mask` hold one entry per transcript segment."""
+    if not confidences.size:
         return 0.0
 
     # Base confidence from transcript quality
-    avg_confidence = sum(
-        (s.confidence or 0.5) for s in transcript_segments
-    ) / len(transcript_segments)
+    avg_confidence = float(confidences.mean())
 
-    low_conf_ratio = sum(
-        1 for s in transcript_segments if s.is_low_confidence
-    ) / len(transcript_segments)
+    low_conf_ratio = np.count_nonzero(low_conf_mask) / low_conf_mask.size
 
     transcript_quality = avg_confidence * (1.0 - low_conf_ratio * 0.3)
 
@@ -96,60 +114,179 @@ def _chunk_transcript(transcript: str) -> list[str]:
     if len(transcript) <= MAX_TRANSCRIPT_CHARS:
         return [transcript]
 
-    chunks = []
     lines = transcript.split("\n")
-    current_chunk: list[str] = []
-    current_len = 0
-
-    for line in lines:
-        if current_len + len(line) > MAX_TRANSCRIPT_CHARS and current_chunk:
-            chunks.append("\n".join(current_chunk))
-            # Keep last few lines for context overlap
-            overlap = current_chunk[-5:]
-            current_chunk = overlap
-            current_len = sum(len(l) for l in overlap)
-        current_chunk.append(line)
-        current_len += len(line)
-
-    if current_chunk:
-        chunks.append("\n".join(current_chunk))
+    # bounds[i] is the offset where line i starts; bounds[-1] is the total length
+    bounds = [0, *itertools.accumulate(len(line) + 1 for line in lines)]
+
+    chunks = []
+    start = 0
+    while True:
+        # Longest run of whole lines that fits in the window (at least one line)
+        end = bisect.bisect_right(bounds, bounds[start] + CHUNK_WINDOW_CHARS) - 1
+        end = max(end, start + 1)
+        chunks.append("\n".join(lines[start:end]))
+        if end >= len(lines):
+            break
+        # Slide by the stride; the last (window - stride) chars are shared as overlap
+        next_start = bisect.bisect_left(bounds, bounds[start] + CHUNK_STRIDE_CHARS)
+        start = min(max(next_start, start + 1), end)
 
     return chunks
 
 
+async def _astream_json(
+    kind: str,
+    parts: tuple[str, str],
+    transcript: str,
+    key_embedding: Optional[Sequence[float]] = None,
+    bypass: bool = False,
+) -> tuple[StreamingJSONParser, dict[str, list]]:
+    """
+    Stream a response through StreamingJSONParser, so array items are parsed
+    while the model is still generating. Returns the parser (its .text is the
+    full response) and the streamed items by array key.
+
+    Calls go through the semantic cache, keyed per `kind` by the start of the
+    transcript. The static prompt parts and a fingerprint of the full
+    transcript are the exact-match context: the embedding only narrows
+    candidates, so a transcript with a similar opening (or an edited one)
+    never reuses another response, and a prompt change invalidates old
+    entries. `bypass` forces a fresh call.
+    """
+    prefix, suffix = parts
+    parser = StreamingJSONParser()
+    items: dict[str, list] = {}
+    deltas = semantic_cache.agenerate_stream(
+        kind,
+        prefix + transcript + suffix,
+        SYSTEM_PROMPT,
+        cache_key_text=transcript[:CACHE_KEY_CHARS],
+        cache_key_embedding=key_embedding,
+        context_key=prefix + suffix + fingerprint(transcript),
+        bypass=bypass,
+        validate=is_valid_json,
+    )
+    async for delta in deltas:
+        for key, item in parser.feed(delta):
+            items.setdefault(key, []).append(item)
+    return parser, items
+
+
+async def _astream_array(
+    key: str,
+    parts: tuple[str, str],
+    transcript: str,
+    key_embedding: Optional[Sequence[float]] = None,
+    bypass: bool = False,
+) -> dict:
+    """Run an extraction whose response is {key: [...]}; items already parsed survive a broken tail."""
+    parser, items = await _astream_json(key, parts, transcript, key_embedding, bypass)
+    return _parse_array(parser.text, key, items.get(key, []))
+
+
+def _parse_summary(raw: str) -> dict:
+    try:
+        return parse_json(raw)
+    except (orjson.JSONDecodeError, ValueError) as e:
+        logger.error(f"Failed to parse summary response: {e}")
+        return {"summary": raw, "meeting_type": "general", "sentiment": "neutral"}
+
+
+def _parse_array(raw: str, key: str, streamed: Optional[list] = None) -> dict:
+    try:
+        return parse_json(raw)
+    except (orjson.JSONDecodeError, ValueError) as e:
+        streamed = streamed or []
+        logger.error(f"Failed to parse {key} response ({len(streamed)} items streamed): {e}")
+        return {key: streamed}
+
+
+# Extraction results per response key, and the identity used to drop the
+# duplicates that overlapping chunks produce
+_EXTRACTIONS = {
+    "action_items": (ACTION_ITEMS_PARTS, lambda a: (a.get("owner"), a.get("description"))),
+    "decisions": (DECISIONS_PARTS, lambda d: d.get("description")),
+    "topics": (TOPIC_SEGMENTATION_PARTS, lambda t: (t.get("title") or "").casefold()),
+}
+
+
+def _merge_chunk_results(key: str, results: list[dict]) -> dict:
+    """Union per-chunk extraction results, first occurrence wins; topics are put in time order."""
+    if len(results) == 1:
+        return results[0]
+    identity = _EXTRACTIONS[key][1]
+    merged = {}
+    for result in results:
+        for item in result.get(key, []):
+            if isinstance(item, dict):
+                merged.setdefault(identity(item), item)
+    items = list(merged.values())
+    if key == "topics":
+        items.sort(key=lambda t: t.get("start_time") or 0.0)
+        # Indices were relative to each chunk's own topic list
+        for topic in items:
+            topic.pop("related_topic_indices", None)
+    return {key: items}
+
+
+def _core_prompts(chunks: list[str]) -> dict[str, str]:
+    """
+    Prompts for the core extraction calls, keyed "summary" (last chunk, most
+    likely to have conclusions) and "<result key>:<chunk index>".
+    """
+    prefix, suffix = EXECUTIVE_SUMMARY_PARTS
+    prompts = {"summary": prefix + chunks[-1] + suffix}
+    for key, ((prefix, suffix), _) in _EXTRACTIONS.items():
+        for i, chunk in enumerate(chunks):
+            prompts[f"{key}:{i}"] = prefix + chunk + suffix
+    return prompts
+
+
 class PostMeetingPipeline:
 
-    def process(self, meeting_id: str) -> Optional[str]:
+    def process(
+        self,
+        meeting_id: str,
+        core_results: Optional[tuple[dict, dict, dict, dict]] = None,
+    ) -> Optional[str]:
         """
         Run full post-meeting analysis. Returns the MeetingAnalysis ID on success.
         Sets meeting status to 'processing' at start, 'complete' on success, 'failed' on error.
+
+        `core_results` are precomputed (summary, actions, decisions, topics)
+        results, as produced by process_many(); when given, the four core
+        extraction calls are skipped.
         """
         start_time = time.time()
         logger.info(f"Pipeline starting for meeting: {meeting_id}")
 
-        # Set status to processing
-        with get_db() as db:
-            meeting = db.get(Meeting, meeting_id)
-            if not meeting:
-                raise PipelineError(f"Meeting not found: {meeting_id}")
-            meeting.status = MeetingStatus.processing
-
         try:
-            # Load transcript segments
+            # Set status to processing and load transcript segments in one transaction
             with get_db() as db:
+                meeting = db.get(Meeting, meeting_id)
+                if not meeting:
+                    raise PipelineError(f"Meeting not found: {meeting_id}")
+                meeting.status = MeetingStatus.processing
+                db.flush()
+                # Re-processing must not be served from the cache
+                reprocess = (
+                    db.query(MeetingAnalysis.id)
+                    .filter(MeetingAnalysis.meeting_id == meeting_id)
+                    .first()
+                ) is not None
+
+                # Speakers arrive in the same JOINed query (no per-segment lazy load)
                 segments = (
                     db.query(TranscriptSegment)
+                    .options(joinedload(TranscriptSegment.speaker))
                     .filter(TranscriptSegment.meeting_id == meeting_id)
                     .order_by(TranscriptSegment.start_time)
                     .all()
                 )
-                # Eagerly load speaker relationships
-                for seg in segments:
-                    _ = seg.speaker
 
                 if not segments:
                     logger.warning(f"No transcript segments for meeting: {meeting_id}")
-                    self._set_status(meeting_id, MeetingStatus.complete)
+                    meeting.status = MeetingStatus.complete
                     return None
 
                 transcript = _format_transcript(segments)
@@ -167,49 +304,51 @@ class PostMeetingPipeline:
                     for seg in segments
                 ]
 
+                # Plain arrays so confidence can be computed outside the session
+                confidences = np.fromiter(
+                    (seg.confidence or 0.5 for seg in segments),
+                    dtype=np.float32, count=len(segments),
+                )
+                low_conf_mask = np.fromiter(
+                    (bool(seg.is_low_confidence) for seg in segments),
+                    dtype=bool, count=len(segments),
+                )
+
             logger.info(
                 f"Loaded {segment_count} segments, "
                 f"{len(transcript)} chars of transcript"
             )
 
-            # Handle long transcripts by chunking
-            chunks = _chunk_transcript(transcript)
-            if len(chunks) > 1:
-                logger.info(f"Transcript split into {len(chunks)} chunks")
-
-            # Use last chunk for summary (most likely to have conclusions)
-            # Use full transcript for extraction tasks
-            summary_transcript = chunks[-1] if len(chunks) > 1 else transcript
-
-            # Phase 1: Core analysis (LLM calls)
-            summary_data = self._run_summary(summary_transcript)
-            actions_data = self._run_action_items(transcript)
-            decisions_data = self._run_decisions(transcript)
-            topics_data = self._run_topics(transcript)
-
-            # Phase 2: Store embeddings in ChromaDB
-            self._store_embeddings(meeting_id, segment_dicts, summary_data, topics_data)
-
-            # Phase 3: Connection detection (uses ChromaDB + knowledge graph)
-            connections_data = self._run_connections(meeting_id, transcript)
-
-            # Phase 4: Insight generation (uses connections + knowledge graph)
-            insights_data = self._run_insights(
-                meeting_id, transcript,
-                summary_data.get("summary", ""),
-                connections_data,
+            # Phase 1: Core analysis (LLM calls, run concurrently)
+            if core_results is None:
+                core_results = asyncio.run(self._run_core_analysis(transcript, bypass=reprocess))
+            summary_data, actions_data, decisions_data, topics_data = core_results
+
+            # Snapshot the knowledge stores before this meeting's own
+            # summaries land in ChromaDB
+            flags = PipelineFlags.detect()
+
+            # Phase 2: Store embeddings in ChromaDB, off the critical path —
+            # analysis excludes this meeting from its searches anyway
+            embed_future = _embed_executor.submit(
+                self._store_embeddings, meeting_id, segment_dicts, summary_data, topics_data,
+            )
+
+            # Phase 3: Connection detection + insight generation in one LLM
+            # call (uses ChromaDB + knowledge graph)
+            connections_data, insights_data = self._run_analysis(
+                meeting_id, transcript, summary_data.get("summary", ""), flags, bypass=reprocess,
             )
 
             # Compute overall confidence
-            with get_db() as db:
-                segments_for_conf = (
-                    db.query(TranscriptSegment)
-                    .filter(TranscriptSegment.meeting_id == meeting_id)
-                    .all()
-                )
-                overall_confidence = _compute_confidence(
-                    segments_for_conf, summary_data
-                )
+            overall_confidence = _compute_confidence(confidences, low_conf_mask, summary_data)
+
+            # Embedding writes should land before the meeting is marked complete;
+            # like before, a failed write is logged but not fatal
+            try:
+                embed_future.result(timeout=EMBED_TIMEOUT)
+            except FuturesTimeoutError:
+                logger.warning(f"Embedding writes still running after {EMBED_TIMEOUT:.0f}s")
 
             processing_duration = time.time() - start_time
 
@@ -260,52 +399,147 @@ class PostMeetingPipeline:
             )
             return analysis_id
 
+        except PipelineError:
+            # Meeting not found: there is no status to mark failed
+            raise
         except Exception as e:
             logger.error(f"Pipeline failed for meeting {meeting_id}: {e}")
             self._set_status(meeting_id, MeetingStatus.failed)
             raise
 
-    def _run_summary(self, transcript: str) -> dict:
-        prompt = EXECUTIVE_SUMMARY_PROMPT.format(transcript=transcript)
-        raw = llm_client.generate(prompt, SYSTEM_PROMPT)
-        try:
-            return _parse_json(raw)
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.error(f"Failed to parse summary response: {e}")
-            return {"summary": raw, "meeting_type": "general", "sentiment": "neutral"}
-
-    def _run_action_items(self, transcript: str) -> dict:
-        prompt = ACTION_ITEMS_PROMPT.format(transcript=transcript)
-        raw = llm_client.generate(prompt, SYSTEM_PROMPT)
-        try:
-            return _parse_json(raw)
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.error(f"Failed to parse action items response: {e}")
-            return {"action_items": []}
-
-    def _run_decisions(self, transcript: str) -> dict:
-        prompt = DECISIONS_PROMPT.format(transcript=transcript)
-        raw = llm_client.generate(prompt, SYSTEM_PROMPT)
+    def process_many(self, meeting_ids: list[str]) -> dict[str, Optional[str]]:
+        """
+        Backfill analysis for several meetings at once. The four core
+        extraction prompts of every meeting go out as one provider batch
+        (half price, separate rate limits, but up to 24h latency); the rest
+        of the pipeline then runs per meeting. Use process() for a meeting
+        someone is waiting on.
+
+        Returns {meeting_id: analysis_id}. Falls back to process() when only
+        one meeting is given, no batch-capable provider is configured, or a
+        meeting's batch results are incomplete.
+        """
+        if len(meeting_ids) < 2:
+            return {mid: self.process(mid) for mid in meeting_ids}
+
+        requests = {}
+        chunk_counts = {}
+        for meeting_id in meeting_ids:
+            transcript = self._load_transcript(meeting_id)
+            if not transcript:
+                continue
+            chunks = _chunk_transcript(transcript)
+            chunk_counts[meeting_id] = len(chunks)
+            for name, prompt in _core_prompts(chunks).items():
+                requests[f"{meeting_id}:{name}"] = (prompt, SYSTEM_PROMPT)
+
         try:
-            return _parse_json(raw)
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.error(f"Failed to parse decisions response: {e}")
-            return {"decisions": []}
-
-    def _run_topics(self, transcript: str) -> dict:
-        prompt = TOPIC_SEGMENTATION_PROMPT.format(transcript=transcript)
-        raw = llm_client.generate(prompt, SYSTEM_PROMPT)
+            responses = llm_client.generate_batch(requests)
+        except LLMError as e:
+            logger.warning(f"Batch submission unavailable, processing meetings one by one: {e}")
+            responses = {}
+
+        results = {}
+        for meeting_id in meeting_ids:
+            names = [f"{meeting_id}:summary"] + [
+                f"{meeting_id}:{key}:{i}"
+                for key in _EXTRACTIONS for i in range(chunk_counts.get(meeting_id, 0))
+            ]
+            core_results = None
+            if meeting_id in chunk_counts and all(name in responses for name in names):
+                n = chunk_counts[meeting_id]
+                core_results = (
+                    _parse_summary(responses[f"{meeting_id}:summary"]),
+                    *(
+                        _merge_chunk_results(key, [
+                            _parse_array(responses[f"{meeting_id}:{key}:{i}"], key) for i in range(n)
+                        ])
+                        for key in _EXTRACTIONS
+                    ),
+                )
+            try:
+                results[meeting_id] = self.process(meeting_id, core_results)
+            except Exception:
+                # Already logged and marked failed; keep going with the rest
+                results[meeting_id] = None
+        return results
+
+    def _load_transcript(self, meeting_id: str) -> str:
+        with get_db() as db:
+            segments = (
+                db.query(TranscriptSegment)
+                .options(joinedload(TranscriptSegment.speaker))
+                .filter(TranscriptSegment.meeting_id == meeting_id)
+                .order_by(TranscriptSegment.start_time)
+                .all()
+            )
+            return _format_transcript(segments) if segments else ""
+
+    async def _run_core_analysis(self, transcript: str, bypass: bool = False) -> tuple[dict, dict, dict, dict]:
+        """
+        The extraction calls share no data, so they run concurrently. Long
+        transcripts are chunked: action items, decisions and topics are
+        extracted from every chunk in parallel and merged; the summary uses
+        the last chunk. `bypass` skips the semantic cache.
+        """
+        chunks = _chunk_transcript(transcript)
+        if len(chunks) > 1:
+            logger.info(f"Transcript split into {len(chunks)} chunks")
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+
+        async def _bounded(coro):
+            async with semaphore:
+                return await coro
+
+        # Semantic-cache keys, embedded once in a single call
+        embeddings = [None] * len(chunks)
         try:
-            return _parse_json(raw)
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.error(f"Failed to parse topics response: {e}")
-            return {"topics": []}
+            embedded = await asyncio.to_thread(
+                vector_store.embed, [chunk[:CACHE_KEY_CHARS] for chunk in chunks],
+            )
+            if embedded:
+                embeddings = embedded
+        except Exception as e:
+            logger.debug(f"Cache key embedding failed, cache will embed per call: {e}")
+
+        async def _extract(key: str) -> dict:
+            parts = _EXTRACTIONS[key][0]
+            results = await asyncio.gather(*(
+                _bounded(_astream_array(key, parts, chunk, embedding, bypass))
+                for chunk, embedding in zip(chunks, embeddings)
+            ))
+            return _merge_chunk_results(key, results)
 
-    def _run_connections(self, meeting_id: str, transcript: str) -> dict:
         try:
-            return detect_connections(meeting_id, transcript)
+            return tuple(await asyncio.gather(
+                _bounded(self._run_summary(chunks[-1], embeddings[-1], bypass)),
+                _extract("action_items"),
+                _extract("decisions"),
+                _extract("topics"),
+            ))
+        finally:
+            # The event loop is per-run; don't leave its connection pool behind
+            await llm_client.aclose()
+
+    async def _run_summary(self, transcript: str, key_embedding=None, bypass: bool = False) -> dict:
+        parser, _ = await _astream_json("summary", EXECUTIVE_SUMMARY_PARTS, transcript, key_embedding, bypass)
+        return _parse_summary(parser.text)
+
+    def _run_analysis(
+        self,
+        meeting_id: str,
+        transcript: str,
+        summary: str,
+        flags: PipelineFlags,
+        bypass: bool = False,
+    ) -> tuple[dict, list[dict]]:
+        try:
+            # Entity lists are shared by the connection and insight helpers
+            with kg_snapshot():
+                result = analyze_meeting(meeting_id, transcript, summary, flags=flags, bypass=bypass)
+            return result["connections"], result["insights"]
         except Exception as e:
-            logger.error(f"Connection detection failed: {e}")
+            logger.error(f"Connection/insight analysis failed: {e}")
             return {
                 "people_referenced": [],
                 "projects_referenced": [],
@@ -313,20 +547,7 @@ class PostMeetingPipeline:
                 "past_meeting_links": [],
                 "contradictions": [],
                 "open_threads": [],
-            }
-
-    def _run_insights(
-        self,
-        meeting_id: str,
-        transcript: str,
-        summary: str,
-        connections: dict,
-    ) -> list[dict]:
-        try:
-            return generate_insights(meeting_id, transcript, summary, connections)
-        except Exception as e:
-            logger.error(f"Insight generation failed: {e}")
-            return []
+            }, []
 
     def _store_embeddings(
         self,
@@ -340,24 +561,21 @@ class PostMeetingPipeline:
             # Store transcript segments
             vector_store.add_segments(meeting_id, segment_dicts)
 
-            # Store executive summary
-            summary_text = summary_data.get("summary", "")
-            if summary_text:
-                vector_store.add_summary(
-                    meeting_id, "executive", summary_text,
-                    metadata={
-                        "meeting_type": summary_data.get("meeting_type", "general"),
-                    },
-                )
-
-            # Store topic summaries
+            # Store executive + topic summaries in one batched write
+            summaries = [{
+                "summary_type": "executive",
+                "text": summary_data.get("summary", ""),
+                "metadata": {"meeting_type": summary_data.get("meeting_type", "general")},
+            }]
             for i, topic in enumerate(topics_data.get("topics", [])):
                 topic_text = f"{topic.get('title', '')}: {topic.get('summary', '')}"
                 if topic_text.strip(": "):
-                    vector_store.add_summary(
-                        meeting_id, f"topic_{i}", topic_text,
-                        metadata={"topic_title": topic.get("title", "")},
-                    )
+                    summaries.append({
+                        "summary_type": f"topic_{i}",
+                        "text": topic_text,
+                        "metadata": {"topic_title": topic.get("title", "")},
+                    })
+            vector_store.add_summaries(meeting_id, summaries)
 
             logger.info(f"Embeddings stored for meeting {meeting_id[:8]}")
         except Exception as e:
@@ -375,8 +593,78 @@ class PostMeetingPipeline:
         overall_confidence: float,
         processing_duration: float,
     ) -> str:
+        # Every row is built up front so the write transaction below holds
+        # SQLite's writer lock only for the statements themselves. Ids are
+        # generated here so no per-row RETURNING round-trip is needed.
+        analysis_id = generate_id()
+        analysis_row = {
+            "id": analysis_id,
+            "meeting_id": meeting_id,
+            "executive_summary": summary_data.get("summary", ""),
+            "meeting_type": summary_data.get("meeting_type", "general"),
+            "sentiment": summary_data.get("sentiment", "neutral"),
+            "overall_confidence": overall_confidence,
+            "llm_provider": llm_client.active_provider,
+            "processed_at": datetime.now(timezone.utc),
+            "processing_duration_seconds": processing_duration,
+            "connections_data": orjson.dumps(connections_data).decode(),
+            "insights_data": orjson.dumps(insights_data).decode(),
+        }
+
+        action_rows = [
+            {
+                "id": generate_id(),
+                "analysis_id": analysis_id,
+                "description": item.get("description", ""),
+                "owner": item.get("owner"),
+                "deadline": item.get("deadline"),
+                "priority": item.get("priority", "medium"),
+                "confidence": item.get("confidence", 0.5),
+                "source_quote": item.get("source_quote", ""),
+                "source_start_time": item.get("source_start_time"),
+                "source_end_time": item.get("source_end_time"),
+            }
+            for item in actions_data.get("action_items", [])
+        ]
+
+        # JSON columns are encoded in the comprehensions, so the row dicts are
+        # final before the transaction opens
+        decision_rows = [
+            {
+                "id": generate_id(),
+                "analysis_id": analysis_id,
+                "description": dec.get("description", ""),
+                "context": dec.get("context", ""),
+                "participants": orjson.dumps(dec["participants"]).decode() if dec.get("participants") else None,
+                "confidence": dec.get("confidence", 0.5),
+                "source_quote": dec.get("source_quote", ""),
+                "source_start_time": dec.get("source_start_time"),
+                "source_end_time": dec.get("source_end_time"),
+            }
+            for dec in decisions_data.get("decisions", [])
+        ]
+
+        topic_rows = [
+            {
+                "id": generate_id(),
+                "analysis_id": analysis_id,
+                "title": topic.get("title", ""),
+                "summary": topic.get("summary", ""),
+                "start_time": topic.get("start_time", 0.0),
+                "end_time": topic.get("end_time", 0.0),
+                "order_index": i,
+                "confidence": topic.get("confidence", 0.5),
+                "related_segment_ids": (
+                    orjson.dumps(topic["related_topic_indices"]).decode()
+                    if topic.get("related_topic_indices") else None
+                ),
+            }
+            for i, topic in enumerate(topics_data.get("topics", []))
+        ]
+
         with get_db() as db:
-            # Delete any existing analysis for this meeting
+            # Delete any existing analysis for this meeting (ORM delete, so
+            # its children cascade)
             existing = (
                 db.query(MeetingAnalysis)
                 .filter(MeetingAnalysis.meeting_id == meeting_id)
@@ -386,65 +674,16 @@ class PostMeetingPipeline:
                 db.delete(existing)
                 db.flush()
 
-            analysis = MeetingAnalysis(
-                meeting_id=meeting_id,
-                executive_summary=summary_data.get("summary", ""),
-                meeting_type=summary_data.get("meeting_type", "general"),
-                sentiment=summary_data.get("sentiment", "neutral"),
-                overall_confidence=overall_confidence,
-                llm_provider=llm_client.active_provider,
-                processed_at=datetime.now(timezone.utc),
-                processing_duration_seconds=processing_duration,
-                connections_data=json.dumps(connections_data),
-                insights_data=json.dumps(insights_data),
-            )
-            db.add(analysis)
-            db.flush()
-            analysis_id = analysis.id
-
-            # Action items
-            for item in actions_data.get("action_items", []):
-                db.add(ActionItem(
-                    analysis_id=analysis_id,
-                    description=item.get("description", ""),
-                    owner=item.get("owner"),
-                    deadline=item.get("deadline"),
-                    priority=item.get("priority", "medium"),
-                    confidence=item.get("confidence", 0.5),
-                    source_quote=item.get("source_quote", ""),
-                    source_start_time=item.get("source_start_time"),
-                    source_end_time=item.get("source_end_time"),
-                ))
-
-            # Decisions
-            for dec in decisions_data.get("decisions", []):
-                participants = dec.get("participants", [])
-                db.add(AnalysisDecision(
-                    analysis_id=analysis_id,
-                    description=dec.get("description", ""),
-                    context=dec.get("context", ""),
-                    participants=json.dumps(participants) if participants else None,
-                    confidence=dec.get("confidence", 0.5),
-                    source_quote=dec.get("source_quote", ""),
-                    source_start_time=dec.get("source_start_time"),
-                    source_end_time=dec.get("source_end_time"),
-                ))
-
-            # Topics
-            for i, topic in enumerate(topics_data.get("topics", [])):
-                related = topic.get("related_topic_indices", [])
-                db.add(TopicSegment(
-                    analysis_id=analysis_id,
-                    title=topic.get("title", ""),
-                    summary=topic.get("summary", ""),
-                    start_time=topic.get("start_time", 0.0),
-                    end_time=topic.get("end_time", 0.0),
-                    order_index=i,
-                    confidence=topic.get("confidence", 0.5),
-                    related_segment_ids=json.dumps(related) if related else None,
-                ))
+            # One executemany INSERT per table
+            db.bulk_insert_mappings(MeetingAnalysis, [analysis_row])
+            if action_rows:
+                db.bulk_insert_mappings(ActionItem, action_rows)
+            if decision_rows:
+                db.bulk_insert_mappings(AnalysisDecision, decision_rows)
+            if topic_rows:
+                db.bulk_insert_mappings(TopicSegment, topic_rows)
 
-            return analysis_id
+        return analysis_id
 
     def _record_learning_signals(
         self,
@@ -454,31 +693,27 @@ class PostMeetingPipeline:
         topics_data: dict,
     ):
         try:
-            # Extract person names from action items and decisions
-            people = set()
-            for item in actions_data.get("action_items", []):
-                if item.get("owner"):
-                    people.add(item["owner"])
-            for dec in decisions_data.get("decisions", []):
-                for p in dec.get("participants", []):
-                    people.add(p)
-
-            for person in people:
-                mem_store.record_person(
-                    name=person,
-                    context="Mentioned in meeting analysis",
-                    meeting_id=meeting_id,
-                )
+            # Person names from action items and decisions, deduped in
+            # first-seen order
+            people = dict.fromkeys(itertools.chain(
+                (item["owner"] for item in actions_data.get("action_items", []) if item.get("owner")),
+                (p for dec in decisions_data.get("decisions", []) for p in dec.get("participants", [])),
+            ))
+            topic_titles = dict.fromkeys(
+                t["title"] for t in topics_data.get("topics", []) if t.get("title")
+            )
 
-            # Record topic vocabulary
-            for topic in topics_data.get("topics", []):
-                title = topic.get("title", "")
-                if title:
-                    mem_store.record_vocabulary(
-                        term=title,
-                        context="Meeting topic",
-                        meeting_id=meeting_id,
-                    )
+            # One memory-file append per kind
+            mem_store.record_people_bulk(
+                list(people),
+                context="Mentioned in meeting analysis",
+                meeting_id=meeting_id,
+            )
+            mem_store.record_vocabulary_bulk(
+                list(topic_titles),
+                context="Meeting topic",
+                meeting_id=meeting_id,
+            )
 
         except Exception as e:
             # Learning signals are non-critical — don't fail the pipeline
@@ -111,3 +111,23 @@ Rules:
 - Aim for natural topic boundaries, not arbitrary time splits
 - Set confidence between 0.0 and 1.0 based on how clear the topic boundary is
 - Each topic should span at least 30 seconds of discussion"""
+
+
+def _split(template: str) -> tuple[str, str]:
+    """
+    Pre-split a template at its single {transcript} field into an unescaped
+    (prefix, suffix), so callers concatenate instead of running str.format —
+    which also keeps braces in the transcript from being interpreted.
+    """
+    prefix, suffix = template.split("{transcript}")
+    return _unescape(prefix), _unescape(suffix)
+
+
+def _unescape(text: str) -> str:
+    return text.replace("{{", "{").replace("}}", "}")
+
+
+EXECUTIVE_SUMMARY_PARTS = _split(EXECUTIVE_SUMMARY_PROMPT)
+ACTION_ITEMS_PARTS = _split(ACTION_ITEMS_PROMPT)
+DECISIONS_PARTS = _split(DECISIONS_PROMPT)
+TOPIC_SEGMENTATION_PARTS = _split(TOPIC_SEGMENTATION_PROMPT)
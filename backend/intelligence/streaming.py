@@ -0,0 +1,103 @@
+"""
+Incremental JSON parsing for streamed LLM responses.
+
+LLM responses are a single JSON object whose interesting parts are arrays of
+items (key_context, action_items, ...). StreamingJSONParser is fed text deltas
+as they arrive and emits each array element as soon as it is complete, so
+callers can surface results before generation finishes.
+
+Anything before the first "{" (e.g. a markdown fence) is ignored. A malformed
+element is logged and skipped; callers still parse the full text afterwards.
+"""
+
+import logging
+from typing import Any, Iterable, Iterator
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingJSONParser:
+    """Emits (array_key, item) pairs for elements of top-level arrays as they close."""
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_string = ""
+        self._current_key = ""
+        self._array_key = ""
+        self._item_start = -1
+
+    def feed(self, delta: str) -> list[tuple[str, Any]]:
+        """Consume a text delta and return any array items completed by it."""
+        self._text += delta
+        items = []
+        text = self._text
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = text[self._string_start + 1:i]
+                continue
+
+            if self._depth == 0 and ch != "{":
+                continue  # Preamble (markdown fence, prose)
+
+            if self._depth == 2 and self._array_key and self._item_start < 0 and ch not in " \t\r\n,]":
+                self._item_start = i
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch == ":" and self._depth == 1:
+                self._current_key = self._last_string
+            elif ch in "{[":
+                if self._depth == 1 and ch == "[":
+                    self._array_key = self._current_key
+                self._depth += 1
+            elif ch in "}]":
+                if self._depth == 2 and self._array_key:
+                    self._emit(text, i, items)
+                    if ch == "]":
+                        self._array_key = ""
+                self._depth -= 1
+            elif ch == "," and self._depth == 2 and self._array_key:
+                self._emit(text, i, items)
+
+        self._pos = len(text)
+        return items
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return self._text
+
+    def _emit(self, text: str, end: int, items: list):
+        if self._item_start < 0:
+            return
+        raw = text[self._item_start:end].strip()
+        self._item_start = -1
+        if not raw:
+            return
+        try:
+            items.append((self._array_key, orjson.loads(raw)))
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Skipping malformed {self._array_key} item in streamed response: {e}")
+
+
+def iter_array_items(deltas: Iterable[str], parser: StreamingJSONParser) -> Iterator[tuple[str, Any]]:
+    """Feed `deltas` through `parser`, yielding completed array items as they appear."""
+    for delta in deltas:
+        yield from parser.feed(delta)
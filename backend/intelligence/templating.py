@@ -0,0 +1,68 @@
+"""
+Append-only prompt building.
+
+str.format on a multi-KB template allocates the sliced transcript, every
+formatted field and then the final string. Templates are instead compiled once
+into a list of static parts and named slots; render() writes statics and
+(optionally capped) slot values straight into a StringIO buffer.
+
+Only plain "{name}" fields are supported — no conversions or format specs.
+Literal braces are written "{{" / "}}" as with str.format.
+"""
+
+import io
+import logging
+import string
+import tracemalloc
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Statics are str, slots are their field name wrapped in a 1-tuple
+Template = list[Union[str, tuple[str]]]
+
+
+def compile_template(template: str) -> Template:
+    """Split a str.format-style template into static parts and slots."""
+    parts: Template = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append(literal)
+        if field is not None:
+            if not field or spec or conversion:
+                raise ValueError(f"Unsupported template field: {{{field}}}")
+            parts.append((field,))
+    return parts
+
+
+def render(
+    template: Template,
+    values: dict[str, str],
+    limits: Optional[dict[str, int]] = None,
+) -> str:
+    """
+    Write `template` into a single buffer, filling slots from `values`.
+
+    `limits` caps individual slots (like value[:limit]); a value already within
+    its cap is written as-is without a copy.
+    """
+    limits = limits or {}
+    buf = io.StringIO()
+    for part in template:
+        if isinstance(part, str):
+            buf.write(part)
+            continue
+        name = part[0]
+        value = values[name]
+        limit = limits.get(name)
+        if limit is not None and len(value) > limit:
+            value = value[:limit]
+        buf.write(value)
+
+    prompt = buf.getvalue()
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        logger.debug(f"Rendered prompt: {len(prompt)} chars, traced memory {current}/{peak} bytes")
+    else:
+        logger.debug(f"Rendered prompt: {len(prompt)} chars")
+    return prompt
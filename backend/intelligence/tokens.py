@@ -0,0 +1,45 @@
+"""
+Token-accurate prompt truncation.
+
+Capping by characters is wrong in both directions: ASCII transcripts leave
+most of the model's context unused, while CJK text overflows it. Text is
+instead truncated by tokens with tiktoken's cl100k_base encoding — close
+enough to the llama/Claude/GPT tokenizers for a length guard.
+
+Falls back to ~CHARS_PER_TOKEN characters per token when tiktoken (or its
+encoding files) is unavailable.
+"""
+
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=4)
+def _get_encoding(name: str):
+    try:
+        import tiktoken
+        return tiktoken.get_encoding(name)
+    except Exception as e:
+        logger.warning(f"tiktoken unavailable, truncating by characters: {e}")
+        return None
+
+
+def truncate_to_tokens(text: str, n: int, encoding: str = "cl100k_base") -> str:
+    """Return the longest prefix of `text` that fits in `n` tokens."""
+    # Every token covers at least one UTF-8 byte, so short ASCII text always fits
+    if len(text) <= n and text.isascii():
+        return text
+
+    enc = _get_encoding(encoding)
+    if enc is None:
+        return text[:n * CHARS_PER_TOKEN]
+
+    tokens = enc.encode(text, disallowed_special=())
+    if len(tokens) <= n:
+        return text
+    return enc.decode(tokens[:n])
+
@@ -6,9 +6,12 @@ relational DB and the graph stay consistent.
 """
 
 import logging
+import threading
 from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy import func, insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from backend.models.knowledge import (
@@ -16,10 +19,21 @@ from backend.models.knowledge import (
     PersonMeeting, ProjectMeeting, TopicMeeting,
     ProjectStatus, DecisionStatus, RelationType,
 )
+from backend.models.meeting import generate_id
 from backend.knowledge.graph import knowledge_graph as kg
 
 logger = logging.getLogger(__name__)
 
+# Rows per executemany INSERT in the bulk_create_* helpers
+BULK_INSERT_PAGE_SIZE = 1000
+
+# (table, case-folded name) -> id for the find_*_by_name lookups; a hit is one
+# primary-key get (often served from the session's identity map) instead of
+# an ILIKE scan. Entries are verified on use, so a stale one only costs a miss.
+NAME_CACHE_SIZE = 2048
+_name_to_id: dict[tuple[str, str], str] = {}
+_name_cache_lock = threading.Lock()
+
 
 # ── People ────────────────────────────────────────────────────────────────────
 
@@ -30,7 +44,12 @@ def create_person(
     organization: str = "",
     notes: str = "",
     speaker_id: Optional[str] = None,
+    defer_graph_sync: bool = False,
 ) -> Person:
+    """
+    Pass defer_graph_sync=True when creating many entities; the caller then
+    registers them with one kg.add_entities() call.
+    """
     person = Person(
         name=name,
         role=role or None,
@@ -40,15 +59,39 @@ def create_person(
     )
     db.add(person)
     db.flush()
-    kg.add_entity(person.id, "person", person.name)
+    if not defer_graph_sync:
+        kg.add_entity(person.id, "person", person.name)
+    _remember_name(Person, person.name, person.id)
     logger.info(f"Person created: {name} ({person.id[:8]})")
     return person
 
 
+def bulk_create_people(db: Session, rows: list[dict]) -> list[str]:
+    """
+    create_person() for many rows (dicts of its keyword arguments) in one
+    executemany INSERT and one graph save. Returns the new ids in row order.
+    """
+    ids = _bulk_insert(db, Person, [
+        {
+            "name": row["name"],
+            "role": row.get("role") or None,
+            "organization": row.get("organization") or None,
+            "notes": row.get("notes") or None,
+            "speaker_id": row.get("speaker_id"),
+        }
+        for row in rows
+    ])
+    kg.add_entities((pid, "person", row["name"]) for pid, row in zip(ids, rows))
+    logger.info(f"People created: {len(ids)}")
+    return ids
+
+
 def update_person(db: Session, person_id: str, **fields) -> Optional[Person]:
     person = db.get(Person, person_id)
     if not person:
         return None
+    if fields.get("name") is not None:
+        _forget_name(Person, person.name)
     for key, value in fields.items():
         if hasattr(person, key) and value is not None:
             setattr(person, key, value)
@@ -63,7 +106,12 @@ def get_person(db: Session, person_id: str) -> Optional[Person]:
 
 
 def find_person_by_name(db: Session, name: str) -> Optional[Person]:
-    return db.query(Person).filter(Person.name.ilike(name)).first()
+    return _find_by_name(db, Person, name)
+
+
+def find_people_by_names(db: Session, names: list[str]) -> dict[str, Person]:
+    """Batch find_person_by_name: one query, keyed by lower-cased name."""
+    return _find_by_names(db, Person, names)
 
 
 def list_people(db: Session, limit: int = 100, offset: int = 0) -> list[Person]:
@@ -79,18 +127,21 @@ def list_people(db: Session, limit: int = 100, offset: int = 0) -> list[Person]:
 def link_person_to_meeting(
     db: Session, person_id: str, meeting_id: str, role_in_meeting: str = "attendee"
 ):
-    existing = (
-        db.query(PersonMeeting)
-        .filter_by(person_id=person_id, meeting_id=meeting_id)
-        .first()
-    )
-    if not existing:
-        db.add(PersonMeeting(
-            person_id=person_id,
-            meeting_id=meeting_id,
-            role_in_meeting=role_in_meeting,
-        ))
-        db.flush()
+    _link_to_meeting(db, PersonMeeting, [{
+        "person_id": person_id,
+        "meeting_id": meeting_id,
+        "role_in_meeting": role_in_meeting,
+    }])
+
+
+def bulk_link_people_to_meeting(
+    db: Session, meeting_id: str, links: list[tuple[str, str]]
+):
+    """link_person_to_meeting() for many (person_id, role_in_meeting) pairs in one INSERT."""
+    _link_to_meeting(db, PersonMeeting, [
+        {"person_id": person_id, "meeting_id": meeting_id, "role_in_meeting": role}
+        for person_id, role in links
+    ])
 
 
 # ── Projects ──────────────────────────────────────────────────────────────────
@@ -100,6 +151,7 @@ def create_project(
     name: str,
     description: str = "",
     status: ProjectStatus = ProjectStatus.active,
+    defer_graph_sync: bool = False,
 ) -> Project:
     project = Project(
         name=name,
@@ -108,15 +160,34 @@ def create_project(
     )
     db.add(project)
     db.flush()
-    kg.add_entity(project.id, "project", project.name)
+    if not defer_graph_sync:
+        kg.add_entity(project.id, "project", project.name)
+    _remember_name(Project, project.name, project.id)
     logger.info(f"Project created: {name} ({project.id[:8]})")
     return project
 
 
+def bulk_create_projects(db: Session, rows: list[dict]) -> list[str]:
+    """create_project() for many rows; see bulk_create_people()."""
+    ids = _bulk_insert(db, Project, [
+        {
+            "name": row["name"],
+            "description": row.get("description") or None,
+            "status": row.get("status", ProjectStatus.active),
+        }
+        for row in rows
+    ])
+    kg.add_entities((pid, "project", row["name"]) for pid, row in zip(ids, rows))
+    logger.info(f"Projects created: {len(ids)}")
+    return ids
+
+
 def update_project(db: Session, project_id: str, **fields) -> Optional[Project]:
     project = db.get(Project, project_id)
     if not project:
         return None
+    if fields.get("name") is not None:
+        _forget_name(Project, project.name)
     for key, value in fields.items():
         if hasattr(project, key) and value is not None:
             setattr(project, key, value)
@@ -130,7 +201,12 @@ def get_project(db: Session, project_id: str) -> Optional[Project]:
 
 
 def find_project_by_name(db: Session, name: str) -> Optional[Project]:
-    return db.query(Project).filter(Project.name.ilike(name)).first()
+    return _find_by_name(db, Project, name)
+
+
+def find_projects_by_names(db: Session, names: list[str]) -> dict[str, Project]:
+    """Batch find_project_by_name: one query, keyed by lower-cased name."""
+    return _find_by_names(db, Project, names)
 
 
 def list_projects(db: Session, limit: int = 100, offset: int = 0) -> list[Project]:
@@ -144,14 +220,14 @@ def list_projects(db: Session, limit: int = 100, offset: int = 0) -> list[Projec
 
 
 def link_project_to_meeting(db: Session, project_id: str, meeting_id: str):
-    existing = (
-        db.query(ProjectMeeting)
-        .filter_by(project_id=project_id, meeting_id=meeting_id)
-        .first()
-    )
-    if not existing:
-        db.add(ProjectMeeting(project_id=project_id, meeting_id=meeting_id))
-        db.flush()
+    _link_to_meeting(db, ProjectMeeting, [{"project_id": project_id, "meeting_id": meeting_id}])
+
+
+def bulk_link_projects_to_meeting(db: Session, meeting_id: str, project_ids: list[str]):
+    """link_project_to_meeting() for many projects in one INSERT."""
+    _link_to_meeting(db, ProjectMeeting, [
+        {"project_id": project_id, "meeting_id": meeting_id} for project_id in project_ids
+    ])
 
 
 # ── Decisions ─────────────────────────────────────────────────────────────────
@@ -165,6 +241,7 @@ def create_decision(
     meeting_id: Optional[str] = None,
     project_id: Optional[str] = None,
     owner_id: Optional[str] = None,
+    defer_graph_sync: bool = False,
 ) -> Decision:
     decision = Decision(
         summary=summary,
@@ -177,18 +254,59 @@ def create_decision(
     )
     db.add(decision)
     db.flush()
-    kg.add_entity(decision.id, "decision", summary[:80])
-
-    # Auto-link to project and meeting in graph
-    if project_id:
-        kg.add_relation(decision.id, project_id, RelationType.impacts, meeting_id=meeting_id or "")
-    if owner_id:
-        kg.add_relation(owner_id, decision.id, RelationType.mentions, meeting_id=meeting_id or "")
+    if not defer_graph_sync:
+        # Node and its auto-links to project and owner in one graph mutation
+        kg.add_entity_with_relations(
+            decision.id, "decision", summary[:80],
+            _decision_relations(decision.id, project_id, owner_id, meeting_id),
+        )
 
     logger.info(f"Decision created: {summary[:60]} ({decision.id[:8]})")
     return decision
 
 
+def bulk_create_decisions(db: Session, rows: list[dict]) -> list[str]:
+    """create_decision() for many rows, including its project/owner relations; see bulk_create_people()."""
+    ids = _bulk_insert(db, Decision, [
+        {
+            "summary": row["summary"],
+            "context": row.get("context") or None,
+            "status": row.get("status", DecisionStatus.proposed),
+            "confidence": row.get("confidence"),
+            "meeting_id": row.get("meeting_id"),
+            "project_id": row.get("project_id"),
+            "owner_id": row.get("owner_id"),
+        }
+        for row in rows
+    ])
+    with kg.batch():
+        kg.add_entities((did, "decision", row["summary"][:80]) for did, row in zip(ids, rows))
+        kg.add_relations(
+            relation
+            for did, row in zip(ids, rows)
+            for relation in _decision_relations(
+                did, row.get("project_id"), row.get("owner_id"), row.get("meeting_id"),
+            )
+        )
+    logger.info(f"Decisions created: {len(ids)}")
+    return ids
+
+
+def _decision_relations(
+    decision_id: str,
+    project_id: Optional[str],
+    owner_id: Optional[str],
+    meeting_id: Optional[str],
+) -> list[tuple]:
+    """Graph edges auto-created with a decision: it impacts its project, its owner mentions it."""
+    relations = []
+    if project_id:
+        relations.append((decision_id, project_id, RelationType.impacts, meeting_id or ""))
+    if owner_id:
+        relations.append((owner_id, decision_id, RelationType.mentions, meeting_id or ""))
+    return relations
+
+
 def update_decision(db: Session, decision_id: str, **fields) -> Optional[Decision]:
     decision = db.get(Decision, decision_id)
     if not decision:
@@ -222,19 +340,36 @@ def list_decisions(
 
 # ── Topics ────────────────────────────────────────────────────────────────────
 
-def create_topic(db: Session, name: str, description: str = "") -> Topic:
+def create_topic(
+    db: Session, name: str, description: str = "", defer_graph_sync: bool = False,
+) -> Topic:
     topic = Topic(name=name, description=description or None)
     db.add(topic)
     db.flush()
-    kg.add_entity(topic.id, "topic", topic.name)
+    if not defer_graph_sync:
+        kg.add_entity(topic.id, "topic", topic.name)
+    _remember_name(Topic, topic.name, topic.id)
     logger.info(f"Topic created: {name} ({topic.id[:8]})")
     return topic
 
 
+def bulk_create_topics(db: Session, rows: list[dict]) -> list[str]:
+    """create_topic() for many rows; see bulk_create_people()."""
+    ids = _bulk_insert(db, Topic, [
+        {"name": row["name"], "description": row.get("description") or None}
+        for row in rows
+    ])
+    kg.add_entities((tid, "topic", row["name"]) for tid, row in zip(ids, rows))
+    logger.info(f"Topics created: {len(ids)}")
+    return ids
+
+
 def update_topic(db: Session, topic_id: str, **fields) -> Optional[Topic]:
     topic = db.get(Topic, topic_id)
     if not topic:
         return None
+    if fields.get("name") is not None:
+        _forget_name(Topic, topic.name)
     for key, value in fields.items():
         if hasattr(topic, key) and value is not None:
             setattr(topic, key, value)
@@ -249,7 +384,12 @@ def get_topic(db: Session, topic_id: str) -> Optional[Topic]:
 
 
 def find_topic_by_name(db: Session, name: str) -> Optional[Topic]:
-    return db.query(Topic).filter(Topic.name.ilike(name)).first()
+    return _find_by_name(db, Topic, name)
+
+
+def find_topics_by_names(db: Session, names: list[str]) -> dict[str, Topic]:
+    """Batch find_topic_by_name: one query, keyed by lower-cased name."""
+    return _find_by_names(db, Topic, names)
 
 
 def list_topics(db: Session, limit: int = 100, offset: int = 0) -> list[Topic]:
@@ -263,14 +403,77 @@ def list_topics(db: Session, limit: int = 100, offset: int = 0) -> list[Topic]:
 
 
 def link_topic_to_meeting(db: Session, topic_id: str, meeting_id: str):
-    existing = (
-        db.query(TopicMeeting)
-        .filter_by(topic_id=topic_id, meeting_id=meeting_id)
-        .first()
-    )
-    if not existing:
-        db.add(TopicMeeting(topic_id=topic_id, meeting_id=meeting_id))
-        db.flush()
+    _link_to_meeting(db, TopicMeeting, [{"topic_id": topic_id, "meeting_id": meeting_id}])
+
+
+def bulk_link_topics_to_meeting(db: Session, meeting_id: str, topic_ids: list[str]):
+    """link_topic_to_meeting() for many topics in one INSERT."""
+    _link_to_meeting(db, TopicMeeting, [
+        {"topic_id": topic_id, "meeting_id": meeting_id} for topic_id in topic_ids
+    ])
+
+
+def _find_by_name(db: Session, model, name: str):
+    key = (model.__tablename__, name.casefold())
+    with _name_cache_lock:
+        cached_id = _name_to_id.get(key)
+    if cached_id is not None:
+        row = db.get(model, cached_id)
+        if row is not None and row.name.casefold() == key[1]:
+            return row
+        _forget_name(model, name)
+
+    row = db.query(model).filter(model.name.ilike(name)).first()
+    if row is not None:
+        _remember_name(model, name, row.id)
+    return row
+
+
+def _remember_name(model, name: str, entity_id: str):
+    with _name_cache_lock:
+        if len(_name_to_id) >= NAME_CACHE_SIZE:
+            del _name_to_id[next(iter(_name_to_id))]  # Oldest entry
+        _name_to_id[(model.__tablename__, name.casefold())] = entity_id
+
+
+def _forget_name(model, name: str):
+    with _name_cache_lock:
+        _name_to_id.pop((model.__tablename__, name.casefold()), None)
+
+
+def _find_by_names(db: Session, model, names: list[str]) -> dict:
+    lowered = list({n.lower() for n in names if n})
+    if not lowered:
+        return {}
+    rows = db.query(model).filter(func.lower(model.name).in_(lowered)).all()
+    return {row.name.lower(): row for row in rows}
+
+
+def _bulk_insert(db: Session, model, rows: list[dict]) -> list[str]:
+    """
+    One executemany INSERT (in pages of BULK_INSERT_PAGE_SIZE rows). Ids are
+    generated here so no RETURNING is needed to learn them.
+    """
+    rows = [{"id": generate_id(), **row} for row in rows]
+    for start in range(0, len(rows), BULK_INSERT_PAGE_SIZE):
+        db.execute(insert(model), rows[start:start + BULK_INSERT_PAGE_SIZE])
+    return [row["id"] for row in rows]
+
+
+def _link_to_meeting(db: Session, model, rows: list[dict]):
+    """
+    INSERT ... ON CONFLICT DO NOTHING into a junction table: the
+    (entity, meeting) unique constraint drops links that already exist, so
+    there is no SELECT round trip per link.
+    """
+    if not rows:
+        return
+    rows = [{"id": generate_id(), **row} for row in rows]
+    for start in range(0, len(rows), BULK_INSERT_PAGE_SIZE):
+        db.execute(
+            sqlite_insert(model).on_conflict_do_nothing(),
+            rows[start:start + BULK_INSERT_PAGE_SIZE],
+        )
 
 
 # ── Cross-Entity Relations ────────────────────────────────────────────────────
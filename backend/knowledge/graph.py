@@ -1,30 +1,58 @@
 """
-Knowledge graph powered by NetworkX with JSON persistence.
+Knowledge graph powered by NetworkX with SQLite persistence.
 
 The graph is a shared platform resource. Nodes are entities (person, project,
 decision, topic) identified by their DB id. Edges carry a RelationType and
 optional metadata (weight, meeting_id, timestamp).
 
-Persistence: the graph serializes to a JSON file on every mutation and
-rehydrates on startup. The SQLAlchemy tables are the source of truth for
-entity attributes; the graph stores *relationships* only.
+Persistence: nodes and edges are rows of a small SQLite database (attributes
+as orjson blobs). Mutations mark the touched nodes/edges dirty and a single
+background writer thread upserts or deletes just those rows, at most once per
+SAVE_DEBOUNCE_SECONDS and without holding the graph lock during disk I/O
+(edge reinforcements alone wait up to REINFORCE_FLUSH_SECONDS);
+`with kg.batch():` defers even that until the block exits. The graph
+rehydrates on startup; a legacy knowledge_graph.json is imported once. The
+SQLAlchemy tables are the source of truth for entity attributes; the graph
+stores *relationships* only.
 """
 
+import atexit
+import itertools
 import json
 import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 import networkx as nx
+import numpy as np
+import orjson
 from networkx.readwrite import json_graph
+from scipy.sparse import csr_matrix
 
 from backend.config.settings import settings
 from backend.models.knowledge import RelationType
 
 logger = logging.getLogger(__name__)
 
-GRAPH_FILE = settings.memory_dir / "knowledge_graph.json"
+GRAPH_FILE = settings.memory_dir / "knowledge_graph.db"
+
+# Mutations within this window are coalesced into one transaction
+SAVE_DEBOUNCE_SECONDS = 2.0
+
+# Edge reinforcements (weight / last_seen / meeting_ids bumps) do not arm the
+# writer on their own; they ride along with the next structural flush or are
+# written when the writer has been idle this long
+REINFORCE_FLUSH_SECONDS = 30.0
+
+# Memoized query results kept per graph version (get_entity/get_connections/get_neighbors/export)
+READ_CACHE_SIZE = 4096
 
 
 class KnowledgeGraph:
@@ -33,12 +61,78 @@ class KnowledgeGraph:
     def __init__(self, path: Optional[Path] = None):
         self._path = path or GRAPH_FILE
         self._graph = nx.MultiDiGraph()
+        self._version_counter = itertools.count(1)
+        self._version = 0
+        # Held by mutators and the writer so the graph is never serialized mid-mutation
+        self._lock = threading.RLock()
+        # Nodes / (source, target, key) edges changed since the last flush
+        self._dirty_nodes: set[str] = set()
+        self._dirty_edges: set[tuple[str, str, int]] = set()
+        # True once anything other than an edge reinforcement is dirty
+        self._dirty_structure = False
+        # meeting_id -> (source, target, key) of the edges carrying it
+        self._meeting_index: dict[str, set[tuple[str, str, int]]] = defaultdict(set)
+        # (source, target, relation value) -> key of that edge, for O(1) dedup
+        self._relation_index: dict[tuple[str, str, str], int] = {}
+        # entity_type -> ids of the nodes of that type (a dict, to keep insertion order)
+        self._type_index: dict[str, dict[str, None]] = defaultdict(dict)
+        # (query, args) -> result, valid for _read_cache_version only
+        self._read_cache: dict[tuple, object] = {}
+        self._read_cache_version = 0
+        self._suspend = 0
+        # Serializes flushes; the graph lock is only held while they snapshot rows
+        self._write_lock = threading.Lock()
+        self._flush_pending = False
+        self._write_queue: queue.Queue = queue.Queue()
         self._load()
+        self._writer = threading.Thread(target=self._writer_loop, name="kg-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+
+    @property
+    def version(self) -> int:
+        """Bumped on every mutation; lets callers memoize derived views of the graph."""
+        return self._version
 
     # ── Node operations ───────────────────────────────────────────────────────
 
     def add_entity(self, entity_id: str, entity_type: str, label: str):
         """Register an entity as a node. Idempotent."""
+        with self._lock:
+            self._add_node(entity_id, entity_type, label)
+            self._save()
+
+    def add_entities(self, entities: Iterable[tuple[str, str, str]]):
+        """add_entity() for many (entity_id, entity_type, label) tuples, saving once."""
+        now = _now()
+        with self._lock:
+            for entity_id, entity_type, label in entities:
+                self._add_node(entity_id, entity_type, label, now)
+            self._save()
+
+    def add_entity_with_relations(
+        self,
+        entity_id: str,
+        entity_type: str,
+        label: str,
+        relations: Iterable[tuple[str, str, RelationType, str]],
+    ) -> int:
+        """
+        add_entity() plus add_relations() for edges touching the new entity,
+        as one mutation: one lock acquisition, one version bump and one save.
+        Returns the number of edges added or reinforced.
+        """
+        now = _now()
+        with self._lock:
+            self._add_node(entity_id, entity_type, label, now)
+            added = sum(
+                self._add_edge(source_id, target_id, relation, meeting_id, now=now)
+                for source_id, target_id, relation, meeting_id in relations
+            )
+            self._save()
+        return added
+
+    def _add_node(self, entity_id: str, entity_type: str, label: str, now: Optional[str] = None):
         if self._graph.has_node(entity_id):
             self._graph.nodes[entity_id]["label"] = label
         else:
@@ -46,16 +140,33 @@ class KnowledgeGraph:
                 entity_id,
                 entity_type=entity_type,
                 label=label,
-                created_at=_now(),
+                created_at=now or _now(),
             )
-        self._save()
+            self._type_index[entity_type][entity_id] = None
+        self._dirty_nodes.add(entity_id)
+        self._dirty_structure = True
 
     def remove_entity(self, entity_id: str):
-        if self._graph.has_node(entity_id):
-            self._graph.remove_node(entity_id)
-            self._save()
+        with self._lock:
+            if self._graph.has_node(entity_id):
+                # Incident edges go with the node
+                incident = [
+                    *self._graph.out_edges(entity_id, keys=True, data=True),
+                    *self._graph.in_edges(entity_id, keys=True, data=True),
+                ]
+                for u, v, k, data in incident:
+                    self._unindex_edge(u, v, k, data)
+                    self._dirty_edges.add((u, v, k))
+                self._type_index[self._graph.nodes[entity_id].get("entity_type")].pop(entity_id, None)
+                self._graph.remove_node(entity_id)
+                self._dirty_nodes.add(entity_id)
+                self._dirty_structure = True
+                self._save()
 
     def get_entity(self, entity_id: str) -> Optional[dict]:
+        return self._cached(("entity", entity_id), lambda: self._get_entity(entity_id))
+
+    def _get_entity(self, entity_id: str) -> Optional[dict]:
         if self._graph.has_node(entity_id):
             return {"id": entity_id, **self._graph.nodes[entity_id]}
         return None
@@ -72,61 +183,102 @@ class KnowledgeGraph:
         metadata: Optional[dict] = None,
     ) -> bool:
         """Add a directed edge. Returns False if either node is missing."""
+        with self._lock:
+            added = self._add_edge(source_id, target_id, relation, meeting_id, weight, metadata)
+            if added:
+                self._save()
+        return added
+
+    def add_relations(self, relations: Iterable[tuple[str, str, RelationType, str]]) -> int:
+        """
+        add_relation() for many (source_id, target_id, relation, meeting_id)
+        tuples, saving once. Returns the number of edges added or reinforced.
+        """
+        # One timestamp for the whole batch
+        now = _now()
+        with self._lock:
+            added = sum(
+                self._add_edge(source_id, target_id, relation, meeting_id, now=now)
+                for source_id, target_id, relation, meeting_id in relations
+            )
+            if added:
+                self._save()
+        return added
+
+    def _add_edge(
+        self,
+        source_id: str,
+        target_id: str,
+        relation: RelationType,
+        meeting_id: str = "",
+        weight: float = 1.0,
+        metadata: Optional[dict] = None,
+        now: Optional[str] = None,
+    ) -> bool:
         if not self._graph.has_node(source_id) or not self._graph.has_node(target_id):
             logger.warning(
                 f"Cannot add relation: missing node(s) {source_id} -> {target_id}"
             )
             return False
 
+        # Formatted once per mutation rather than per timestamp field
+        now = now or _now()
+
         # Check for duplicate edge of same type
-        for _, _, data in self._graph.edges(source_id, data=True):
-            if data.get("relation") == relation.value and _ == target_id:
-                # Reinforce: bump weight
-                data["weight"] = data.get("weight", 1.0) + weight
-                data["last_seen"] = _now()
-                if meeting_id:
-                    meetings = data.get("meeting_ids", [])
-                    if meeting_id not in meetings:
-                        meetings.append(meeting_id)
-                    data["meeting_ids"] = meetings
-                self._save()
-                return True
+        key = self._relation_index.get((source_id, target_id, relation.value))
+        if key is not None:
+            data = self._graph[source_id][target_id][key]
+            # Reinforce: bump weight
+            data["weight"] = data.get("weight", 1.0) + weight
+            data["last_seen"] = now
+            if meeting_id:
+                meetings = data.get("meeting_ids", [])
+                if meeting_id not in meetings:
+                    meetings.append(meeting_id)
+                    self._meeting_index[meeting_id].add((source_id, target_id, key))
+                data["meeting_ids"] = meetings
+            self._dirty_edges.add((source_id, target_id, key))
+            return True
 
         edge_data = {
             "relation": relation.value,
             "weight": weight,
-            "created_at": _now(),
-            "last_seen": _now(),
+            "created_at": now,
+            "last_seen": now,
         }
         if meeting_id:
             edge_data["meeting_ids"] = [meeting_id]
         if metadata:
             edge_data["metadata"] = metadata
-        self._graph.add_edge(source_id, target_id, **edge_data)
-        self._save()
+        key = self._graph.add_edge(source_id, target_id, **edge_data)
+        self._index_edge(source_id, target_id, key, edge_data)
+        self._dirty_edges.add((source_id, target_id, key))
+        self._dirty_structure = True
         return True
 
     def remove_relation(self, source_id: str, target_id: str, relation: Optional[RelationType] = None):
         """Remove edge(s) between two nodes. If relation is None, removes all edges."""
-        if not self._graph.has_edge(source_id, target_id):
-            return
-        if relation is None:
-            self._graph.remove_edges_from(
-                [(source_id, target_id, k) for k in self._graph[source_id][target_id]]
-            )
-        else:
+        with self._lock:
+            if not self._graph.has_edge(source_id, target_id):
+                return
             keys_to_remove = [
                 k for k, data in self._graph[source_id][target_id].items()
-                if data.get("relation") == relation.value
+                if relation is None or data.get("relation") == relation.value
             ]
             for k in keys_to_remove:
+                self._unindex_edge(source_id, target_id, k, self._graph[source_id][target_id][k])
                 self._graph.remove_edge(source_id, target_id, key=k)
-        self._save()
+                self._dirty_edges.add((source_id, target_id, k))
+                self._dirty_structure = True
+            self._save()
 
     # ── Query operations ──────────────────────────────────────────────────────
 
     def get_connections(self, entity_id: str) -> list[dict]:
         """Get all edges (in + out) for an entity."""
+        return self._cached(("connections", entity_id), lambda: self._get_connections(entity_id))
+
+    def _get_connections(self, entity_id: str) -> list[dict]:
         if not self._graph.has_node(entity_id):
             return []
         connections = []
@@ -154,6 +306,11 @@ class KnowledgeGraph:
 
     def get_neighbors(self, entity_id: str, relation: Optional[RelationType] = None) -> list[dict]:
         """Get neighboring nodes, optionally filtered by relation type."""
+        return self._cached(
+            ("neighbors", entity_id, relation), lambda: self._get_neighbors(entity_id, relation),
+        )
+
+    def _get_neighbors(self, entity_id: str, relation: Optional[RelationType] = None) -> list[dict]:
         if not self._graph.has_node(entity_id):
             return []
         neighbors = []
@@ -174,62 +331,293 @@ class KnowledgeGraph:
 
     def get_entities_by_type(self, entity_type: str) -> list[dict]:
         """List all nodes of a given type."""
-        return [
-            {"id": nid, **data}
-            for nid, data in self._graph.nodes(data=True)
-            if data.get("entity_type") == entity_type
-        ]
+        with self._lock:
+            nodes = self._graph.nodes
+            return [{"id": nid, **nodes[nid]} for nid in self._type_index.get(entity_type, ())]
 
     def get_subgraph_for_meeting(self, meeting_id: str) -> dict:
         """Extract nodes and edges that reference a specific meeting."""
         nodes = set()
         edges = []
-        for u, v, data in self._graph.edges(data=True):
-            if meeting_id in data.get("meeting_ids", []):
+        # Only the meeting's own edges are visited (via the meeting index)
+        with self._lock:
+            for u, v, k in self._meeting_index.get(meeting_id, ()):
                 nodes.add(u)
                 nodes.add(v)
-                edges.append({"source": u, "target": v, **data})
+                edges.append({"source": u, "target": v, **self._graph[u][v][k]})
         return {
             "nodes": [{"id": n, **self._graph.nodes[n]} for n in nodes],
             "edges": edges,
         }
 
+    def get_most_connected(self, entity_type: Optional[str] = None, limit: int = 10) -> list[dict]:
+        """Entities with the highest total edge weight (in + out), optionally of one type."""
+        return self._cached(
+            ("most_connected", entity_type, limit),
+            lambda: self._get_most_connected(entity_type, limit),
+        )
+
+    def _get_most_connected(self, entity_type: Optional[str], limit: int) -> list[dict]:
+        node_ids, adjacency = self.adjacency()
+        if not node_ids:
+            return []
+        strength = np.asarray(adjacency.sum(axis=1)).ravel() + np.asarray(adjacency.sum(axis=0)).ravel()
+        if entity_type is not None:
+            typed = self._type_index.get(entity_type, {})
+            strength[[i for i, nid in enumerate(node_ids) if nid not in typed]] = -1.0
+        order = np.argsort(-strength, kind="stable")[:limit]
+        return [
+            {"id": node_ids[i], **self._graph.nodes[node_ids[i]], "strength": float(strength[i])}
+            for i in order
+            if strength[i] > 0
+        ]
+
+    def adjacency(self, relation: Optional[RelationType] = None) -> tuple[list[str], csr_matrix]:
+        """
+        Snapshot of the graph as a weighted sparse adjacency matrix, for
+        analytics that touch every edge (degree rankings, scipy.sparse.csgraph
+        traversals). Row/column i is node_ids[i]; parallel edges are summed.
+        Memoized like get_connections(), so it must not be modified.
+        """
+        return self._cached(
+            ("adjacency", relation), lambda: self._build_adjacency(relation),
+        )
+
+    def _build_adjacency(self, relation: Optional[RelationType]) -> tuple[list[str], csr_matrix]:
+        node_ids = list(self._graph.nodes)
+        position = {nid: i for i, nid in enumerate(node_ids)}
+        rows, cols, weights = [], [], []
+        for u, v, data in self._graph.edges(data=True):
+            if relation is not None and data.get("relation") != relation.value:
+                continue
+            rows.append(position[u])
+            cols.append(position[v])
+            weights.append(data.get("weight", 1.0))
+        n = len(node_ids)
+        matrix = csr_matrix(
+            (np.asarray(weights, dtype=np.float64), (np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64))),
+            shape=(n, n),
+        )
+        return node_ids, matrix
+
+    def is_empty(self) -> bool:
+        """O(1): True until the first entity is registered."""
+        return self._graph.number_of_nodes() == 0
+
     def stats(self) -> dict:
         return {
             "total_nodes": self._graph.number_of_nodes(),
             "total_edges": self._graph.number_of_edges(),
-            "people": len(self.get_entities_by_type("person")),
-            "projects": len(self.get_entities_by_type("project")),
-            "decisions": len(self.get_entities_by_type("decision")),
-            "topics": len(self.get_entities_by_type("topic")),
+            "people": len(self._type_index.get("person", ())),
+            "projects": len(self._type_index.get("project", ())),
+            "decisions": len(self._type_index.get("decision", ())),
+            "topics": len(self._type_index.get("topic", ())),
         }
 
     def export(self) -> dict:
-        """Full graph as serializable dict (for API responses)."""
-        return json_graph.node_link_data(self._graph)
+        """Full graph as serializable dict (for API responses). Memoized like get_connections()."""
+        return self._cached(("export",), lambda: json_graph.node_link_data(self._graph))
+
+    def _cached(self, key: tuple, compute):
+        """
+        Memoize a read-only query until the next mutation. Results are shared
+        between callers, so they must not be modified.
+        """
+        with self._lock:
+            if self._read_cache_version != self._version:
+                self._read_cache = {}
+                self._read_cache_version = self._version
+            try:
+                return self._read_cache[key]
+            except KeyError:
+                pass
+            value = compute()
+            if len(self._read_cache) < READ_CACHE_SIZE:
+                self._read_cache[key] = value
+            return value
+
+    # ── Indexes ───────────────────────────────────────────────────────────────
+
+    def _index_edge(self, source_id: str, target_id: str, key: int, data: dict):
+        # The first edge of a relation wins, as the old linear scan found it
+        self._relation_index.setdefault((source_id, target_id, data.get("relation")), key)
+        for meeting_id in data.get("meeting_ids", []):
+            self._meeting_index[meeting_id].add((source_id, target_id, key))
+
+    def _unindex_edge(self, source_id: str, target_id: str, key: int, data: dict):
+        relation_key = (source_id, target_id, data.get("relation"))
+        if self._relation_index.get(relation_key) == key:
+            del self._relation_index[relation_key]
+        for meeting_id in data.get("meeting_ids", []):
+            edges = self._meeting_index.get(meeting_id)
+            if edges is not None:
+                edges.discard((source_id, target_id, key))
+                if not edges:
+                    del self._meeting_index[meeting_id]
+
+    def _rebuild_indexes(self):
+        self._type_index = defaultdict(dict)
+        for node_id, entity_type in self._graph.nodes(data="entity_type"):
+            self._type_index[entity_type][node_id] = None
+        self._meeting_index = defaultdict(set)
+        self._relation_index = {}
+        for u, v, k, data in self._graph.edges(keys=True, data=True):
+            self._index_edge(u, v, k, data)
 
     # ── Persistence ───────────────────────────────────────────────────────────
 
+    @contextmanager
+    def batch(self):
+        """Defer persistence of every mutation in the block to a single write on exit."""
+        with self._lock:
+            self._suspend += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._suspend -= 1
+                if not self._suspend and self._dirty_structure:
+                    self._schedule_flush()
+
+    def flush(self):
+        """Write pending changes now (also runs at interpreter exit)."""
+        with self._write_lock:
+            with self._lock:
+                self._flush_pending = False
+                if not (self._dirty_nodes or self._dirty_edges):
+                    return
+                dirty_nodes, self._dirty_nodes = self._dirty_nodes, set()
+                dirty_edges, self._dirty_edges = self._dirty_edges, set()
+                dirty_structure, self._dirty_structure = self._dirty_structure, False
+
+                # Encoding is the snapshot: the rows below are immutable bytes
+                node_upserts, node_deletes = [], []
+                for node_id in dirty_nodes:
+                    if self._graph.has_node(node_id):
+                        node_upserts.append((node_id, _encode(self._graph.nodes[node_id])))
+                    else:
+                        node_deletes.append((node_id,))
+                edge_upserts, edge_deletes = [], []
+                for source, target, key in dirty_edges:
+                    if self._graph.has_edge(source, target, key):
+                        edge_upserts.append((source, target, key, _encode(self._graph[source][target][key])))
+                    else:
+                        edge_deletes.append((source, target, key))
+
+            # Mutators are not blocked on disk I/O
+            try:
+                with self._db:
+                    self._db.executemany("DELETE FROM edges WHERE source = ? AND target = ? AND key = ?", edge_deletes)
+                    self._db.executemany("DELETE FROM nodes WHERE id = ?", node_deletes)
+                    self._db.executemany("INSERT OR REPLACE INTO nodes (id, data) VALUES (?, ?)", node_upserts)
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO edges (source, target, key, data) VALUES (?, ?, ?, ?)",
+                        edge_upserts,
+                    )
+            except Exception:
+                # Keep the rows dirty so the next flush retries them
+                with self._lock:
+                    self._dirty_nodes |= dirty_nodes
+                    self._dirty_edges |= dirty_edges
+                    self._dirty_structure |= dirty_structure
+                raise
+
     def _save(self):
-        data = json_graph.node_link_data(self._graph)
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._path.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+        """Record a mutation; called by mutators with the lock held, after marking what changed."""
+        # next() on itertools.count is atomic under the GIL
+        self._version = next(self._version_counter)
+        if not self._suspend and self._dirty_structure:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        # Armed by the first unsaved mutation and not pushed back by later
+        # ones, so a steady stream of writes still persists every window
+        if not self._flush_pending:
+            self._flush_pending = True
+            self._write_queue.put_nowait(None)
+
+    def _writer_loop(self):
+        """Single background writer: wait for a save request, let the window fill, flush."""
+        while True:
+            try:
+                self._write_queue.get(timeout=REINFORCE_FLUSH_SECONDS)
+            except queue.Empty:
+                # Idle: write any reinforcements that never armed the writer
+                pass
+            else:
+                time.sleep(SAVE_DEBOUNCE_SECONDS)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Failed to save knowledge graph: {e}")
 
     def _load(self):
-        if self._path.exists():
-            try:
-                raw = json.loads(self._path.read_text(encoding="utf-8"))
-                self._graph = json_graph.node_link_graph(raw, directed=True, multigraph=True)
-                logger.info(
-                    f"Knowledge graph loaded: {self._graph.number_of_nodes()} nodes, "
-                    f"{self._graph.number_of_edges()} edges"
-                )
-            except (json.JSONDecodeError, Exception) as e:
-                logger.error(f"Failed to load knowledge graph: {e}. Starting fresh.")
-                self._graph = nx.MultiDiGraph()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # Only ever used under self._write_lock
+        self._db = sqlite3.connect(self._path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS nodes (id TEXT PRIMARY KEY, data BLOB NOT NULL);
+            CREATE TABLE IF NOT EXISTS edges (
+                source TEXT NOT NULL,
+                target TEXT NOT NULL,
+                key INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (source, target, key)
+            );
+            CREATE INDEX IF NOT EXISTS idx_edges_target ON edges (target);
+            """
+        )
+
+        try:
+            for node_id, data in self._db.execute("SELECT id, data FROM nodes"):
+                self._graph.add_node(node_id, **orjson.loads(data))
+            for source, target, key, data in self._db.execute("SELECT source, target, key, data FROM edges"):
+                self._graph.add_edge(source, target, key=key, **orjson.loads(data))
+        except Exception as e:
+            logger.error(f"Failed to load knowledge graph: {e}. Starting fresh.")
+            self._graph = nx.MultiDiGraph()
+            return
+
+        # The JSON file the graph used to be saved as sits next to the database
+        legacy_path = self._path.with_suffix(".json")
+        if self._graph.number_of_nodes() == 0 and legacy_path.exists():
+            self._import_legacy_json(legacy_path)
+        self._rebuild_indexes()
+
+        if self._graph.number_of_nodes():
+            logger.info(
+                f"Knowledge graph loaded: {self._graph.number_of_nodes()} nodes, "
+                f"{self._graph.number_of_edges()} edges"
+            )
         else:
             logger.info("No existing knowledge graph found. Starting fresh.")
 
+    def _import_legacy_json(self, path: Path):
+        """
+        One-time migration from the node-link JSON file the graph used to be
+        saved as. The file is renamed to *.json.migrated once imported, so an
+        emptied graph is not repopulated from it on the next start.
+        """
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            self._graph = json_graph.node_link_graph(raw, directed=True, multigraph=True)
+        except (json.JSONDecodeError, Exception) as e:
+            logger.error(f"Failed to import legacy knowledge graph {path}: {e}")
+            self._graph = nx.MultiDiGraph()
+            return
+        self._dirty_nodes.update(self._graph.nodes)
+        self._dirty_edges.update(self._graph.edges(keys=True))
+        self.flush()
+        path.replace(path.with_suffix(".json.migrated"))
+        logger.info(f"Imported legacy knowledge graph from {path.name}")
+
+
+def _encode(data: dict) -> bytes:
+    # default=str covers any non-JSON value that slipped into node/edge attributes
+    return orjson.dumps(data, default=str)
+
 
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -6,25 +6,30 @@ Minimum frequency: once every 2 weeks.
 Never interrupts user activity.
 
 Process:
-  1. Read all short-term entries
+  1. Stream the short-term entries recorded so far
   2. Group by similarity (signal_type + content fingerprint)
   3. Promote repeated signals → medium-term patterns
   4. Promote reinforced patterns → long-term confirmed rules
-  5. Clean consumed short-term entries
+  5. Clean consumed short-term entries (later ones are kept)
 """
 
 import logging
 import threading
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from difflib import SequenceMatcher
-from typing import Optional
+from typing import Iterable, Optional
+
+import numpy as np
+from datasketch import MinHash, MinHashLSH
+from rapidfuzz import fuzz, process
 
 from backend.learning.memory import (
     MemoryStore,
     MemoryEntry,
     PatternEntry,
     ConfirmedRule,
+    EVIDENCE_LIMIT,
     SignalType,
     memory,
 )
@@ -32,8 +37,27 @@ from backend.learning.memory import (
 logger = logging.getLogger(__name__)
 
 
-def _similarity(a: str, b: str) -> float:
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+# Content similarity is rapidfuzz's fuzz.ratio (Indel-normalized, the C++
+# equivalent of difflib's SequenceMatcher.ratio) on lower-cased text; MinHash
+# over lower-cased character 5-grams narrows down what gets compared
+MINHASH_NUM_PERM = 64
+SHINGLE_SIZE = 5
+# Short contents have too few shingles for the LSH to pair near-duplicates
+# ("API"/"APIs"). A pair fuzz.ratio can merge with one side under
+# 2 * SHINGLE_SIZE chars has both sides under this length, so such contents
+# are compared directly against every group whose first entry is this short.
+SHORT_CONTENT_CHARS = 24
+
+# Every pass runs on this one worker, never on a request or scheduler thread
+_consolidation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="consolidation")
+
+
+def _minhash(text: str) -> MinHash:
+    text = text.lower()
+    shingles = {text[i:i + SHINGLE_SIZE] for i in range(max(1, len(text) - SHINGLE_SIZE + 1))}
+    mh = MinHash(num_perm=MINHASH_NUM_PERM)
+    mh.update_batch([s.encode("utf-8") for s in shingles])
+    return mh
 
 
 class ConsolidationEngine:
@@ -44,144 +68,224 @@ class ConsolidationEngine:
     """
 
     SIMILARITY_THRESHOLD = 0.7  # Two signals are "same" if content similarity >= this
+    # Shingle Jaccard runs well below the edit-based ratio for the same pair,
+    # so the LSH prefilter uses a looser threshold to keep recall
+    LSH_THRESHOLD = 0.3
 
     def __init__(self, store: Optional[MemoryStore] = None):
         self.store = store or memory
+        # Guards _future only; the single-worker executor serializes the passes
         self._lock = threading.Lock()
+        self._future: Optional[Future] = None
         self._last_run: Optional[datetime] = None
 
-    def run(self) -> dict:
+    def schedule(self) -> Future:
         """
-        Execute a full consolidation pass. Returns stats.
-        Thread-safe — only one consolidation runs at a time.
+        Queue a consolidation pass on the consolidation worker and return its
+        future (resolving to the stats). A pass that is already queued or
+        running is shared rather than repeated.
         """
-        if not self._lock.acquire(blocking=False):
-            logger.info("Consolidation already running, skipping.")
-            return {"skipped": True}
-
-        try:
-            logger.info("Memory consolidation starting...")
-            stats = {"promoted_to_medium": 0, "promoted_to_long": 0, "signals_consumed": 0}
-
-            short_entries = self.store.read_short_term_entries()
-            if not short_entries:
-                logger.info("No short-term signals to consolidate.")
-                return stats
-
-            medium_patterns = self.store.read_medium_term_patterns()
-            long_rules = self.store.read_long_term_rules()
-
-            # Phase 1: Group short-term by similarity
-            groups = self._group_signals(short_entries)
-
-            # Phase 2: Update or create medium-term patterns
-            for key, entries in groups.items():
-                signal_type, _ = key
-                pattern = self._find_matching_pattern(entries[0].content, signal_type, medium_patterns)
-
-                if pattern:
-                    # Reinforce existing pattern
-                    pattern.observation_count += len(entries)
-                    pattern.last_seen = entries[-1].timestamp
-                    for e in entries:
-                        pattern.supporting_evidence.append(
-                            f"[{e.timestamp}] {e.content[:80]}"
-                        )
-                    # Trim evidence to last 10
-                    pattern.supporting_evidence = pattern.supporting_evidence[-10:]
-                else:
-                    # Check if enough signals to promote
-                    if len(entries) >= self.store.PROMOTION_TO_MEDIUM_THRESHOLD:
-                        new_pattern = PatternEntry(
-                            pattern=self._synthesize_pattern(entries),
-                            signal_type=signal_type,
-                            observation_count=len(entries),
-                            first_seen=entries[0].timestamp,
-                            last_seen=entries[-1].timestamp,
-                            supporting_evidence=[
-                                f"[{e.timestamp}] {e.content[:80]}" for e in entries[-5:]
-                            ],
-                        )
-                        medium_patterns.append(new_pattern)
-                        stats["promoted_to_medium"] += 1
-                        logger.info(f"New pattern promoted to medium-term: {new_pattern.pattern[:60]}")
-
-            # Phase 3: Promote mature patterns to long-term
-            remaining_medium = []
-            long_rule_texts = {r.rule.lower() for r in long_rules}
-
-            for pattern in medium_patterns:
-                if (
-                    pattern.observation_count >= self.store.PROMOTION_TO_LONG_THRESHOLD
-                    and pattern.pattern.lower() not in long_rule_texts
-                ):
-                    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M")
-                    rule = ConfirmedRule(
-                        rule=pattern.pattern,
-                        signal_type=pattern.signal_type,
-                        promoted_from=pattern.id,
-                        promoted_at=now,
-                        context_scope=pattern.context_scope,
-                    )
-                    long_rules.append(rule)
-                    stats["promoted_to_long"] += 1
-                    logger.info(f"Pattern promoted to long-term: {rule.rule[:60]}")
-                else:
-                    remaining_medium.append(pattern)
-
-            # Phase 4: Write updated tiers
-            self.store.write_medium_term(remaining_medium)
-            self.store.write_long_term(long_rules)
-            self.store.clear_short_term()
-            stats["signals_consumed"] = len(short_entries)
-
-            self._last_run = datetime.now(timezone.utc)
-            logger.info(
-                f"Consolidation complete: "
-                f"{stats['signals_consumed']} signals consumed, "
-                f"{stats['promoted_to_medium']} → medium, "
-                f"{stats['promoted_to_long']} → long"
-            )
-            return stats
+        with self._lock:
+            if self._future is None or self._future.done():
+                self._future = _consolidation_executor.submit(self._run)
+            return self._future
 
-        finally:
-            self._lock.release()
+    def run(self) -> dict:
+        """Execute a full consolidation pass (on the consolidation worker) and wait for its stats."""
+        return self.schedule().result()
+
+    def _run(self) -> dict:
+        """One consolidation pass; only ever runs on the consolidation worker."""
+        logger.info("Memory consolidation starting...")
+        stats = {"promoted_to_medium": 0, "promoted_to_long": 0, "signals_consumed": 0}
+
+        # Phase 1: Group short-term by similarity, streaming the entries.
+        # Only what exists now is consumed; signals recorded during the pass
+        # stay for the next one
+        consumed_upto = self.store.short_term_size()
+        groups = self._group_signals(self.store.iter_short_term_entries(end=consumed_upto))
+        if not groups:
+            logger.info("No short-term signals to consolidate.")
+            return stats
+        stats["signals_consumed"] = sum(len(entries) for entries in groups.values())
+
+        medium_patterns = self.store.read_medium_term_patterns()
+        long_rules = self.store.read_long_term_rules()
+
+        # signal_type -> parallel lists of its patterns and their lower-cased
+        # texts, built once per pass; matching only ever looks at one type
+        patterns_by_type: dict[str, tuple[list[PatternEntry], list[str]]] = defaultdict(lambda: ([], []))
+        for p in medium_patterns:
+            typed_patterns, typed_texts = patterns_by_type[p.signal_type]
+            typed_patterns.append(p)
+            typed_texts.append(p.pattern.lower())
+
+        # Phase 2: Update or create medium-term patterns
+        for key, entries in groups.items():
+            signal_type, _ = key
+            typed_patterns, typed_texts = patterns_by_type[signal_type]
+            pattern = self._find_matching_pattern(entries[0].content, typed_patterns, typed_texts)
+
+            if pattern:
+                # Reinforce existing pattern
+                pattern.observation_count += len(entries)
+                pattern.last_seen = entries[-1].timestamp
+                # Bounded deque: only the last EVIDENCE_LIMIT items are kept
+                pattern.supporting_evidence.extend(f"[{e.timestamp}] {e.content[:80]}" for e in entries)
+            else:
+                # Check if enough signals to promote
+                if len(entries) >= self.store.PROMOTION_TO_MEDIUM_THRESHOLD:
+                    new_pattern = PatternEntry(
+                        pattern=self._synthesize_pattern(entries),
+                        signal_type=signal_type,
+                        observation_count=len(entries),
+                        first_seen=entries[0].timestamp,
+                        last_seen=entries[-1].timestamp,
+                        supporting_evidence=deque(
+                            (f"[{e.timestamp}] {e.content[:80]}" for e in entries[-EVIDENCE_LIMIT:]),
+                            maxlen=EVIDENCE_LIMIT,
+                        ),
+                    )
+                    medium_patterns.append(new_pattern)
+                    typed_patterns.append(new_pattern)
+                    typed_texts.append(new_pattern.pattern.lower())
+                    stats["promoted_to_medium"] += 1
+                    logger.info(f"New pattern promoted to medium-term: {new_pattern.pattern[:60]}")
+
+        # Phase 3: Promote mature patterns to long-term
+        remaining_medium = []
+        # Cached by the store between runs; texts promoted in this pass are
+        # tracked separately so the same pattern is not promoted twice
+        long_rule_texts = self.store.long_term_rule_texts()
+        promoted_texts: set[str] = set()
+
+        for pattern in medium_patterns:
+            text = pattern.pattern.lower()
+            if (
+                pattern.observation_count >= self.store.PROMOTION_TO_LONG_THRESHOLD
+                and text not in long_rule_texts
+                and text not in promoted_texts
+            ):
+                promoted_texts.add(text)
+                now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M")
+                rule = ConfirmedRule(
+                    rule=pattern.pattern,
+                    signal_type=pattern.signal_type,
+                    promoted_from=pattern.id,
+                    promoted_at=now,
+                    context_scope=pattern.context_scope,
+                )
+                long_rules.append(rule)
+                stats["promoted_to_long"] += 1
+                logger.info(f"Pattern promoted to long-term: {rule.rule[:60]}")
+            else:
+                remaining_medium.append(pattern)
+
+        # Phase 4: Write updated tiers
+        self.store.write_medium_term(remaining_medium)
+        self.store.write_long_term(long_rules)
+        self.store.clear_short_term(upto=consumed_upto)
+
+        self._last_run = datetime.now(timezone.utc)
+        logger.info(
+            f"Consolidation complete: "
+            f"{stats['signals_consumed']} signals consumed, "
+            f"{stats['promoted_to_medium']} → medium, "
+            f"{stats['promoted_to_long']} → long"
+        )
+        return stats
 
     def _group_signals(
-        self, entries: list[MemoryEntry]
+        self, entries: Iterable[MemoryEntry]
     ) -> dict[tuple[str, str], list[MemoryEntry]]:
         """
-        Group entries by signal_type + content similarity.
-        Returns {(signal_type, group_key): [entries]}.
+        Group entries by signal_type + content similarity, one entry at a
+        time so `entries` can be a stream.
+        Returns {(signal_type, group_id): [entries]}; ids are unique per type.
         """
         groups: dict[tuple[str, str], list[MemoryEntry]] = {}
+        # Entries only ever group with their own signal type, so each type
+        # keeps its own LSH index (over each group's first entry), list of
+        # group keys by LSH id and keys of short groups; other types' groups
+        # are never compared
+        indexes: dict[str, tuple[MinHashLSH, list[tuple[str, str]], list[tuple[str, str]]]] = {}
 
         for entry in entries:
-            matched = False
-            for key, group in groups.items():
-                if key[0] != entry.signal_type:
-                    continue
-                # Compare with the first entry in the group
-                if _similarity(entry.content, group[0].content) >= self.SIMILARITY_THRESHOLD:
-                    group.append(entry)
-                    matched = True
-                    break
-
-            if not matched:
-                fingerprint = entry.content[:50].lower().strip()
-                groups[(entry.signal_type, fingerprint)] = [entry]
+            index = indexes.get(entry.signal_type)
+            if index is None:
+                index = indexes[entry.signal_type] = (
+                    MinHashLSH(threshold=self.LSH_THRESHOLD, num_perm=MINHASH_NUM_PERM), [], [],
+                )
+            self._add_to_group(entry, groups, *index)
 
         return groups
 
+    def _add_to_group(
+        self,
+        entry: MemoryEntry,
+        groups: dict[tuple[str, str], list[MemoryEntry]],
+        lsh: MinHashLSH,
+        group_keys: list[tuple[str, str]],
+        short_keys: list[tuple[str, str]],
+    ):
+        """
+        Append `entry` to its best-matching group of the same type, or start
+        a new one. Only LSH candidates (plus, for short contents, the short
+        groups) get the exact similarity check, so grouping stays roughly
+        linear instead of comparing against every group.
+        """
+        mh = _minhash(entry.content)
+        short = len(entry.content) < SHORT_CONTENT_CHARS
+
+        # Best candidate by similarity to the group's first entry, scored
+        # in one batched call
+        keys = [group_keys[int(gid)] for gid in lsh.query(mh)]
+        if short:
+            keys = list(dict.fromkeys(keys + short_keys))
+        candidates = [groups[key] for key in keys]
+        match = process.extractOne(
+            entry.content.lower(),
+            [group[0].content.lower() for group in candidates],
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=self.SIMILARITY_THRESHOLD * 100,
+        ) if candidates else None
+
+        if match is not None:
+            candidates[match[2]].append(entry)
+        else:
+            # Keyed by LSH id: two groups may share a content prefix
+            gid = str(len(group_keys))
+            key = (entry.signal_type, gid)
+            groups[key] = [entry]
+            lsh.insert(gid, mh)
+            group_keys.append(key)
+            if short:
+                short_keys.append(key)
+
     def _find_matching_pattern(
-        self, content: str, signal_type: str, patterns: list[PatternEntry]
+        self,
+        content: str,
+        patterns: list[PatternEntry],
+        pattern_texts: list[str],
     ) -> Optional[PatternEntry]:
-        for p in patterns:
-            if p.signal_type != signal_type:
-                continue
-            if _similarity(content, p.pattern) >= self.SIMILARITY_THRESHOLD:
-                return p
-        return None
+        """
+        First of `patterns` (all of the content's signal type) scoring at least
+        SIMILARITY_THRESHOLD. `pattern_texts` holds their lower-cased texts, in
+        the same order.
+        """
+        if not patterns:
+            return None
+
+        # One C++ call scores every candidate
+        scores = process.cdist(
+            [content.lower()], pattern_texts,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=self.SIMILARITY_THRESHOLD * 100,
+        )[0]
+        hits = np.flatnonzero(scores)
+        return patterns[int(hits[0])] if hits.size else None
 
     def _synthesize_pattern(self, entries: list[MemoryEntry]) -> str:
         """
@@ -191,14 +295,16 @@ class ConsolidationEngine:
         if len(entries) == 1:
             return entries[0].content
 
-        # Pick the entry with highest average similarity to all others
-        best_entry = entries[0]
-        best_score = 0
-        for e in entries:
-            score = sum(_similarity(e.content, other.content) for other in entries) / len(entries)
-            if score > best_score:
-                best_score = score
-                best_entry = e
+        # Pick the entry with highest average (MinHash-estimated) Jaccard
+        # similarity to all others. For each permutation, an entry agrees with
+        # exactly the entries sharing its hash value, so per-column value
+        # counts give every entry's score in O(k) rather than O(k²) pairs.
+        hashes = np.stack([_minhash(e.content).hashvalues for e in entries])
+        scores = np.zeros(len(entries))
+        for column in hashes.T:
+            _, inverse, counts = np.unique(column, return_inverse=True, return_counts=True)
+            scores += counts[inverse]
+        best_entry = entries[int(np.argmax(scores))]
 
         count = len(entries)
         return f"{best_entry.content} (observed {count} times)"
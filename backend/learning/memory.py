@@ -13,19 +13,50 @@ All tiers are stored as human-readable/editable Markdown files.
 User edits to any memory file are treated as high-priority signals.
 """
 
+import atexit
+import mmap
+import os
 import re
 import hashlib
 import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from backend.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Block headings of the medium- and long-term files
+_PATTERN_HEADING = b"### ["
+_RULE_HEADING = b"### CONFIRMED:"
+
+# Supporting evidence kept per pattern (and rendered into the medium-term file)
+EVIDENCE_LIMIT = 5
+
+# Content of an empty short-term file
+SHORT_TERM_HEADER = "# Short-Term Memory\n"
+
+# Memory directories whose tier files this process has already created/checked
+_initialized_dirs: set[Path] = set()
+
+# Line and field formats, compiled once rather than looked up per line/field
+_SHORT_LINE_RE = re.compile(r"^- \[(\d{4}-\d{2}-\d{2} \d{2}:\d{2})\]\s+\*\*(\w+)\*\*:\s*(.+)$")
+_CONTEXT_RE = re.compile(r"— _(.+?)_")
+_MEETING_ID_RE = re.compile(r"\(meeting: `([^`]+)`\)")
+_PATTERN_HEADER_RE = re.compile(r"### \[\w+\]\s*(.+)")
+_RULE_HEADER_RE = re.compile(r"### CONFIRMED:\s*(.+)")
+# Every "**Label:** value" field of a block, collected in one scan
+_FIELD_RE = re.compile(
+    r"\*\*(Type|Observed|Scope|First seen|Last seen|Source pattern|Promoted):\*\*\s*(.+)"
+)
+
 
 class MemoryTier(str, Enum):
     short = "short-term"
@@ -57,14 +88,10 @@ class MemoryEntry:
     source_meeting_id: str = ""
 
     def to_markdown_line(self) -> str:
-        parts = [f"- [{self.timestamp}]"]
-        parts.append(f"**{self.signal_type}**:")
-        parts.append(self.content)
-        if self.context:
-            parts.append(f"— _{self.context}_")
-        if self.source_meeting_id:
-            parts.append(f"(meeting: `{self.source_meeting_id[:8]}`)")
-        return " ".join(parts)
+        # One f-string; the optional suffixes carry their own leading space
+        context = f" — _{self.context}_" if self.context else ""
+        meeting = f" (meeting: `{self.source_meeting_id[:8]}`)" if self.source_meeting_id else ""
+        return f"- [{self.timestamp}] **{self.signal_type}**: {self.content}{context}{meeting}"
 
 
 @dataclass
@@ -74,13 +101,17 @@ class PatternEntry:
     observation_count: int
     first_seen: str
     last_seen: str
-    supporting_evidence: list[str] = field(default_factory=list)
+    supporting_evidence: deque = field(default_factory=lambda: deque(maxlen=EVIDENCE_LIMIT))
     context_scope: str = "universal"  # "universal" | specific scope like "standup" or "client-meeting"
 
+    def __post_init__(self):
+        # Capped at construction, so extending it later never grows past EVIDENCE_LIMIT
+        if not isinstance(self.supporting_evidence, deque) or self.supporting_evidence.maxlen != EVIDENCE_LIMIT:
+            self.supporting_evidence = deque(self.supporting_evidence, maxlen=EVIDENCE_LIMIT)
+
     @property
     def id(self) -> str:
-        raw = f"{self.signal_type}:{self.pattern}:{self.context_scope}"
-        return hashlib.md5(raw.encode()).hexdigest()[:10]
+        return _pattern_id(f"{self.signal_type}:{self.pattern}:{self.context_scope}")
 
     def to_markdown_block(self) -> str:
         lines = [
@@ -93,12 +124,19 @@ class PatternEntry:
         ]
         if self.supporting_evidence:
             lines.append("- **Evidence:**")
-            for e in self.supporting_evidence[-5:]:  # Keep last 5
+            for e in self.supporting_evidence:
                 lines.append(f"  - {e}")
         lines.append("")
         return "\n".join(lines)
 
 
+@lru_cache(maxsize=4096)
+def _pattern_id(raw: str) -> str:
+    # MD5 is kept (not a faster hash) because ids are persisted in the memory
+    # files and referenced by long-term rules; memoizing removes the rehash
+    return hashlib.md5(raw.encode()).hexdigest()[:10]
+
+
 @dataclass
 class ConfirmedRule:
     rule: str
@@ -127,6 +165,8 @@ class MemoryStore:
     PROMOTION_TO_MEDIUM_THRESHOLD = 3    # Short→medium after N occurrences
     PROMOTION_TO_LONG_THRESHOLD = 8      # Medium→long after N total observations
     MEDIUM_REINFORCEMENT_WINDOW = 5      # New signals within this count reinforce existing patterns
+    SHORT_BUFFER_BYTES = 64 * 1024       # Buffered short-term lines are written once they exceed this
+    MMAP_MIN_BYTES = 1024 * 1024         # Tier files at least this large are parsed through mmap
 
     def __init__(self, memory_dir: Optional[Path] = None):
         self.memory_dir = memory_dir or settings.memory_dir
@@ -134,16 +174,32 @@ class MemoryStore:
         self._short_path = self.memory_dir / "short-term.md"
         self._medium_path = self.memory_dir / "medium-term.md"
         self._long_path = self.memory_dir / "long-term.md"
+        # Serializes appends with clear_short_term() so no signal lands in a cleared range
+        self._write_lock = threading.Lock()
+        # Short-term lines not yet written; every reader of the file flushes first
+        self._short_buffer: list[str] = []
+        self._short_buffer_bytes = 0
+        # O_APPEND descriptor the buffer is flushed through; reopened after the file is replaced
+        self._short_fd: Optional[int] = None
+        # ((mtime_ns, size), entries) of short-term.md
+        self._short_cache: Optional[tuple[tuple[int, int], list[MemoryEntry]]] = None
+        # ((mtime_ns, size), rules, lower-cased rule texts) of long-term.md
+        self._long_cache: Optional[tuple[tuple[int, int], list[ConfirmedRule], frozenset[str]]] = None
         self._ensure_files()
+        atexit.register(self.close)
 
     def _ensure_files(self):
+        # Once per directory per process; later stores over it skip the stats
+        if self.memory_dir in _initialized_dirs:
+            return
         for path, header in [
-            (self._short_path, "# Short-Term Memory\n"),
+            (self._short_path, SHORT_TERM_HEADER),
             (self._medium_path, "# Medium-Term Memory\n"),
             (self._long_path, "# Long-Term Memory\n"),
         ]:
             if not path.exists():
                 path.write_text(header, encoding="utf-8")
+        _initialized_dirs.add(self.memory_dir)
 
     # ── Short-Term: Record signals ────────────────────────────────────────────
 
@@ -154,7 +210,7 @@ class MemoryStore:
         context: str = "",
         source_meeting_id: str = "",
     ) -> MemoryEntry:
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M")
+        now = _utc_minute()
         entry = MemoryEntry(
             timestamp=now,
             signal_type=signal_type.value,
@@ -166,38 +222,129 @@ class MemoryStore:
         logger.info(f"Memory signal recorded: [{signal_type.value}] {content[:60]}")
         return entry
 
+    def record_signals(
+        self,
+        signals: Iterable[tuple],
+        source_meeting_id: str = "",
+    ) -> list[MemoryEntry]:
+        """
+        Record several (signal_type, content, context) signals with one
+        timestamp and a single file append. A fourth tuple item overrides
+        `source_meeting_id` for that signal.
+        """
+        now = _utc_minute()
+        entries = [
+            MemoryEntry(
+                timestamp=now,
+                signal_type=signal_type.value,
+                content=content,
+                context=context,
+                source_meeting_id=meeting_id[0] if meeting_id else source_meeting_id,
+            )
+            for signal_type, content, context, *meeting_id in signals
+        ]
+        if not entries:
+            return []
+        self._append_lines(self._short_path, [e.to_markdown_line() for e in entries])
+        logger.info(f"Memory signals recorded: {len(entries)}")
+        return entries
+
     # ── Read tiers ────────────────────────────────────────────────────────────
 
     def read_tier(self, tier: MemoryTier) -> str:
-        path = self._path_for_tier(tier)
+        if tier == MemoryTier.short:
+            self.flush_short_term()
+        path = self.path_for_tier(tier)
         return path.read_text(encoding="utf-8")
 
     def read_short_term_entries(self) -> list[MemoryEntry]:
-        text = self._short_path.read_text(encoding="utf-8")
-        entries = []
-        for line in text.splitlines():
-            line = line.strip()
-            if not line.startswith("- ["):
-                continue
-            entry = self._parse_short_term_line(line)
-            if entry:
-                entries.append(entry)
-        return entries
+        return list(self._short_term())
+
+    def short_term_count(self) -> int:
+        """Number of short-term entries; only a stat() while the file is unchanged."""
+        return len(self._short_term())
+
+    def has_short_term_signals(self) -> bool:
+        """
+        Whether any short-term signal is pending. A header-only file (the
+        state consolidation leaves behind) is answered from its size alone.
+        """
+        self.flush_short_term()
+        if self._short_path.stat().st_size <= len(SHORT_TERM_HEADER.encode("utf-8")):
+            return False
+        return self.short_term_count() > 0
+
+    def _short_term(self) -> list[MemoryEntry]:
+        # Parsed once per version of the file, like _long_term()
+        self.flush_short_term()
+        stat = self._short_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._short_cache is None or self._short_cache[0] != signature:
+            self._short_cache = (signature, list(self.iter_short_term_entries()))
+        return self._short_cache[1]
+
+    def iter_short_term_entries(self, end: Optional[int] = None) -> Iterator[MemoryEntry]:
+        """
+        Stream short-term entries line by line instead of loading the file.
+        `end` (a short_term_size() result) stops at that byte offset, so
+        signals appended while the caller works are left for later.
+        """
+        self.flush_short_term()
+        offset = 0
+        with open(self._short_path, "rb") as f:
+            for raw in f:
+                offset += len(raw)
+                if end is not None and offset > end:
+                    break
+                line = raw.decode("utf-8").strip()
+                if not line.startswith("- ["):
+                    continue
+                entry = self._parse_short_term_line(line)
+                if entry:
+                    yield entry
+
+    def short_term_size(self) -> int:
+        """Byte length of the short-term file; an `end` for iter_short_term_entries()."""
+        self.flush_short_term()
+        return self._short_path.stat().st_size
 
     def read_medium_term_patterns(self) -> list[PatternEntry]:
-        text = self._medium_path.read_text(encoding="utf-8")
-        return self._parse_patterns(text)
+        return self._parse_patterns(self._iter_blocks(self._medium_path, _PATTERN_HEADING))
 
     def read_long_term_rules(self) -> list[ConfirmedRule]:
-        text = self._long_path.read_text(encoding="utf-8")
-        return self._parse_rules(text)
+        return list(self._long_term()[1])
+
+    def long_term_rule_texts(self) -> frozenset[str]:
+        """Lower-cased long-term rule texts, for membership checks."""
+        return self._long_term()[2]
+
+    def _long_term(self):
+        # Parsed once per version of the file (user edits change its stat too)
+        stat = self._long_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._long_cache is None or self._long_cache[0] != signature:
+            rules = self._parse_rules(self._iter_blocks(self._long_path, _RULE_HEADING))
+            self._long_cache = (signature, rules, frozenset(r.rule.lower() for r in rules))
+        return self._long_cache
 
     # ── Write / Update tiers ──────────────────────────────────────────────────
 
     def update_tier(self, tier: MemoryTier, content: str):
         """Replace entire tier content. Used for user edits (high-priority signal)."""
-        path = self._path_for_tier(tier)
-        path.write_text(content, encoding="utf-8")
+        path = self.path_for_tier(tier)
+        if tier == MemoryTier.short:
+            # Held across flush, replace and fd close so no append lands in the replaced file
+            with self._write_lock:
+                self._flush_short_buffer()
+                with _atomic_open(path, "w", encoding="utf-8") as f:
+                    f.write(content)
+                self._close_short_fd()
+                self._short_cache = None
+        else:
+            with _atomic_open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            if tier == MemoryTier.long:
+                self._long_cache = None
         logger.info(f"Memory tier '{tier.value}' updated by user.")
         # User edit to memory is itself a signal
         if tier == MemoryTier.long:
@@ -207,18 +354,29 @@ class MemoryStore:
             )
 
     def write_medium_term(self, patterns: list[PatternEntry]):
-        header = "# Medium-Term Memory\n\n"
-        body = "\n".join(p.to_markdown_block() for p in patterns)
-        self._medium_path.write_text(header + body, encoding="utf-8")
+        self._write_blocks(self._medium_path, "# Medium-Term Memory\n\n", patterns)
 
     def write_long_term(self, rules: list[ConfirmedRule]):
-        header = "# Long-Term Memory\n\n"
-        body = "\n".join(r.to_markdown_block() for r in rules)
-        self._long_path.write_text(header + body, encoding="utf-8")
-
-    def clear_short_term(self):
-        """Wipe short-term after consolidation consumes it."""
-        self._short_path.write_text("# Short-Term Memory\n", encoding="utf-8")
+        self._write_blocks(self._long_path, "# Long-Term Memory\n\n", rules)
+        self._long_cache = None
+
+    def clear_short_term(self, upto: Optional[int] = None):
+        """
+        Wipe short-term after consolidation consumes it. With `upto` (the
+        `end` the entries were read with) only that prefix is dropped and any
+        signals appended since are kept.
+        """
+        with self._write_lock:
+            self._flush_short_buffer()
+            remaining = b""
+            if upto is not None:
+                with open(self._short_path, "rb") as f:
+                    f.seek(upto)
+                    remaining = f.read()
+            with _atomic_open(self._short_path, "wb") as f:
+                f.write(SHORT_TERM_HEADER.encode("utf-8") + remaining)
+            self._close_short_fd()
+            self._short_cache = None
         logger.info("Short-term memory cleared after consolidation.")
 
     # ── Convenience: common signal types ──────────────────────────────────────
@@ -246,6 +404,13 @@ class MemoryStore:
             source_meeting_id=meeting_id,
         )
 
+    def record_content_deletions(self, items: list[str], meeting_id: str = ""):
+        """record_content_deletion() for many items in one write."""
+        self.record_signals(
+            [(SignalType.content_deletion, f"User deleted: {item}", "") for item in items],
+            source_meeting_id=meeting_id,
+        )
+
     def record_vocabulary(self, term: str, context: str = "", meeting_id: str = ""):
         self.record_signal(
             SignalType.vocabulary,
@@ -262,6 +427,20 @@ class MemoryStore:
             source_meeting_id=meeting_id,
         )
 
+    def record_vocabulary_bulk(self, terms: list[str], context: str = "", meeting_id: str = ""):
+        """record_vocabulary() for many terms in one write; duplicates are recorded once."""
+        self.record_signals(
+            [(SignalType.vocabulary, f"Domain term: '{t}'", context) for t in dict.fromkeys(terms)],
+            source_meeting_id=meeting_id,
+        )
+
+    def record_people_bulk(self, names: list[str], context: str = "", meeting_id: str = ""):
+        """record_person() for many names in one write; duplicates are recorded once."""
+        self.record_signals(
+            [(SignalType.person, f"Person encountered: {n}", context) for n in dict.fromkeys(names)],
+            source_meeting_id=meeting_id,
+        )
+
     def record_preference(self, preference: str, meeting_id: str = ""):
         self.record_signal(
             SignalType.preference,
@@ -272,10 +451,7 @@ class MemoryStore:
     # ── Parsing helpers ───────────────────────────────────────────────────────
 
     def _parse_short_term_line(self, line: str) -> Optional[MemoryEntry]:
-        match = re.match(
-            r"^- \[(\d{4}-\d{2}-\d{2} \d{2}:\d{2})\]\s+\*\*(\w+)\*\*:\s*(.+)$",
-            line,
-        )
+        match = _SHORT_LINE_RE.match(line)
         if not match:
             return None
 
@@ -284,11 +460,11 @@ class MemoryStore:
         # Extract optional context and meeting id
         context = ""
         meeting_id = ""
-        ctx_match = re.search(r"— _(.+?)_", rest)
+        ctx_match = _CONTEXT_RE.search(rest)
         if ctx_match:
             context = ctx_match.group(1)
             rest = rest[: ctx_match.start()].strip()
-        mid_match = re.search(r"\(meeting: `([^`]+)`\)", rest)
+        mid_match = _MEETING_ID_RE.search(rest)
         if mid_match:
             meeting_id = mid_match.group(1)
             rest = rest[: mid_match.start()].strip()
@@ -301,69 +477,184 @@ class MemoryStore:
             source_meeting_id=meeting_id,
         )
 
-    def _parse_patterns(self, text: str) -> list[PatternEntry]:
+    def _parse_patterns(self, blocks: Iterable[str]) -> list[PatternEntry]:
         patterns = []
-        blocks = re.split(r"(?=^### \[)", text, flags=re.MULTILINE)
         for block in blocks:
             block = block.strip()
             if not block.startswith("### ["):
                 continue
-            header_match = re.match(r"### \[\w+\]\s*(.+)", block)
+            header_match = _PATTERN_HEADER_RE.match(block)
             if not header_match:
                 continue
             pattern_text = header_match.group(1)
-
-            def _extract(label: str) -> str:
-                m = re.search(rf"\*\*{label}:\*\*\s*(.+)", block)
-                return m.group(1).strip() if m else ""
+            fields = _parse_fields(block)
 
             patterns.append(PatternEntry(
                 pattern=pattern_text,
-                signal_type=_extract("Type"),
-                observation_count=int(_extract("Observed").split()[0] or "0"),
-                context_scope=_extract("Scope") or "universal",
-                first_seen=_extract("First seen"),
-                last_seen=_extract("Last seen"),
+                signal_type=fields.get("Type", ""),
+                observation_count=int((fields.get("Observed") or "0").split()[0]),
+                context_scope=fields.get("Scope") or "universal",
+                first_seen=fields.get("First seen", ""),
+                last_seen=fields.get("Last seen", ""),
             ))
         return patterns
 
-    def _parse_rules(self, text: str) -> list[ConfirmedRule]:
+    def _parse_rules(self, blocks: Iterable[str]) -> list[ConfirmedRule]:
         rules = []
-        blocks = re.split(r"(?=^### CONFIRMED:)", text, flags=re.MULTILINE)
         for block in blocks:
             block = block.strip()
             if not block.startswith("### CONFIRMED:"):
                 continue
-            header_match = re.match(r"### CONFIRMED:\s*(.+)", block)
+            header_match = _RULE_HEADER_RE.match(block)
             if not header_match:
                 continue
             rule_text = header_match.group(1)
-
-            def _extract(label: str) -> str:
-                m = re.search(rf"\*\*{label}:\*\*\s*(.+)", block)
-                return m.group(1).strip() if m else ""
+            fields = _parse_fields(block)
 
             rules.append(ConfirmedRule(
                 rule=rule_text,
-                signal_type=_extract("Type"),
-                promoted_from=_extract("Source pattern").strip("`"),
-                promoted_at=_extract("Promoted"),
-                context_scope=_extract("Scope") or "universal",
+                signal_type=fields.get("Type", ""),
+                promoted_from=fields.get("Source pattern", "").strip("`"),
+                promoted_at=fields.get("Promoted", ""),
+                context_scope=fields.get("Scope") or "universal",
             ))
         return rules
 
     # ── Internal helpers ──────────────────────────────────────────────────────
 
-    def _path_for_tier(self, tier: MemoryTier) -> Path:
+    def _write_blocks(self, path: Path, header: str, items: Iterable):
+        """
+        Write a tier file block by block through a 64 KiB buffer rather than
+        joining the whole file into one string first; blocks are separated
+        by a newline, as before.
+        """
+        with _atomic_open(path, "w", encoding="utf-8", buffering=1 << 16) as f:
+            f.write(header)
+            for i, item in enumerate(items):
+                if i:
+                    f.write("\n")
+                f.write(item.to_markdown_block())
+
+    def _iter_blocks(self, path: Path, heading: bytes) -> Iterator[str]:
+        """
+        The blocks of a tier file, each starting at a line that begins with
+        the literal `heading` (found with find(), not a regex scan). Files
+        of MMAP_MIN_BYTES or more are scanned through a read-only memory map,
+        so only one block at a time is copied out and decoded.
+        """
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size >= self.MMAP_MIN_BYTES else f.read()
+            try:
+                starts = [0] if data[:len(heading)] == heading else []
+                marker = b"\n" + heading
+                pos = data.find(marker)
+                while pos != -1:
+                    starts.append(pos + 1)
+                    pos = data.find(marker, pos + 1)
+                for start, end in zip(starts, starts[1:] + [len(data)]):
+                    yield data[start:end].decode("utf-8").strip()
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+
+    def path_for_tier(self, tier: MemoryTier) -> Path:
+        """File backing `tier`; call flush_short_term() before reading the short-term one directly."""
         return {
             MemoryTier.short: self._short_path,
             MemoryTier.medium: self._medium_path,
             MemoryTier.long: self._long_path,
         }[tier]
 
+    def flush_short_term(self):
+        """Write buffered short-term signals to the file."""
+        with self._write_lock:
+            self._flush_short_buffer()
+
+    def close(self):
+        """Flush buffered signals and release the short-term file descriptor."""
+        with self._write_lock:
+            self._flush_short_buffer()
+            self._close_short_fd()
+
+    def _flush_short_buffer(self):
+        # Caller holds self._write_lock
+        if not self._short_buffer:
+            return
+        if self._short_fd is None:
+            self._short_fd = os.open(self._short_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        data = "".join(self._short_buffer).encode("utf-8")
+        while data:
+            data = data[os.write(self._short_fd, data):]
+        self._short_cache = None
+        self._short_buffer = []
+        self._short_buffer_bytes = 0
+
+    def _close_short_fd(self):
+        # Caller holds self._write_lock; the next flush reopens the (replaced) file
+        if self._short_fd is not None:
+            os.close(self._short_fd)
+            self._short_fd = None
+
     def _append_to_file(self, path: Path, line: str):
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        self._append_lines(path, [line])
+
+    def _append_lines(self, path: Path, lines: list[str]):
+        with self._write_lock:
+            if path == self._short_path:
+                # Coalesced into one write per SHORT_BUFFER_BYTES instead of one per signal
+                for line in lines:
+                    self._short_buffer.append(line + "\n")
+                    self._short_buffer_bytes += len(line) + 1
+                if self._short_buffer_bytes > self.SHORT_BUFFER_BYTES:
+                    self._flush_short_buffer()
+                return
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("".join(line + "\n" for line in lines))
+
+
+@contextmanager
+def _atomic_open(path: Path, mode: str, **kwargs):
+    """
+    open() for rewriting a whole file: writes go to a sibling temp file that
+    replaces `path` only once complete, so a crash mid-write never leaves a
+    truncated tier and readers see either the old or the new content.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# (epoch minute, its "%Y-%m-%d %H:%M" string); swapped as one tuple, so no lock is needed
+_minute_stamp: tuple[int, str] = (-1, "")
+
+
+def _utc_minute() -> str:
+    """Current UTC time as "YYYY-MM-DD HH:MM", formatted once per minute."""
+    global _minute_stamp
+    minute = int(time.time() // 60)
+    if minute != _minute_stamp[0]:
+        tm = time.gmtime(minute * 60)
+        _minute_stamp = (
+            minute,
+            f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d} {tm.tm_hour:02d}:{tm.tm_min:02d}",
+        )
+    return _minute_stamp[1]
+
+
+def _parse_fields(block: str) -> dict[str, str]:
+    """Label -> value of a block's fields; the first occurrence of a label wins."""
+    fields: dict[str, str] = {}
+    for m in _FIELD_RE.finditer(block):
+        fields.setdefault(m.group(1), m.group(2).strip())
+    return fields
 
 
 # Module-level singleton
@@ -11,16 +11,21 @@ Rules:
   - Never interrupts user activity (except the biweekly forced fallback).
 """
 
-import json
 import logging
+import os
 import threading
 import time
+from concurrent.futures import Future
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
+
+import orjson
 
 from backend.config.settings import settings
-from backend.learning.consolidation import ConsolidationEngine, consolidator
+
+if TYPE_CHECKING:
+    from backend.learning.consolidation import ConsolidationEngine
 
 logger = logging.getLogger(__name__)
 
@@ -35,14 +40,16 @@ class ConsolidationScheduler:
 
     def __init__(
         self,
-        engine: Optional[ConsolidationEngine] = None,
+        engine: Optional["ConsolidationEngine"] = None,
         idle_checker: Optional[Callable[[], bool]] = None,
         check_interval_seconds: float = 60.0,
         max_daily_runs: int = 1,
         forced_interval_days: int = 14,
         state_dir: Optional[Path] = None,
     ):
-        self._engine = engine or consolidator
+        # Resolved on first use: importing the engine pulls in the LLM client
+        # and memory store, which the API process should not pay for at startup
+        self._engine_instance = engine
         self._idle_checker = idle_checker or _default_idle_checker
         self._check_interval = check_interval_seconds
         self._max_daily_runs = max_daily_runs
@@ -50,14 +57,27 @@ class ConsolidationScheduler:
         self._state_dir = state_dir or settings.memory_dir
 
         self._running = False
+        # Set by stop(); the loop waits on it instead of polling _running
+        self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._last_run: Optional[datetime] = None
         self._runs_today: int = 0
         self._today_date: Optional[str] = None
         self._last_stats: Optional[dict] = None
+        # Guards the run bookkeeping below, which the consolidation worker updates
+        self._state_lock = threading.Lock()
+        # (engine pass, future resolved after its bookkeeping); the engine shares an in-flight pass
+        self._pending: Optional[tuple[Future, Future]] = None
 
         self._load_state()
 
+    @property
+    def _engine(self) -> "ConsolidationEngine":
+        if self._engine_instance is None:
+            from backend.learning.consolidation import consolidator
+            self._engine_instance = consolidator
+        return self._engine_instance
+
     # ── Public interface ─────────────────────────────────────────────────────
 
     def start(self):
@@ -67,6 +87,7 @@ class ConsolidationScheduler:
             return
 
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(
             target=self._loop, daemon=True, name="consolidation-scheduler"
         )
@@ -80,45 +101,54 @@ class ConsolidationScheduler:
     def stop(self):
         """Stop the scheduler gracefully."""
         self._running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=10.0)
             self._thread = None
-        self._save_state()
+        with self._state_lock:
+            self._save_state()
         logger.info("Consolidation scheduler stopped.")
 
     def status(self) -> dict:
         """Return current scheduler status for monitoring/API."""
         now = datetime.now(timezone.utc)
+        with self._state_lock:
+            last_run, runs_today, last_stats = self._last_run, self._runs_today, self._last_stats
         next_forced = None
-        if self._last_run:
-            next_forced = (self._last_run + self._forced_interval).isoformat()
+        if last_run:
+            next_forced = (last_run + self._forced_interval).isoformat()
 
         since_last = None
-        if self._last_run:
-            since_last = (now - self._last_run).total_seconds()
+        if last_run:
+            since_last = (now - last_run).total_seconds()
 
         return {
             "running": self._running,
-            "last_run": self._last_run.isoformat() if self._last_run else None,
+            "last_run": last_run.isoformat() if last_run else None,
             "seconds_since_last_run": round(since_last, 1) if since_last else None,
-            "runs_today": self._runs_today,
+            "runs_today": runs_today,
             "max_daily_runs": self._max_daily_runs,
             "forced_deadline": next_forced,
             "forced_interval_days": self._forced_interval.days,
             "is_idle": self._idle_checker(),
-            "last_stats": self._last_stats,
+            "last_stats": last_stats,
         }
 
-    def force_run(self) -> dict:
-        """Manually trigger a consolidation run, bypassing idle/schedule checks."""
+    def force_run(self) -> Future:
+        """
+        Manually trigger a consolidation run, bypassing idle/schedule checks.
+        Returns the run's future, resolved once the pass and its bookkeeping
+        are done; the pass itself happens on the consolidation worker.
+        """
         logger.info("Forced consolidation triggered.")
-        return self._execute()
+        return self._submit()
 
     # ── Core loop ────────────────────────────────────────────────────────────
 
     def _loop(self):
         # Small initial delay to let the server finish starting up
-        time.sleep(5.0)
+        if self._stop_event.wait(timeout=5.0):
+            return
 
         while self._running:
             try:
@@ -126,42 +156,44 @@ class ConsolidationScheduler:
             except Exception as e:
                 logger.error(f"Consolidation scheduler error: {e}", exc_info=True)
 
-            # Sleep in small increments so stop() is responsive
-            slept = 0.0
-            while slept < self._check_interval and self._running:
-                time.sleep(min(2.0, self._check_interval - slept))
-                slept += 2.0
+            # One wakeup per interval; stop() ends the wait immediately
+            if self._stop_event.wait(timeout=self._check_interval):
+                break
 
     def _tick(self):
+        # Bounds how long buffered short-term signals stay only in memory
+        self._engine.store.flush_short_term()
+
         now = datetime.now(timezone.utc)
         today = now.strftime("%Y-%m-%d")
 
-        # Reset daily counter on new day
-        if today != self._today_date:
-            self._today_date = today
-            self._runs_today = 0
+        with self._state_lock:
+            # Reset daily counter on new day
+            if today != self._today_date:
+                self._today_date = today
+                self._runs_today = 0
+            last_run, runs_today = self._last_run, self._runs_today
 
         # Check if already hit daily limit
-        if self._runs_today >= self._max_daily_runs:
+        if runs_today >= self._max_daily_runs:
             return
 
         # Check if forced run is overdue (biweekly guarantee)
         forced_overdue = False
-        if self._last_run is None:
+        if last_run is None:
             # Never run before — treat as overdue after a grace period
             forced_overdue = True
-        elif (now - self._last_run) >= self._forced_interval:
+        elif (now - last_run) >= self._forced_interval:
             forced_overdue = True
 
         if forced_overdue:
             # Even forced runs skip if there are no signals at all
-            short_entries = self._engine.store.read_short_term_entries()
-            if not short_entries:
+            if not self._engine.store.has_short_term_signals():
                 return
             logger.info(
                 "Consolidation forced: "
-                f"{'never run before' if self._last_run is None else f'{self._forced_interval.days}-day deadline reached'} "
-                f"({len(short_entries)} pending signals)."
+                f"{'never run before' if last_run is None else f'{self._forced_interval.days}-day deadline reached'} "
+                f"({self._engine.store.short_term_count()} pending signals)."
             )
             self._execute()
             return
@@ -171,32 +203,53 @@ class ConsolidationScheduler:
             return
 
         # Check there are actually signals to process
-        short_entries = self._engine.store.read_short_term_entries()
-        if not short_entries:
+        if not self._engine.store.has_short_term_signals():
             return
 
         logger.info(
-            f"System idle with {len(short_entries)} pending signals. "
+            f"System idle with {self._engine.store.short_term_count()} pending signals. "
             "Starting consolidation."
         )
         self._execute()
 
     def _execute(self) -> dict:
-        """Run the consolidation engine and update bookkeeping."""
-        stats = self._engine.run()
-
-        if stats.get("skipped"):
-            logger.info("Consolidation skipped (already in progress).")
-            return stats
+        """Run the consolidation engine and wait for it and its bookkeeping."""
+        return self._submit().result()
+
+    def _submit(self) -> Future:
+        """
+        Schedule a pass. The returned future resolves only after the pass's
+        bookkeeping, so callers waiting on it never see stale state.
+        """
+        future = self._engine.schedule()
+        with self._state_lock:
+            if self._pending is not None and self._pending[0] is future:
+                logger.info("Consolidation skipped (already in progress).")
+                return self._pending[1]
+            recorded: Future = Future()
+            self._pending = (future, recorded)
+        future.add_done_callback(lambda f: self._record_run(f, recorded))
+        return recorded
+
+    def _record_run(self, future: Future, recorded: Future):
+        """Update bookkeeping once a pass finishes, then resolve `recorded`."""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Consolidation failed: {error}")
+            recorded.set_exception(error)
+            return
+        stats = future.result()
 
-        now = datetime.now(timezone.utc)
-        self._last_run = now
-        self._runs_today += 1
-        self._last_stats = stats
-        self._save_state()
+        try:
+            with self._state_lock:
+                self._last_run = datetime.now(timezone.utc)
+                self._runs_today += 1
+                self._last_stats = stats
+                self._save_state()
+        finally:
+            recorded.set_result(stats)
 
         logger.info(f"Consolidation complete. Stats: {stats}")
-        return stats
 
     # ── State persistence ────────────────────────────────────────────────────
 
@@ -209,7 +262,7 @@ class ConsolidationScheduler:
             return
 
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = orjson.loads(path.read_bytes())
             if data.get("last_run"):
                 self._last_run = datetime.fromisoformat(data["last_run"])
             today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
@@ -224,6 +277,7 @@ class ConsolidationScheduler:
             logger.warning(f"Failed to load consolidation state: {e}")
 
     def _save_state(self):
+        # Caller holds self._state_lock
         path = self._state_path()
         data = {
             "last_run": self._last_run.isoformat() if self._last_run else None,
@@ -232,7 +286,10 @@ class ConsolidationScheduler:
             "last_stats": self._last_stats,
         }
         try:
-            path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            # Temp file + rename, so a crash mid-write cannot corrupt the state
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            tmp.write_bytes(orjson.dumps(data))
+            os.replace(tmp, path)
         except Exception as e:
             logger.error(f"Failed to save consolidation state: {e}")
 
@@ -241,20 +298,44 @@ class ConsolidationScheduler:
 
 # Registry of activity indicators. Other modules register themselves here.
 # Each callable returns True if that subsystem is currently busy.
-_activity_indicators: list[Callable[[], bool]] = []
+# Replaced (never mutated) under the lock, so the scheduler thread reads it without one.
+_activity_indicators: tuple[Callable[[], bool], ...] = ()
+_indicators_lock = threading.Lock()
 
 
-def register_activity_indicator(indicator: Callable[[], bool]):
+def register_activity_indicator(indicator: Callable[[], bool], cache_seconds: float = 0.0):
     """
     Register a function that returns True when its subsystem is busy.
     The scheduler considers the system idle only when ALL indicators return False.
 
+    For slow probes (e.g. a DB query), pass `cache_seconds` to reuse the last
+    result for that long instead of re-running the probe on every check.
+
     Usage from other modules:
         from backend.learning.scheduler import register_activity_indicator
         register_activity_indicator(lambda: len(active_sessions) > 0)
     """
-    _activity_indicators.append(indicator)
-    logger.debug(f"Activity indicator registered (total: {len(_activity_indicators)})")
+    global _activity_indicators
+    if cache_seconds > 0:
+        indicator = _cached_indicator(indicator, cache_seconds)
+    with _indicators_lock:
+        _activity_indicators = _activity_indicators + (indicator,)
+        total = len(_activity_indicators)
+    logger.debug(f"Activity indicator registered (total: {total})")
+
+
+def _cached_indicator(indicator: Callable[[], bool], ttl: float) -> Callable[[], bool]:
+    # (expires_at, result), swapped as one tuple
+    last = (0.0, False)
+
+    def cached() -> bool:
+        nonlocal last
+        now = time.monotonic()
+        if now >= last[0]:
+            last = (now + ttl, bool(indicator()))
+        return last[1]
+
+    return cached
 
 
 def _default_idle_checker() -> bool:
@@ -262,7 +343,7 @@ def _default_idle_checker() -> bool:
     Returns True when the system is idle (no subsystem is busy).
     If no indicators are registered, assumes idle.
     """
-    for indicator in _activity_indicators:
+    for indicator in _activity_indicators:  # the tuple is an immutable snapshot
         try:
             if indicator():
                 return False  # At least one subsystem is busy
@@ -47,6 +47,7 @@ class Meeting(Base):
     segments = relationship("TranscriptSegment", back_populates="meeting", cascade="all, delete-orphan")
     speakers = relationship("MeetingSpeaker", back_populates="meeting", cascade="all, delete-orphan")
     analysis = relationship("MeetingAnalysis", back_populates="meeting", uselist=False, cascade="all, delete-orphan")
+    corrections = relationship("UserCorrection", back_populates="meeting")
 
 
 class Speaker(Base):
@@ -193,4 +194,4 @@ class UserCorrection(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     analysis = relationship("MeetingAnalysis", back_populates="corrections")
-    meeting = relationship("Meeting", backref="corrections")
+    meeting = relationship("Meeting", back_populates="corrections")
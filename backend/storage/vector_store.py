@@ -13,8 +13,12 @@ Collections:
 """
 
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
+
+import numpy as np
 
 from backend.config.settings import settings
 
@@ -22,6 +26,12 @@ logger = logging.getLogger(__name__)
 
 CHROMA_DIR = settings.memory_dir.parent / "data" / "db" / "chromadb"
 
+# Well under Chroma's max_batch_size; large enough to amortize per-write overhead
+UPSERT_BATCH_SIZE = 1000
+
+# Query embeddings kept for repeated searches (dashboards re-run the same queries)
+QUERY_CACHE_SIZE = 512
+
 
 class VectorStore:
     """ChromaDB-backed vector store for semantic meeting search."""
@@ -32,20 +42,28 @@ class VectorStore:
     def __init__(self, persist_dir: Optional[Path] = None):
         self._persist_dir = str(persist_dir or CHROMA_DIR)
         Path(self._persist_dir).mkdir(parents=True, exist_ok=True)
+        # LRU of query text -> embedding
+        self._query_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
         try:
             import chromadb
             from chromadb.config import Settings as ChromaSettings
+            from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
             self._client = chromadb.PersistentClient(
                 path=self._persist_dir,
                 settings=ChromaSettings(anonymized_telemetry=False),
             )
+            # Shared explicitly so embed() produces vectors every collection accepts
+            self._embedding_fn = DefaultEmbeddingFunction()
             self._segments = self._client.get_or_create_collection(
                 name=self.SEGMENTS_COLLECTION,
                 metadata={"hnsw:space": "cosine"},
+                embedding_function=self._embedding_fn,
             )
             self._summaries = self._client.get_or_create_collection(
                 name=self.SUMMARIES_COLLECTION,
                 metadata={"hnsw:space": "cosine"},
+                embedding_function=self._embedding_fn,
             )
             self._available = True
             logger.info(
@@ -56,6 +74,7 @@ class VectorStore:
         except Exception as e:
             logger.warning(f"ChromaDB unavailable, vector search disabled: {e}")
             self._client = None
+            self._embedding_fn = None
             self._segments = None
             self._summaries = None
             self._available = False
@@ -94,7 +113,7 @@ class VectorStore:
                 "speaker": seg.get("speaker", "Unknown"),
             })
 
-        self._segments.upsert(ids=ids, documents=documents, metadatas=metadatas)
+        _upsert_batched(self._segments, ids, documents, metadatas, self._embedding_fn)
         logger.info(f"Stored {len(ids)} segments for meeting {meeting_id[:8]}")
 
     def add_summary(
@@ -122,6 +141,40 @@ class VectorStore:
 
         self._summaries.upsert(ids=[doc_id], documents=[text], metadatas=[meta])
 
+    def add_summaries(
+        self,
+        meeting_id: str,
+        items: list[dict],
+    ):
+        """
+        Store several summaries in one batched write.
+
+        Each item dict should have:
+          - summary_type: as for add_summary
+          - text: summary text (blank items are skipped)
+          - metadata: optional extra metadata
+        """
+        if not self._available:
+            return
+
+        ids = []
+        documents = []
+        metadatas = []
+
+        for item in items:
+            if not item["text"].strip():
+                continue
+            ids.append(f"{meeting_id}_{item['summary_type']}")
+            documents.append(item["text"])
+            metadatas.append({
+                "meeting_id": meeting_id,
+                "summary_type": item["summary_type"],
+                **(item.get("metadata") or {}),
+            })
+
+        if ids:
+            _upsert_batched(self._summaries, ids, documents, metadatas, self._embedding_fn)
+
     def search_segments(
         self,
         query: str,
@@ -134,7 +187,7 @@ class VectorStore:
         where = {"meeting_id": meeting_id} if meeting_id else None
 
         results = self._segments.query(
-            query_texts=[query],
+            query_embeddings=self._query_embeddings([query]),
             n_results=n_results,
             where=where,
             include=["documents", "metadatas", "distances"],
@@ -147,6 +200,7 @@ class VectorStore:
         query: str,
         n_results: int = 5,
         summary_type: Optional[str] = None,
+        min_relevance: float = 0.0,
     ) -> list[dict]:
         """Semantic search across meeting summaries."""
         if not self._available:
@@ -154,28 +208,72 @@ class VectorStore:
         where = {"summary_type": summary_type} if summary_type else None
 
         results = self._summaries.query(
-            query_texts=[query],
+            query_embeddings=self._query_embeddings([query]),
             n_results=n_results,
             where=where,
             include=["documents", "metadatas", "distances"],
         )
 
-        return self._format_results(results)
+        return self._format_results(results, min_relevance)
+
+    def search_summaries_multi(
+        self,
+        queries: list[str],
+        n_results: int = 5,
+        min_relevance: float = 0.0,
+    ) -> list[dict]:
+        """
+        Run several summary searches in one batched query.
+        Results are unioned by document, keeping the best relevance, and
+        returned best-first.
+        """
+        if not self._available or not queries:
+            return []
+
+        results = self._summaries.query(
+            query_embeddings=self._query_embeddings(queries),
+            n_results=n_results,
+            include=["documents", "metadatas", "distances"],
+        )
+
+        best: dict[str, dict] = {}
+        for row, ids in enumerate(results["ids"]):
+            for doc_id, doc, meta, dist in zip(
+                ids,
+                results["documents"][row],
+                results["metadatas"][row],
+                results["distances"][row],
+            ):
+                relevance = round(1.0 - dist, 3)
+                if relevance < min_relevance:
+                    continue
+                if doc_id not in best or relevance > best[doc_id]["relevance"]:
+                    best[doc_id] = {"text": doc, "relevance": relevance, **meta}
+
+        return sorted(best.values(), key=lambda x: x["relevance"], reverse=True)[:n_results]
 
     def find_related_meetings(
         self,
-        query: str,
+        query: str = "",
         exclude_meeting_id: Optional[str] = None,
         n_results: int = 5,
+        query_embedding: Optional[Sequence[float]] = None,
     ) -> list[dict]:
         """
         Find meetings related to a query by searching summaries.
         Returns unique meeting IDs with relevance scores.
+
+        Pass `query_embedding` (from embed()) instead of `query` to reuse an
+        embedding already computed for the same text.
         """
         if not self._available:
             return []
+        if query_embedding is None:
+            query_embeddings = self._query_embeddings([query])
+        else:
+            query_embeddings = [query_embedding]
         results = self._summaries.query(
-            query_texts=[query],
+            query_embeddings=query_embeddings,
             n_results=n_results * 2,
             include=["metadatas", "distances"],
         )
@@ -243,6 +341,55 @@ class VectorStore:
 
         logger.info(f"Deleted embeddings for meeting {meeting_id[:8]}")
 
+    def get_collection(self, name: str):
+        """Get (or create) an auxiliary cosine-space collection. None if ChromaDB is unavailable."""
+        if not self._available:
+            return None
+        return self._client.get_or_create_collection(
+            name=name,
+            metadata={"hnsw:space": "cosine"},
+            embedding_function=self._embedding_fn,
+        )
+
+    def embed(self, texts: list[str]) -> Optional[list]:
+        """
+        Embed texts with the store's embedding function, so a vector can be
+        computed once and passed to several queries. None if ChromaDB is unavailable.
+
+        Vectors are float32 arrays, the precision Chroma's index stores anyway,
+        so callers holding them (cache keys, batched writes) keep 4 bytes per
+        dimension rather than Python floats.
+        """
+        if not self._available or not texts:
+            return None
+        return list(np.asarray(self._embedding_fn(texts), dtype=np.float32))
+
+    def _query_embeddings(self, queries: list[str]) -> list[np.ndarray]:
+        """
+        Embeddings for search queries, served from the LRU when the same text
+        was searched recently. Misses are embedded together in one call.
+        """
+        with self._query_cache_lock:
+            cached = {q: self._query_cache[q] for q in queries if q in self._query_cache}
+            for q in cached:
+                self._query_cache.move_to_end(q)
+        misses = list(dict.fromkeys(q for q in queries if q not in cached))
+        if misses:
+            embedded = self.embed(misses)
+            with self._query_cache_lock:
+                for q, vector in zip(misses, embedded):
+                    vector.setflags(write=False)  # shared between callers
+                    cached[q] = self._query_cache[q] = vector
+                while len(self._query_cache) > QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+        return [cached[q] for q in queries]
+
+    def count(self) -> int:
+        """Number of stored summaries, i.e. what related-meeting search can match."""
+        if not self._available:
+            return 0
+        return self._summaries.count()
+
     def stats(self) -> dict:
         if not self._available:
             return {"segments_count": 0, "summaries_count": 0, "available": False}
@@ -252,7 +399,7 @@ class VectorStore:
             "available": True,
         }
 
-    def _format_results(self, results: dict) -> list[dict]:
+    def _format_results(self, results: dict, min_relevance: float = 0.0) -> list[dict]:
         formatted = []
         if not results["documents"]:
             return formatted
@@ -264,14 +411,34 @@ class VectorStore:
                 results["distances"][0],
             )
         ):
+            relevance = round(1.0 - dist, 3)
+            if relevance < min_relevance:
+                continue
             formatted.append({
                 "text": doc,
-                "relevance": round(1.0 - dist, 3),
+                "relevance": relevance,
                 **meta,
             })
         return formatted
 
 
+def _upsert_batched(collection, ids: list, documents: list, metadatas: list, embedding_fn):
+    """
+    Upsert in chunks of UPSERT_BATCH_SIZE: one write per chunk instead of per
+    document. Each chunk is embedded with a single batched `embedding_fn` call
+    and passed as `embeddings=`, so Chroma skips its own embedding step.
+    """
+    for start in range(0, len(ids), UPSERT_BATCH_SIZE):
+        end = start + UPSERT_BATCH_SIZE
+        chunk = documents[start:end]
+        collection.upsert(
+            ids=ids[start:end],
+            documents=chunk,
+            metadatas=metadatas[start:end],
+            embeddings=np.asarray(embedding_fn(chunk), dtype=np.float32),
+        )
+
+
 # Lazy singleton — initialized on first access
 _vector_store_instance: Optional[VectorStore] = None
 
@@ -14,6 +14,7 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from backend.config.settings import settings
+from backend.learning.memory import MemoryTier, memory
 from backend.storage.database import SessionLocal, get_db
 from backend.sync.changelog import ChangeTracker, FileChangeTracker
 from backend.sync.clock import HybridLogicalClock
@@ -173,11 +174,17 @@ class SyncEngine:
         if kg_path.exists():
             self._file_tracker.check_file(kg_path, "knowledge_graph", db)
 
-        # Memory tier files
-        for tier in ["short_term", "medium_term", "long_term"]:
-            tier_path = settings.memory_dir / f"{tier}.md"
+        # Memory tier files; short-term signals are buffered in memory until
+        # flushed, so write them out first or a stale file gets hashed
+        memory.flush_short_term()
+        for tier, name in [
+            (MemoryTier.short, "short_term"),
+            (MemoryTier.medium, "medium_term"),
+            (MemoryTier.long, "long_term"),
+        ]:
+            tier_path = memory.path_for_tier(tier)
             if tier_path.exists():
-                self._file_tracker.check_file(tier_path, f"memory_{tier}", db)
+                self._file_tracker.check_file(tier_path, f"memory_{name}", db)
 
         # Audio files (if enabled)
         if settings.sync_audio_enabled:
@@ -0,0 +1,59 @@
+from backend.learning.consolidation import ConsolidationEngine
+from backend.learning.memory import MemoryEntry, MemoryStore, MemoryTier, SignalType
+
+
+def _entry(content: str, signal_type: str = "vocabulary") -> MemoryEntry:
+    return MemoryEntry(
+        timestamp="2024-01-01 10:00",
+        signal_type=signal_type,
+        content=content,
+        context="",
+        source_meeting_id="",
+    )
+
+
+def test_groups_near_duplicates_per_type(tmp_path):
+    engine = ConsolidationEngine(MemoryStore(tmp_path))
+    groups = engine._group_signals([
+        _entry("kubernetes cluster upgrade"),
+        _entry("kubernetes cluster upgrades"),
+        _entry("quarterly budget review"),
+        _entry("kubernetes cluster upgrade", signal_type="person"),
+    ])
+
+    sizes = sorted((key[0], len(entries)) for key, entries in groups.items())
+    assert sizes == [("person", 1), ("vocabulary", 1), ("vocabulary", 2)]
+
+
+def test_groups_short_near_duplicates(tmp_path):
+    engine = ConsolidationEngine(MemoryStore(tmp_path))
+    groups = engine._group_signals([
+        _entry("API"), _entry("APIs"), _entry("Sam"), _entry("Sammy"), _entry("zzz"),
+    ])
+
+    assert sorted(len(entries) for entries in groups.values()) == [1, 2, 2]
+
+
+def test_groups_sharing_a_prefix_are_kept_apart(tmp_path):
+    engine = ConsolidationEngine(MemoryStore(tmp_path))
+    prefix = "Discussed the migration plan for the billing service "
+    groups = engine._group_signals([
+        _entry(prefix + "and agreed to move the nightly invoice batch to Kafka consumers"),
+        _entry(prefix + "with finance; they want reconciliation reports emailed daily from now on"),
+    ])
+
+    assert sorted(len(entries) for entries in groups.values()) == [1, 1]
+
+
+def test_repeated_signals_are_promoted_and_consumed(tmp_path):
+    store = MemoryStore(tmp_path)
+    engine = ConsolidationEngine(store)
+    for _ in range(3):
+        store.record_signal(SignalType.vocabulary, "kubernetes cluster upgrade")
+
+    stats = engine.run()
+
+    assert stats["promoted_to_medium"] == 1
+    assert stats["signals_consumed"] == 3
+    assert not store.has_short_term_signals()
+    assert "kubernetes cluster upgrade" in store.read_tier(MemoryTier.medium)
@@ -0,0 +1,50 @@
+import json
+
+from backend.knowledge.graph import KnowledgeGraph
+from backend.models.knowledge import RelationType
+
+
+def test_entities_and_relations_survive_reload(tmp_path):
+    path = tmp_path / "graph.db"
+    graph = KnowledgeGraph(path)
+    graph.add_entity("p1", "person", "Ana")
+    graph.add_entity("j1", "project", "Atlas")
+    assert graph.add_relation("p1", "j1", RelationType.works_on, meeting_id="m1")
+    graph.flush()
+
+    reloaded = KnowledgeGraph(path)
+    assert reloaded.get_entity("p1")["label"] == "Ana"
+    assert [e["id"] for e in reloaded.get_entities_by_type("project")] == ["j1"]
+    assert [n["id"] for n in reloaded.get_neighbors("p1")] == ["j1"]
+
+
+def test_removed_entity_stays_removed(tmp_path):
+    path = tmp_path / "graph.db"
+    graph = KnowledgeGraph(path)
+    graph.add_entity("p1", "person", "Ana")
+    graph.flush()
+    graph.remove_entity("p1")
+    graph.flush()
+
+    assert KnowledgeGraph(path).get_entity("p1") is None
+
+
+def test_legacy_json_is_imported_once(tmp_path):
+    legacy = tmp_path / "graph.json"
+    legacy.write_text(json.dumps({
+        "directed": True,
+        "multigraph": True,
+        "graph": {},
+        "nodes": [{"id": "p1", "entity_type": "person", "label": "Ana"}],
+        "edges": [],
+    }))
+
+    graph = KnowledgeGraph(tmp_path / "graph.db")
+    assert graph.get_entity("p1")["label"] == "Ana"
+    assert not legacy.exists()
+    assert (tmp_path / "graph.json.migrated").exists()
+
+    # Emptying the graph must not bring the legacy contents back
+    graph.remove_entity("p1")
+    graph.flush()
+    assert KnowledgeGraph(tmp_path / "graph.db").is_empty()
@@ -0,0 +1,152 @@
+import asyncio
+import importlib
+import time
+from difflib import SequenceMatcher
+
+from backend.intelligence import llm_cache
+from backend.intelligence.llm_cache import SemanticCache
+from backend.intelligence.parsing import is_valid_json
+
+
+class FakeCollection:
+    """In-memory stand-in for a Chroma collection; distance is 1 - text similarity of the key texts."""
+
+    def __init__(self):
+        self.entries = {}
+        self.documents = {}
+
+    def upsert(self, ids, documents, embeddings, metadatas):
+        for entry_id, document, meta in zip(ids, documents, metadatas):
+            self.entries[entry_id] = meta
+            self.documents[entry_id] = document
+
+    def query(self, query_texts, n_results, where, include):
+        (text,) = query_texts
+        matches = sorted(
+            (1.0 - SequenceMatcher(None, self.documents[i], text).ratio(), i, m)
+            for i, m in self.entries.items() if m["scope"] == where["scope"]
+        )[:n_results]
+        return {
+            "ids": [[i for _, i, _ in matches]],
+            "metadatas": [[m for _, _, m in matches]],
+            "distances": [[d for d, _, _ in matches]],
+        }
+
+    def delete(self, ids=None, where=None):
+        if where is not None:
+            cutoff = where["created_at"]["$lt"]
+            ids = [i for i, m in self.entries.items() if m["created_at"] < cutoff]
+        for entry_id in ids:
+            self.entries.pop(entry_id, None)
+
+
+class FakeLLM:
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def generate(self, prompt, system_prompt, cache_prefix=""):
+        self.calls += 1
+        return self.response
+
+    async def agenerate_stream(self, prompt, system_prompt, cache_prefix=""):
+        self.calls += 1
+        yield self.response
+
+
+def _cache(monkeypatch, response):
+    llm = FakeLLM(response)
+    monkeypatch.setattr(llm_cache, "llm_client", llm)
+    cache = SemanticCache()
+    cache._collection = FakeCollection()
+    return cache, llm
+
+
+TRANSCRIPT = "[00:00] Ana: Let's review the kubernetes cluster upgrade plan for next sprint. " * 3
+
+
+def _generate(cache, key_text=TRANSCRIPT, context="prompt template"):
+    return cache.generate(
+        "summary", "prompt", "system", cache_key_text=key_text,
+        context_key=context, validate=is_valid_json,
+    )
+
+
+def test_hit_skips_llm_call(monkeypatch):
+    cache, llm = _cache(monkeypatch, '{"summary": "ok"}')
+    assert _generate(cache) == _generate(cache) == '{"summary": "ok"}'
+    assert llm.calls == 1
+    # A repeated prompt upserts its entry instead of adding another
+    assert len(cache._collection.entries) == 1
+
+
+def test_near_duplicate_key_is_a_hit(monkeypatch):
+    cache, llm = _cache(monkeypatch, '{"summary": "ok"}')
+    _generate(cache)
+    assert _generate(cache, TRANSCRIPT.replace("next sprint", "next sprint!", 1)) == '{"summary": "ok"}'
+    assert llm.calls == 1
+
+
+def test_dissimilar_key_is_a_miss(monkeypatch):
+    cache, llm = _cache(monkeypatch, '{"summary": "ok"}')
+    _generate(cache)
+    _generate(cache, "[00:00] Ben: Quarterly budget review, starting with marketing spend.")
+    assert llm.calls == 2
+
+
+def test_different_context_is_a_miss(monkeypatch):
+    cache, llm = _cache(monkeypatch, '{"summary": "ok"}')
+    _generate(cache, context="prompt template A")
+    _generate(cache, context="prompt template B")
+    assert llm.calls == 2
+
+
+def test_expired_entry_is_deleted_and_refreshed(monkeypatch):
+    cache, llm = _cache(monkeypatch, '{"summary": "ok"}')
+    _generate(cache)
+    (meta,) = cache._collection.entries.values()
+    meta["created_at"] = time.time() - SemanticCache.TTL_SECONDS - 1
+
+    _generate(cache)
+
+    assert llm.calls == 2
+    (meta,) = cache._collection.entries.values()
+    assert time.time() - meta["created_at"] < 60
+
+
+def test_store_purges_expired_entries_of_other_scopes(monkeypatch):
+    cache, llm = _cache(monkeypatch, '{"summary": "ok"}')
+    _generate(cache, context="old prompt template")
+    (meta,) = cache._collection.entries.values()
+    meta["created_at"] = time.time() - SemanticCache.TTL_SECONDS - 1
+    cache._last_purge = 0.0  # The first store already swept
+
+    _generate(cache, context="new prompt template")
+
+    (fresh,) = cache._collection.entries.values()
+    assert fresh["scope"] != meta["scope"]
+
+
+def test_invalid_response_is_not_cached(monkeypatch):
+    cache, llm = _cache(monkeypatch, "not json")
+    assert _generate(cache) == "not json"
+    assert not cache._collection.entries
+    _generate(cache)
+    assert llm.calls == 2
+
+
+def test_extraction_misses_when_transcript_differs_past_the_key(monkeypatch):
+    # backend.intelligence re-exports a `pipeline` instance under the module's name
+    pipeline = importlib.import_module("backend.intelligence.pipeline")
+    cache, llm = _cache(monkeypatch, '{"action_items": []}')
+    monkeypatch.setattr(pipeline, "semantic_cache", cache)
+
+    def extract(transcript):
+        return asyncio.run(pipeline._astream_array("action_items", ("prompt ", ""), transcript))
+
+    opening = "[00:00] Ana: Roll call, Ben, Cleo, Dev. " * 100
+    extract(opening + "[10:00] Ben: I'll send the notes.")
+    extract(opening + "[10:00] Ben: I'll send the notes.")
+    assert llm.calls == 1
+    extract(opening + "[10:00] Cleo: I'll book the room.")
+    assert llm.calls == 2
@@ -0,0 +1,67 @@
+import threading
+
+from backend.learning.memory import MemoryStore, MemoryTier, SignalType, SHORT_TERM_HEADER
+
+
+def test_buffered_signals_are_visible_to_readers(tmp_path):
+    store = MemoryStore(tmp_path)
+    store.record_signal(SignalType.vocabulary, "kubernetes")
+    store.record_signals([
+        (SignalType.person, "Ana", ""),
+        (SignalType.person, "Ben", "", "meeting2"),
+    ], source_meeting_id="meeting1")
+
+    entries = store.read_short_term_entries()
+    assert [e.content for e in entries] == ["kubernetes", "Ana", "Ben"]
+    assert [e.source_meeting_id for e in entries] == ["", "meeting1", "meeting2"]
+    assert store.short_term_count() == 3
+
+
+def test_clear_short_term_keeps_signals_after_offset(tmp_path):
+    store = MemoryStore(tmp_path)
+    store.record_signal(SignalType.vocabulary, "consumed")
+    consumed_upto = store.short_term_size()
+    store.record_signal(SignalType.vocabulary, "kept")
+
+    store.clear_short_term(upto=consumed_upto)
+    # Written through a reopened descriptor, into the replaced file
+    store.record_signal(SignalType.vocabulary, "after clear")
+
+    assert [e.content for e in store.read_short_term_entries()] == ["kept", "after clear"]
+
+
+def test_update_tier_replaces_short_term(tmp_path):
+    store = MemoryStore(tmp_path)
+    store.record_signal(SignalType.vocabulary, "old")
+    store.update_tier(MemoryTier.short, SHORT_TERM_HEADER)
+    store.record_signal(SignalType.vocabulary, "new")
+
+    assert [e.content for e in store.read_short_term_entries()] == ["new"]
+
+
+def test_concurrent_appends_are_not_lost(tmp_path):
+    store = MemoryStore(tmp_path)
+    store.SHORT_BUFFER_BYTES = 256  # Flush often
+
+    def record(n):
+        for i in range(200):
+            store.record_signal(SignalType.vocabulary, f"term-{n}-{i}")
+
+    threads = [threading.Thread(target=record, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    store.close()
+
+    assert store.short_term_count() == 800
+
+
+def test_flush_short_term_writes_buffered_signals_to_the_file(tmp_path):
+    store = MemoryStore(tmp_path)
+    store.record_signal(SignalType.vocabulary, "kubernetes")
+    assert "kubernetes" not in store.path_for_tier(MemoryTier.short).read_text()
+
+    store.flush_short_term()
+
+    assert "kubernetes" in store.path_for_tier(MemoryTier.short).read_text()
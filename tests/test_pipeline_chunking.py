@@ -0,0 +1,50 @@
+import importlib
+
+from backend.intelligence.pipeline import _chunk_transcript, _merge_chunk_results
+
+# backend.intelligence re-exports a `pipeline` instance under the module's name
+pipeline = importlib.import_module("backend.intelligence.pipeline")
+
+
+def test_short_transcript_is_one_chunk():
+    assert _chunk_transcript("a\nb") == ["a\nb"]
+
+
+def test_chunks_cover_transcript_with_overlap(monkeypatch):
+    monkeypatch.setattr(pipeline, "MAX_TRANSCRIPT_CHARS", 100)
+    monkeypatch.setattr(pipeline, "CHUNK_WINDOW_CHARS", 100)
+    monkeypatch.setattr(pipeline, "CHUNK_STRIDE_CHARS", 75)
+    lines = [f"[{i:03d}] line" for i in range(60)]
+
+    chunks = _chunk_transcript("\n".join(lines))
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    # Whole lines only, every line covered, consecutive chunks overlap
+    chunk_lines = [chunk.split("\n") for chunk in chunks]
+    assert set(lines) == {line for part in chunk_lines for line in part}
+    for previous, current in zip(chunk_lines, chunk_lines[1:]):
+        assert set(previous) & set(current)
+
+
+def test_merge_drops_duplicates_from_overlapping_chunks():
+    merged = _merge_chunk_results("action_items", [
+        {"action_items": [{"owner": "Ana", "description": "Send notes"}]},
+        {"action_items": [
+            {"owner": "Ana", "description": "Send notes"},
+            {"owner": "Ben", "description": "Book room"},
+        ]},
+    ])
+    assert merged == {"action_items": [
+        {"owner": "Ana", "description": "Send notes"},
+        {"owner": "Ben", "description": "Book room"},
+    ]}
+
+
+def test_merge_orders_topics_by_time():
+    merged = _merge_chunk_results("topics", [
+        {"topics": [{"title": "Budget", "start_time": 50.0, "related_topic_indices": [1]}]},
+        {"topics": [{"title": "budget", "start_time": 60.0}, {"title": "Intro", "start_time": 0.0}]},
+    ])
+    assert [t["title"] for t in merged["topics"]] == ["Intro", "Budget"]
+    assert "related_topic_indices" not in merged["topics"][1]
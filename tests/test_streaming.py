@@ -0,0 +1,22 @@
+from backend.intelligence.streaming import StreamingJSONParser
+
+
+def test_malformed_item_is_skipped():
+    response = (
+        '{"action_items": ['
+        '{"description": "first"}, '
+        '{"description": "broken" "owner": "x"}, '
+        '{"description": "third"}'
+        ']}'
+    )
+    parser = StreamingJSONParser()
+    items = []
+    # Fed in small deltas, as a streamed response arrives
+    for i in range(0, len(response), 7):
+        items.extend(parser.feed(response[i:i + 7]))
+
+    assert items == [
+        ("action_items", {"description": "first"}),
+        ("action_items", {"description": "third"}),
+    ]
+    assert parser.text == response